@@ -12,6 +12,7 @@ class IndexerConfig:
     # Crawling limits
     MAX_PAGES_PER_SITE = 50  # Maximum pages to index per website
     MAX_CONTENT_LENGTH = 5000  # Maximum characters of content to index per page
+    CONTENT_PREVIEW_LENGTH = 800  # Characters of content stored for search excerpts
 
     # Retry configuration
     MAX_RETRIES = 3  # Maximum number of retry attempts for failed requests
@@ -234,13 +234,21 @@ class ResourceIndexer:
             # Scrape the website
             scraped_data = self.scrape_page_content(website_url)
 
+            # Store a short preview so search results can show an excerpt
+            # without fetching the full page content for every hit
+            content = scraped_data['content']
+            content_preview = content[: IndexerConfig.CONTENT_PREVIEW_LENGTH]
+            if len(content) > IndexerConfig.CONTENT_PREVIEW_LENGTH:
+                content_preview += "..."
+
             # Build document for OpenSearch
             document = {
                 'resource_id': card_id,
                 'title': scraped_data['page_title'] or name,
                 'description': card.get('description', ''),
                 'page_description': scraped_data['page_description'],
-                'content': scraped_data['content'],
+                'content': content,
+                'content_preview': content_preview,
                 'url': website_url,
                 'page_url': website_url,
                 'category': '', # Cards don't have categories in the new schema
@@ -289,6 +297,7 @@ class ResourceIndexer:
                     'description': {'type': 'text'},
                     'page_description': {'type': 'text'},
                     'content': {'type': 'text'},
+                    'content_preview': {'type': 'text', 'index': False},
                     'url': {'type': 'keyword'},
                     'page_url': {'type': 'keyword'},
                     'category': {'type': 'keyword'},
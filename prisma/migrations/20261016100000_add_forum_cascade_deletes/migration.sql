@@ -0,0 +1,32 @@
+-- Let the database cascade forum and help wanted deletes so admin actions
+-- can remove a whole subtree with a single DELETE statement.
+
+-- forum_threads -> forum_categories
+ALTER TABLE "forum_threads" DROP CONSTRAINT "forum_threads_category_id_fkey";
+ALTER TABLE "forum_threads" ADD CONSTRAINT "forum_threads_category_id_fkey" FOREIGN KEY ("category_id") REFERENCES "forum_categories"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+-- forum_category_requests -> forum_categories (keep request history)
+ALTER TABLE "forum_category_requests" DROP CONSTRAINT "forum_category_requests_category_id_fkey";
+ALTER TABLE "forum_category_requests" ADD CONSTRAINT "forum_category_requests_category_id_fkey" FOREIGN KEY ("category_id") REFERENCES "forum_categories"("id") ON DELETE SET NULL ON UPDATE NO ACTION;
+
+-- forum_posts -> forum_threads
+ALTER TABLE "forum_posts" DROP CONSTRAINT "forum_posts_thread_id_fkey";
+ALTER TABLE "forum_posts" ADD CONSTRAINT "forum_posts_thread_id_fkey" FOREIGN KEY ("thread_id") REFERENCES "forum_threads"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+-- forum_reports -> forum_threads / forum_posts
+ALTER TABLE "forum_reports" DROP CONSTRAINT "forum_reports_thread_id_fkey";
+ALTER TABLE "forum_reports" ADD CONSTRAINT "forum_reports_thread_id_fkey" FOREIGN KEY ("thread_id") REFERENCES "forum_threads"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+ALTER TABLE "forum_reports" DROP CONSTRAINT "forum_reports_post_id_fkey";
+ALTER TABLE "forum_reports" ADD CONSTRAINT "forum_reports_post_id_fkey" FOREIGN KEY ("post_id") REFERENCES "forum_posts"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+-- help_wanted_comments -> help_wanted_posts / parent comment
+ALTER TABLE "help_wanted_comments" DROP CONSTRAINT "help_wanted_comments_post_id_fkey";
+ALTER TABLE "help_wanted_comments" ADD CONSTRAINT "help_wanted_comments_post_id_fkey" FOREIGN KEY ("post_id") REFERENCES "help_wanted_posts"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+ALTER TABLE "help_wanted_comments" DROP CONSTRAINT "help_wanted_comments_parent_id_fkey";
+ALTER TABLE "help_wanted_comments" ADD CONSTRAINT "help_wanted_comments_parent_id_fkey" FOREIGN KEY ("parent_id") REFERENCES "help_wanted_comments"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
+
+-- help_wanted_reports -> help_wanted_posts
+ALTER TABLE "help_wanted_reports" DROP CONSTRAINT "help_wanted_reports_post_id_fkey";
+ALTER TABLE "help_wanted_reports" ADD CONSTRAINT "help_wanted_reports_post_id_fkey" FOREIGN KEY ("post_id") REFERENCES "help_wanted_posts"("id") ON DELETE CASCADE ON UPDATE NO ACTION;
@@ -0,0 +1,21 @@
+-- Composite indexes for list endpoints that filter by status (or reported)
+-- and order by created_date DESC, so the sort is served by an index scan
+-- instead of a separate sort step.
+
+-- Admin card submission and modification queues
+CREATE INDEX IF NOT EXISTS "ix_card_submissions_status_created_date" ON "card_submissions"("status", "created_date" DESC);
+CREATE INDEX IF NOT EXISTS "ix_card_modifications_status_created_date" ON "card_modifications"("status", "created_date" DESC);
+
+-- Admin review moderation listing
+CREATE INDEX IF NOT EXISTS "ix_reviews_reported_created_date" ON "reviews"("reported", "created_date" DESC);
+
+-- Admin forum category request listing
+CREATE INDEX IF NOT EXISTS "ix_forum_category_requests_status_created_date" ON "forum_category_requests"("status", "created_date" DESC);
+
+-- Latest pending report per reported thread/post
+CREATE INDEX IF NOT EXISTS "ix_forum_reports_thread_status_created_date" ON "forum_reports"("thread_id", "status", "created_date" DESC);
+CREATE INDEX IF NOT EXISTS "ix_forum_reports_post_status_created_date" ON "forum_reports"("post_id", "status", "created_date" DESC);
+
+-- Help wanted board and admin report listing
+CREATE INDEX IF NOT EXISTS "ix_help_wanted_posts_status_created_date" ON "help_wanted_posts"("status", "created_date" DESC);
+CREATE INDEX IF NOT EXISTS "ix_help_wanted_reports_status_created_date" ON "help_wanted_reports"("status", "created_date" DESC);
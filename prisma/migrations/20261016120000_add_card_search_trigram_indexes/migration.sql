@@ -0,0 +1,11 @@
+-- Trigram indexes for card search
+-- Card search matches ILIKE '%term%' against name, description, address and
+-- contact_name. B-tree indexes can't serve unanchored patterns; per-column
+-- pg_trgm GIN indexes can, and Postgres combines them with a BitmapOr for
+-- the OR'd filter without any change to the query.
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+
+CREATE INDEX IF NOT EXISTS "ix_cards_name_trgm" ON "cards" USING GIN ("name" gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "ix_cards_description_trgm" ON "cards" USING GIN ("description" gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "ix_cards_address_trgm" ON "cards" USING GIN ("address" gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS "ix_cards_contact_name_trgm" ON "cards" USING GIN ("contact_name" gin_trgm_ops);
@@ -0,0 +1,3 @@
+-- Index matching the public card listing order (featured DESC, name, id),
+-- so keyset pagination with the "after" cursor reads only the next page.
+CREATE INDEX IF NOT EXISTS "ix_cards_featured_name_id" ON "cards"("featured" DESC, "name", "id");
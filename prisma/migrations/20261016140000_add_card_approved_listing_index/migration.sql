@@ -0,0 +1,6 @@
+-- The public card listing always filters on approved = true before sorting
+-- by (featured DESC, name, id). Leading the listing index with approved lets
+-- the planner seek straight to approved cards and read them in order, with
+-- no separate sort step. It supersedes the index without approved.
+DROP INDEX IF EXISTS "ix_cards_featured_name_id";
+CREATE INDEX IF NOT EXISTS "ix_cards_approved_featured_name_id" ON "cards"("approved", "featured" DESC, "name", "id");
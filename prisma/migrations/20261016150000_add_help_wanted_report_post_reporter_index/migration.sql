@@ -0,0 +1,5 @@
+-- Back the "already reported" check with an index on (post_id, reported_by)
+-- so it is a single index probe. This is deliberately not unique: deleting a
+-- user reassigns their reports to the shared "Deleted User" account, which
+-- can then legitimately hold several reports of the same post.
+CREATE INDEX IF NOT EXISTS "ix_help_wanted_reports_post_reporter" ON "help_wanted_reports"("post_id", "reported_by");
@@ -0,0 +1,3 @@
+-- Index matching the "my posts" listing order (newest first, id as the tie
+-- breaker) for one user, so each keyset page reads only its own rows.
+CREATE INDEX IF NOT EXISTS "ix_help_wanted_posts_created_by_created_date" ON "help_wanted_posts"("created_by", "created_date" DESC, "id" DESC);
@@ -0,0 +1,19 @@
+-- Let Postgres stamp created_date on insert. The routes never set it, so rows
+-- created through them were stored without a creation time.
+
+ALTER TABLE "forum_categories" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "forum_category_requests" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "forum_threads" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "forum_posts" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "forum_reports" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "help_wanted_posts" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "help_wanted_comments" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+ALTER TABLE "help_wanted_reports" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+
+-- Backfill from updated_date, which Prisma stamps on insert as well; it is
+-- the closest record of when those rows were created.
+UPDATE "forum_categories" SET "created_date" = "updated_date" WHERE "created_date" IS NULL;
+UPDATE "forum_threads" SET "created_date" = "updated_date" WHERE "created_date" IS NULL;
+UPDATE "forum_posts" SET "created_date" = "updated_date" WHERE "created_date" IS NULL;
+UPDATE "help_wanted_posts" SET "created_date" = "updated_date" WHERE "created_date" IS NULL;
+UPDATE "help_wanted_comments" SET "created_date" = "updated_date" WHERE "created_date" IS NULL;
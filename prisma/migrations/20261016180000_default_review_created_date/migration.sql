@@ -0,0 +1,7 @@
+-- Reviews are listed newest first and paged by (created_date, id), which
+-- needs every row to carry a creation time. Stamp it on insert and backfill
+-- rows created without one from updated_date, which Prisma also sets on
+-- insert.
+ALTER TABLE "reviews" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP;
+
+UPDATE "reviews" SET "created_date" = "updated_date" WHERE "created_date" IS NULL;
@@ -0,0 +1,5 @@
+-- Back the one-review-per-user check with an index on (card_id, user_id) so
+-- it is a single index probe. This is deliberately not unique: deleting a
+-- user reassigns their reviews to the shared "Deleted User" account, which
+-- can then legitimately hold several reviews of the same card.
+CREATE INDEX IF NOT EXISTS "ix_reviews_card_user" ON "reviews"("card_id", "user_id");
@@ -0,0 +1,6 @@
+-- Covering index for the public review queries of one card: the listing
+-- (visible reviews newest first, id as the tie breaker) and the rating
+-- GROUP BY. INCLUDE (rating) lets the rating stats run as an index-only
+-- scan; Prisma cannot express INCLUDE, so schema.prisma lists only the key
+-- columns.
+CREATE INDEX IF NOT EXISTS "ix_reviews_card_hidden_created_id" ON "reviews"("card_id", "hidden", "created_date" DESC, "id" DESC) INCLUDE ("rating");
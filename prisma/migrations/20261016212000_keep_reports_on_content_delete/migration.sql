@@ -0,0 +1,18 @@
+-- Reports are moderation history. Cascading a thread or post delete into
+-- its reports erased the very report a moderator had just resolved, so keep
+-- report rows and clear the reference to the deleted content instead.
+
+-- forum_reports -> forum_threads / forum_posts
+ALTER TABLE "forum_reports" ALTER COLUMN "thread_id" DROP NOT NULL;
+
+ALTER TABLE "forum_reports" DROP CONSTRAINT "forum_reports_thread_id_fkey";
+ALTER TABLE "forum_reports" ADD CONSTRAINT "forum_reports_thread_id_fkey" FOREIGN KEY ("thread_id") REFERENCES "forum_threads"("id") ON DELETE SET NULL ON UPDATE NO ACTION;
+
+ALTER TABLE "forum_reports" DROP CONSTRAINT "forum_reports_post_id_fkey";
+ALTER TABLE "forum_reports" ADD CONSTRAINT "forum_reports_post_id_fkey" FOREIGN KEY ("post_id") REFERENCES "forum_posts"("id") ON DELETE SET NULL ON UPDATE NO ACTION;
+
+-- help_wanted_reports -> help_wanted_posts
+ALTER TABLE "help_wanted_reports" ALTER COLUMN "post_id" DROP NOT NULL;
+
+ALTER TABLE "help_wanted_reports" DROP CONSTRAINT "help_wanted_reports_post_id_fkey";
+ALTER TABLE "help_wanted_reports" ADD CONSTRAINT "help_wanted_reports_post_id_fkey" FOREIGN KEY ("post_id") REFERENCES "help_wanted_posts"("id") ON DELETE SET NULL ON UPDATE NO ACTION;
@@ -0,0 +1,8 @@
+-- Reviews were visible when hidden was false or NULL. Filtering on both
+-- values spans two ranges of ix_reviews_card_hidden_created_id, so Postgres
+-- still sorted the listing. Store visibility as a plain NOT NULL flag and
+-- let the public queries filter on hidden = false.
+UPDATE "reviews" SET "hidden" = false WHERE "hidden" IS NULL;
+
+ALTER TABLE "reviews" ALTER COLUMN "hidden" SET DEFAULT false;
+ALTER TABLE "reviews" ALTER COLUMN "hidden" SET NOT NULL;
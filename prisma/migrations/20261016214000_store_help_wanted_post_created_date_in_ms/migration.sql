@@ -0,0 +1,7 @@
+-- "My posts" pages by (created_date, id) and hands the last post's
+-- created_date back to the client as a cursor. JavaScript dates only carry
+-- milliseconds, so a microsecond default would round the cursor and skip
+-- posts created earlier in the same millisecond. Store milliseconds, which
+-- round-trip exactly.
+ALTER TABLE "help_wanted_posts" ALTER COLUMN "created_date" TYPE TIMESTAMP(3);
+ALTER TABLE "help_wanted_posts" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP(3);
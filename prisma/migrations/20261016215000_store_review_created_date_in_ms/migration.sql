@@ -0,0 +1,6 @@
+-- The card review cursor carries created_date as a JavaScript Date, which
+-- drops the microseconds CURRENT_TIMESTAMP stamps on insert. Two reviews in
+-- the same millisecond then compared unequal to the cursor and one was
+-- skipped. Keep the column at millisecond precision so cursors are exact.
+ALTER TABLE "reviews" ALTER COLUMN "created_date" TYPE TIMESTAMP(3);
+ALTER TABLE "reviews" ALTER COLUMN "created_date" SET DEFAULT CURRENT_TIMESTAMP(3);
@@ -85,7 +85,7 @@ async function getPendingApprovals() {
     prisma.review.findMany({
       where: {
         reported: true,
-        hidden: null, // Not yet acted upon
+        hidden: false, // Not yet acted upon; dismissing clears "reported"
       },
       include: {
         user: { select: { firstName: true, lastName: true } },
@@ -135,6 +135,14 @@ http {
             proxy_buffering off;
         }
 
+        # Uploaded files, reached only through X-Accel-Redirect from
+        # /api/uploads so nginx streams them with sendfile
+        location ^~ /internal-uploads/ {
+            internal;
+            alias /app/uploads/;
+            add_header 'X-Content-Type-Options' 'nosniff' always;
+        }
+
         # Health check endpoint
         location /nginx-health {
             access_log off;
@@ -24,6 +24,7 @@ export default function DataManagementPage() {
   const [models, setModels] = useState<ModelInfo[]>([]);
   const [selectedModels, setSelectedModels] = useState<string[]>([]);
   const [selectAll, setSelectAll] = useState(true);
+  const [exportFormat, setExportFormat] = useState<"json" | "jsonl">("json");
   const [exporting, setExporting] = useState(false);
   const [importing, setImporting] = useState(false);
   const [importFile, setImportFile] = useState<File | null>(null);
@@ -89,7 +90,9 @@ export default function DataManagementPage() {
     setSuccess("");
 
     try {
-      const requestBody = selectAll ? {} : { include: selectedModels };
+      const requestBody = selectAll
+        ? { format: exportFormat }
+        : { include: selectedModels, format: exportFormat };
       const apiBaseUrl = process.env["NEXT_PUBLIC_API_URL"] || "";
 
       // Get CSRF token for the request
@@ -128,7 +131,7 @@ export default function DataManagementPage() {
       a.href = url;
       a.download =
         response.headers.get("content-disposition")?.split("filename=")[1] ||
-        `export_${new Date().toISOString()}.json`;
+        `export_${new Date().toISOString()}.${exportFormat}`;
       document.body.appendChild(a);
       a.click();
       window.URL.revokeObjectURL(url);
@@ -318,6 +321,22 @@ export default function DataManagementPage() {
                 </div>
               )}
 
+              <div>
+                <label className="block text-sm font-medium text-gray-700 dark:text-gray-300 mb-2">
+                  Format
+                </label>
+                <select
+                  value={exportFormat}
+                  onChange={(e) =>
+                    setExportFormat(e.target.value as "json" | "jsonl")
+                  }
+                  className="block w-full px-3 py-2 border border-gray-300 dark:border-gray-600 rounded-md shadow-sm bg-white dark:bg-gray-700 text-gray-900 dark:text-white"
+                >
+                  <option value="json">JSON (single document)</option>
+                  <option value="jsonl">JSON Lines (one record per line)</option>
+                </select>
+              </div>
+
               <button
                 onClick={handleExport}
                 disabled={
@@ -352,7 +371,7 @@ export default function DataManagementPage() {
                 </label>
                 <input
                   type="file"
-                  accept=".json"
+                  accept=".json,.jsonl,.gz"
                   onChange={(e) => setImportFile(e.target.files?.[0] || null)}
                   className="block w-full text-sm text-gray-500 dark:text-gray-400 file:mr-4 file:py-2 file:px-4 file:rounded file:border-0 file:text-sm file:font-medium file:bg-blue-50 file:text-blue-700 hover:file:bg-blue-100"
                 />
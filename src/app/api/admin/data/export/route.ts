@@ -4,9 +4,130 @@ import { withCsrfProtection } from "@/lib/auth/csrf";
 import { prisma } from "@/lib/db/client";
 import { logger } from "@/lib/logger";
 
+// Rows fetched per query. Tables are read in primary-key order, a batch at
+// a time, so no single query loads a whole table and its included relations.
+const EXPORT_BATCH_SIZE = 1000;
+
+type ExportRow = Record<string, unknown>;
+type ExportQuery = (take: number, last?: ExportRow) => Promise<ExportRow[]>;
+
+/**
+ * Keyset filter and ordering for tables with an integer id: rows after the
+ * last one of the previous batch.
+ */
+function afterId(last?: ExportRow) {
+  return {
+    where: { id: { gt: last ? (last["id"] as number) : 0 } },
+    orderBy: { id: "asc" as const },
+  };
+}
+
+/**
+ * Yield every row a query returns, batch by batch. The next batch is
+ * requested before the current one is handed on, so the database read
+ * overlaps serializing and sending the previous batch.
+ */
+async function* readInBatches(
+  query: ExportQuery
+): AsyncGenerator<ExportRow[]> {
+  const readAhead = (last?: ExportRow) => {
+    const batch = query(EXPORT_BATCH_SIZE, last);
+    // The generator may sit suspended at a yield while this read fails, so
+    // mark the rejection as handled now. Awaiting the batch still throws.
+    batch.catch(() => undefined);
+    return batch;
+  };
+
+  let next: Promise<ExportRow[]> | null = readAhead();
+  while (next) {
+    const batch: ExportRow[] = await next;
+    next =
+      batch.length === EXPORT_BATCH_SIZE
+        ? readAhead(batch[batch.length - 1])
+        : null;
+    if (batch.length > 0) {
+      yield batch;
+    }
+  }
+}
+
+/**
+ * Produce the export document piece by piece as each batch is read. The
+ * output matches JSON.stringify(data) of the full export object, or
+ * JSON.stringify(data, null, 2) when pretty is set.
+ */
+async function* exportJsonChunks(
+  models: Array<[name: string, query: ExportQuery]>,
+  pretty: boolean
+): AsyncGenerator<string> {
+  const [modelIndent, rowIndent, colon] = pretty
+    ? ["\n  ", "\n    ", ": "]
+    : ["", "", ":"];
+  const stringifyRow = (row: ExportRow) =>
+    pretty
+      ? JSON.stringify(row, null, 2).replace(/\n/g, rowIndent)
+      : JSON.stringify(row);
+
+  yield "{";
+
+  for (const [index, [modelName, query]] of models.entries()) {
+    const key = JSON.stringify(modelName);
+    yield `${index > 0 ? "," : ""}${modelIndent}${key}${colon}[`;
+
+    let count = 0;
+    for await (const batch of readInBatches(query)) {
+      yield batch
+        .map(
+          (row, i) =>
+            `${count + i > 0 ? "," : ""}${rowIndent}${stringifyRow(row)}`
+        )
+        .join("");
+      count += batch.length;
+    }
+
+    yield count > 0 ? `${modelIndent}]` : "]";
+    logger.info(`Exported ${modelName}: ${count} records`);
+  }
+
+  yield pretty && models.length > 0 ? "\n}" : "}";
+}
+
+/**
+ * Produce the export as JSON Lines: a metadata line, then one line per row.
+ * Unlike the single JSON document, this can be parsed a line at a time.
+ */
+async function* exportJsonLinesChunks(
+  models: Array<[name: string, query: ExportQuery]>,
+  exportedAt: Date
+): AsyncGenerator<string> {
+  yield JSON.stringify({
+    type: "metadata",
+    exported_at: exportedAt.toISOString(),
+    models: models.map(([modelName]) => modelName),
+  }) + "\n";
+
+  for (const [modelName, query] of models) {
+    let count = 0;
+    for await (const batch of readInBatches(query)) {
+      yield batch
+        .map(
+          (row) =>
+            JSON.stringify({ type: "row", model: modelName, data: row }) +
+            "\n"
+        )
+        .join("");
+      count += batch.length;
+    }
+    logger.info(`Exported ${modelName}: ${count} records`);
+  }
+}
+
 /**
  * POST /api/admin/data/export - Export selected models to JSON (admin only)
- * Request body: { include?: string[] } - If omitted, exports all models
+ * Request body: { include?: string[], format?: "json" | "jsonl", pretty?: boolean }
+ * - include: if omitted, exports all models
+ * - format: "json" (default) for one document, "jsonl" for JSON Lines
+ * - pretty: indent the "json" document (compact by default)
  */
 export const POST = withCsrfProtection(
   withAuth(
@@ -14,10 +135,23 @@ export const POST = withCsrfProtection(
       try {
         const body = await request.json();
         const includeModels = body.include as string[] | undefined;
+        const format = (body.format as string | undefined) ?? "json";
+
+        if (format !== "json" && format !== "jsonl") {
+          return NextResponse.json(
+            {
+              error: {
+                message: 'Invalid format. Must be "json" or "jsonl"',
+                code: 400,
+              },
+            },
+            { status: 400 }
+          );
+        }
 
         // Define all available models and their corresponding Prisma queries
         const modelQueries = {
-          User: () =>
+          User: (take, last) =>
             prisma.user.findMany({
               select: {
                 // Basic user information (safe to export)
@@ -54,9 +188,16 @@ export const POST = withCsrfProtection(
                   },
                 },
               },
+              ...afterId(last),
+              take,
             }),
-          Tag: () => prisma.tag.findMany({ include: { card_tags: true } }),
-          Card: () =>
+          Tag: (take, last) =>
+            prisma.tag.findMany({
+              include: { card_tags: true },
+              ...afterId(last),
+              take,
+            }),
+          Card: (take, last) =>
             prisma.card.findMany({
               include: {
                 modifications: true,
@@ -66,36 +207,56 @@ export const POST = withCsrfProtection(
                 creator: true,
                 reviews: true,
               },
+              ...afterId(last),
+              take,
             }),
-          CardSubmission: () =>
+          CardSubmission: (take, last) =>
             prisma.cardSubmission.findMany({
               include: { card: true, reviewer: true, submitter: true },
+              ...afterId(last),
+              take,
             }),
-          CardModification: () =>
+          CardModification: (take, last) =>
             prisma.cardModification.findMany({
               include: { card: true, reviewer: true, submitter: true },
+              ...afterId(last),
+              take,
             }),
-          ResourceCategory: () =>
+          ResourceCategory: (take, last) =>
             prisma.resourceCategory.findMany({
               include: { resourceItems: true },
+              ...afterId(last),
+              take,
+            }),
+          QuickAccessItem: (take, last) =>
+            prisma.quickAccessItem.findMany({ ...afterId(last), take }),
+          ResourceItem: (take, last) =>
+            prisma.resourceItem.findMany({
+              include: { categoryObj: true },
+              ...afterId(last),
+              take,
             }),
-          QuickAccessItem: () => prisma.quickAccessItem.findMany(),
-          ResourceItem: () =>
-            prisma.resourceItem.findMany({ include: { categoryObj: true } }),
-          ResourceConfig: () => prisma.resourceConfig.findMany(),
-          Review: () =>
+          ResourceConfig: (take, last) =>
+            prisma.resourceConfig.findMany({ ...afterId(last), take }),
+          Review: (take, last) =>
             prisma.review.findMany({
               include: { card: true, reporter: true, user: true },
+              ...afterId(last),
+              take,
             }),
-          ForumCategory: () =>
+          ForumCategory: (take, last) =>
             prisma.forumCategory.findMany({
               include: { creator: true, categoryRequests: true, threads: true },
+              ...afterId(last),
+              take,
             }),
-          ForumCategoryRequest: () =>
+          ForumCategoryRequest: (take, last) =>
             prisma.forumCategoryRequest.findMany({
               include: { category: true, requester: true, reviewer: true },
+              ...afterId(last),
+              take,
             }),
-          ForumThread: () =>
+          ForumThread: (take, last) =>
             prisma.forumThread.findMany({
               include: {
                 posts: true,
@@ -103,8 +264,10 @@ export const POST = withCsrfProtection(
                 category: true,
                 creator: true,
               },
+              ...afterId(last),
+              take,
             }),
-          ForumPost: () =>
+          ForumPost: (take, last) =>
             prisma.forumPost.findMany({
               include: {
                 creator: true,
@@ -112,8 +275,10 @@ export const POST = withCsrfProtection(
                 thread: true,
                 reports: true,
               },
+              ...afterId(last),
+              take,
             }),
-          ForumReport: () =>
+          ForumReport: (take, last) =>
             prisma.forumReport.findMany({
               include: {
                 post: true,
@@ -121,12 +286,16 @@ export const POST = withCsrfProtection(
                 reviewer: true,
                 thread: true,
               },
+              ...afterId(last),
+              take,
             }),
-          HelpWantedPost: () =>
+          HelpWantedPost: (take, last) =>
             prisma.helpWantedPost.findMany({
               include: { comments: true, creator: true, reports: true },
+              ...afterId(last),
+              take,
             }),
-          HelpWantedComment: () =>
+          HelpWantedComment: (take, last) =>
             prisma.helpWantedComment.findMany({
               include: {
                 creator: true,
@@ -134,8 +303,10 @@ export const POST = withCsrfProtection(
                 replies: true,
                 post: true,
               },
+              ...afterId(last),
+              take,
             }),
-          HelpWantedReport: () =>
+          HelpWantedReport: (take, last) =>
             prisma.helpWantedReport.findMany({
               select: {
                 id: true,
@@ -176,9 +347,12 @@ export const POST = withCsrfProtection(
                   },
                 },
               },
+              ...afterId(last),
+              take,
             }),
-          IndexingJob: () => prisma.indexingJob.findMany(),
-          TokenBlacklist: () =>
+          IndexingJob: (take, last) =>
+            prisma.indexingJob.findMany({ ...afterId(last), take }),
+          TokenBlacklist: (take, last) =>
             prisma.tokenBlacklist.findMany({
               select: {
                 id: true,
@@ -190,18 +364,45 @@ export const POST = withCsrfProtection(
                 // Exporting user data alongside security tokens is a security risk
                 userId: true,
               },
+              ...afterId(last),
+              take,
             }),
-          card_tags: () =>
-            prisma.card_tags.findMany({ include: { cards: true, tags: true } }),
-          alembic_version: () => prisma.alembic_version.findMany(),
-        };
+          card_tags: (take, last) =>
+            prisma.card_tags.findMany({
+              include: { cards: true, tags: true },
+              where: last
+                ? {
+                    OR: [
+                      { card_id: { gt: last["card_id"] as number } },
+                      {
+                        card_id: last["card_id"] as number,
+                        tag_id: { gt: last["tag_id"] as number },
+                      },
+                    ],
+                  }
+                : undefined,
+              orderBy: [{ card_id: "asc" }, { tag_id: "asc" }],
+              take,
+            }),
+          alembic_version: (take, last) =>
+            prisma.alembic_version.findMany({
+              where: last
+                ? { version_num: { gt: last["version_num"] as string } }
+                : undefined,
+              orderBy: { version_num: "asc" },
+              take,
+            }),
+        } satisfies Record<string, ExportQuery>;
 
-        // Determine which models to export
-        const modelsToExport = includeModels || Object.keys(modelQueries);
+        // Determine which models to export, each at most once
+        const exportableModels = new Set(Object.keys(modelQueries));
+        const modelsToExport = includeModels
+          ? [...new Set(includeModels)]
+          : [...exportableModels];
 
         // Validate requested models
         const invalidModels = modelsToExport.filter(
-          (model) => !(model in modelQueries)
+          (model) => !exportableModels.has(model)
         );
         if (invalidModels.length > 0) {
           return NextResponse.json(
@@ -215,40 +416,48 @@ export const POST = withCsrfProtection(
           );
         }
 
-        // Export data
-        const exportData: Record<string, unknown[]> = {};
-
-        for (const modelName of modelsToExport) {
-          try {
-            const queryFn =
-              modelQueries[modelName as keyof typeof modelQueries];
-            exportData[modelName] = await queryFn();
-            logger.info(
-              `Exported ${modelName}: ${exportData[modelName].length} records`
-            );
-          } catch (error) {
-            logger.error(`Error exporting ${modelName}:`, error);
-            return NextResponse.json(
-              {
-                error: {
-                  message: `Failed to export model: ${modelName}`,
-                  code: 500,
-                },
-              },
-              { status: 500 }
-            );
-          }
-        }
+        // Stream the export as each batch is read rather than building the
+        // whole document in memory first. Headers are sent before the data
+        // is read, so a failure part-way through aborts the download.
+        const exportedAt = new Date();
+        const models = modelsToExport.map(
+          (modelName): [string, ExportQuery] => [
+            modelName,
+            modelQueries[modelName as keyof typeof modelQueries],
+          ]
+        );
+        const chunks =
+          format === "jsonl"
+            ? exportJsonLinesChunks(models, exportedAt)
+            : exportJsonChunks(models, body.pretty === true);
+        const encoder = new TextEncoder();
+        const stream = new ReadableStream<Uint8Array>({
+          async pull(controller) {
+            try {
+              const { value, done } = await chunks.next();
+              if (done) {
+                controller.close();
+              } else {
+                controller.enqueue(encoder.encode(value));
+              }
+            } catch (error) {
+              logger.error("Error during data export:", error);
+              controller.error(error);
+            }
+          },
+          async cancel() {
+            await chunks.return(undefined);
+          },
+        });
 
-        // Create response with proper headers for download
-        const exportJson = JSON.stringify(exportData, null, 2);
-        const timestamp = new Date().toISOString().replace(/[:.]/g, "-");
-        const filename = `cityforge_export_${timestamp}.json`;
+        const timestamp = exportedAt.toISOString().replace(/[:.]/g, "-");
+        const filename = `cityforge_export_${timestamp}.${format}`;
 
-        return new NextResponse(exportJson, {
+        return new NextResponse(stream, {
           status: 200,
           headers: {
-            "Content-Type": "application/json",
+            "Content-Type":
+              format === "jsonl" ? "application/x-ndjson" : "application/json",
             "Content-Disposition": `attachment; filename="${filename}"`,
           },
         });
@@ -2,13 +2,107 @@ import { NextRequest, NextResponse } from "next/server";
 import { withAuth } from "@/lib/auth/middleware";
 import { withCsrfProtection } from "@/lib/auth/csrf";
 import { prisma } from "@/lib/db/client";
+import {
+  DEPENDENT_MODELS,
+  MODEL_TABLES,
+  hasSerialId,
+} from "@/lib/db/data-models";
+import { resourceQueries } from "@/lib/db/queries";
 import { Prisma } from "@prisma/client";
 import { logger } from "@/lib/logger";
 
+// Records per createMany call. Keeps each INSERT well under Postgres's bind
+// parameter limit and bounds the statement size for large exports.
+const IMPORT_BATCH_SIZE = 1000;
+
+// The whole import runs in one transaction so a failure leaves the existing
+// data untouched; allow it far longer than Prisma's 5 second default.
+const IMPORT_TRANSACTION_TIMEOUT_MS = 10 * 60 * 1000;
+
+/**
+ * Copy only the scalar fields of an exported record. Relation arrays and
+ * nested objects (everything but dates) would cause issues during import.
+ * Building a fresh object in one pass avoids spreading every record and
+ * then deleting keys from it, which matters for large exports.
+ */
+function toImportRecord(record: Record<string, unknown>) {
+  const cleanRecord: Record<string, unknown> = {};
+  for (const key in record) {
+    const value = record[key];
+    if (typeof value !== "object" || value === null || value instanceof Date) {
+      cleanRecord[key] = value;
+    }
+  }
+  return cleanRecord;
+}
+
 /**
- * POST /api/admin/data/import - Import data from uploaded JSON file (admin only)
+ * Single statement moving each table's id sequence past its highest id.
+ * Table names come from MODEL_TABLES, never from the uploaded file.
+ */
+function resetSequencesSql(tables: string[]): Prisma.Sql {
+  return Prisma.sql`SELECT ${Prisma.join(
+    tables.map(
+      (table) => Prisma.sql`setval(
+        pg_get_serial_sequence(${`"${table}"`}, 'id'),
+        COALESCE((SELECT MAX(id) FROM ${Prisma.raw(`"${table}"`)}), 0) + 1,
+        false
+      )`
+    )
+  )}`;
+}
+
+/**
+ * Byte stream of an uploaded export, decompressed on the fly if gzipped
+ */
+function openUpload(file: File, isGzip: boolean): ReadableStream<Uint8Array> {
+  return isGzip
+    ? file.stream().pipeThrough(new DecompressionStream("gzip"))
+    : file.stream();
+}
+
+/**
+ * Read a JSON Lines export into per-model record lists. The stream is
+ * decoded and parsed a line at a time, so the raw text is never held in full.
+ * Throws SyntaxError for a malformed line.
+ */
+async function parseJsonLines(
+  stream: ReadableStream<Uint8Array>
+): Promise<Record<string, unknown[]>> {
+  const importData: Record<string, unknown[]> = {};
+  const addLine = (line: string) => {
+    if (!line.trim()) return;
+    const entry = JSON.parse(line);
+    if (entry?.type !== "row") return; // metadata line
+    if (!importData[entry.model]) {
+      importData[entry.model] = [];
+    }
+    importData[entry.model]!.push(entry.data);
+  };
+
+  const reader = stream.getReader();
+  const decoder = new TextDecoder();
+  let buffered = "";
+  let done = false;
+  while (!done) {
+    const chunk = await reader.read();
+    done = chunk.done;
+    buffered += decoder.decode(chunk.value, { stream: !done });
+    const lines = buffered.split("\n");
+    buffered = lines.pop() ?? "";
+    lines.forEach(addLine);
+  }
+  addLine(buffered);
+
+  return importData;
+}
+
+/**
+ * POST /api/admin/data/import - Import data from an uploaded export (admin only)
  * Deletes ALL existing data and replaces with imported data
  * Form data: { file: File, confirm: "DELETE ALL DATA", include?: string }
+ * The file may be a .json document or a .jsonl (JSON Lines) export, either
+ * of them optionally gzip-compressed (.json.gz / .jsonl.gz).
  */
 export const POST = withCsrfProtection(
   withAuth(
@@ -44,7 +138,10 @@ export const POST = withCsrfProtection(
           );
         }
 
-        if (!file.name.endsWith(".json")) {
+        const isGzip = file.name.endsWith(".gz");
+        const baseName = file.name.replace(/\.gz$/, "");
+        const isJsonLines = baseName.endsWith(".jsonl");
+        if (!baseName.endsWith(".json") && !isJsonLines) {
           return NextResponse.json(
             {
               error: {
@@ -57,11 +154,17 @@ export const POST = withCsrfProtection(
         }
 
         // Parse uploaded file
-        const fileContent = await file.text();
         let importData: Record<string, unknown>;
 
         try {
-          importData = JSON.parse(fileContent);
+          if (isJsonLines) {
+            importData = await parseJsonLines(openUpload(file, isGzip));
+          } else {
+            const text = isGzip
+              ? await new Response(openUpload(file, isGzip)).text()
+              : await file.text();
+            importData = JSON.parse(text);
+          }
         } catch {
           return NextResponse.json(
             {
@@ -75,9 +178,11 @@ export const POST = withCsrfProtection(
         }
 
         // Parse include parameter
-        const includeModels = includeParam
-          ? includeParam.split(",").map((s) => s.trim())
-          : Object.keys(importData);
+        const includeModels = new Set(
+          includeParam
+            ? includeParam.split(",").map((s) => s.trim())
+            : Object.keys(importData)
+        );
 
         // Define import order (to handle foreign key dependencies)
         // Junction/relationship tables must come AFTER their referenced tables
@@ -106,8 +211,25 @@ export const POST = withCsrfProtection(
           "alembic_version",
         ];
 
+        // Reject models the import has no importer for, rather than
+        // skipping them while reporting their records as added
+        const invalidModels = [...includeModels].filter(
+          (model) => !importOrder.includes(model)
+        );
+        if (invalidModels.length > 0) {
+          return NextResponse.json(
+            {
+              error: {
+                message: `Invalid models: ${invalidModels.join(", ")}`,
+                code: 400,
+              },
+            },
+            { status: 400 }
+          );
+        }
+
         // Validate that all requested models exist in import data
-        const missingModels = includeModels.filter(
+        const missingModels = [...includeModels].filter(
           (model) => !(model in importData) || !Array.isArray(importData[model])
         );
         if (missingModels.length > 0) {
@@ -122,369 +244,196 @@ export const POST = withCsrfProtection(
           );
         }
 
+        // Deleting a model's existing rows also deletes or rewrites rows of
+        // its dependent models, so a partial import must replace those too
+        const missingDependents = [...includeModels].flatMap((model) =>
+          (DEPENDENT_MODELS[model] ?? [])
+            .filter((dependent) => !includeModels.has(dependent))
+            .map((dependent) => `${dependent} (required by ${model})`)
+        );
+        if (missingDependents.length > 0) {
+          return NextResponse.json(
+            {
+              error: {
+                message: `Import must also include dependent models: ${missingDependents.join(", ")}`,
+                code: 400,
+              },
+            },
+            { status: 400 }
+          );
+        }
+
         // Perform import in transaction
         const importStats: Record<string, { added: number }> = {};
 
-        await prisma.$transaction(async (tx) => {
-          // Delete existing data in reverse dependency order
-          const deleteOrder = [...importOrder].reverse();
+        await prisma.$transaction(
+          async (tx) => {
+            // Bulk delete functions for each importable model. deleteMany
+            // reports how many rows it removed, so no separate count query
+            // is needed.
+            const deleters: Record<
+              string,
+              () => Promise<{ count: number }>
+            > = {
+              User: () => tx.user.deleteMany(),
+              Tag: () => tx.tag.deleteMany(),
+              Card: () => tx.card.deleteMany(),
+              CardSubmission: () => tx.cardSubmission.deleteMany(),
+              CardModification: () => tx.cardModification.deleteMany(),
+              ResourceCategory: () => tx.resourceCategory.deleteMany(),
+              QuickAccessItem: () => tx.quickAccessItem.deleteMany(),
+              ResourceItem: () => tx.resourceItem.deleteMany(),
+              ResourceConfig: () => tx.resourceConfig.deleteMany(),
+              Review: () => tx.review.deleteMany(),
+              ForumCategory: () => tx.forumCategory.deleteMany(),
+              ForumCategoryRequest: () => tx.forumCategoryRequest.deleteMany(),
+              ForumThread: () => tx.forumThread.deleteMany(),
+              ForumPost: () => tx.forumPost.deleteMany(),
+              ForumReport: () => tx.forumReport.deleteMany(),
+              HelpWantedPost: () => tx.helpWantedPost.deleteMany(),
+              HelpWantedComment: () => tx.helpWantedComment.deleteMany(),
+              HelpWantedReport: () => tx.helpWantedReport.deleteMany(),
+              IndexingJob: () => tx.indexingJob.deleteMany(),
+              TokenBlacklist: () => tx.tokenBlacklist.deleteMany(),
+              card_tags: () => tx.card_tags.deleteMany(),
+              alembic_version: () => tx.alembic_version.deleteMany(),
+            };
 
-          for (const modelName of deleteOrder) {
-            if (includeModels.includes(modelName)) {
-              try {
-                let deleteCount = 0;
-                switch (modelName) {
-                  case "User":
-                    deleteCount = await tx.user.count();
-                    await tx.user.deleteMany();
-                    break;
-                  case "Tag":
-                    deleteCount = await tx.tag.count();
-                    await tx.tag.deleteMany();
-                    break;
-                  case "Card":
-                    deleteCount = await tx.card.count();
-                    await tx.card.deleteMany();
-                    break;
-                  case "CardSubmission":
-                    deleteCount = await tx.cardSubmission.count();
-                    await tx.cardSubmission.deleteMany();
-                    break;
-                  case "CardModification":
-                    deleteCount = await tx.cardModification.count();
-                    await tx.cardModification.deleteMany();
-                    break;
-                  case "ResourceCategory":
-                    deleteCount = await tx.resourceCategory.count();
-                    await tx.resourceCategory.deleteMany();
-                    break;
-                  case "QuickAccessItem":
-                    deleteCount = await tx.quickAccessItem.count();
-                    await tx.quickAccessItem.deleteMany();
-                    break;
-                  case "ResourceItem":
-                    deleteCount = await tx.resourceItem.count();
-                    await tx.resourceItem.deleteMany();
-                    break;
-                  case "ResourceConfig":
-                    deleteCount = await tx.resourceConfig.count();
-                    await tx.resourceConfig.deleteMany();
-                    break;
-                  case "Review":
-                    deleteCount = await tx.review.count();
-                    await tx.review.deleteMany();
-                    break;
-                  case "ForumCategory":
-                    deleteCount = await tx.forumCategory.count();
-                    await tx.forumCategory.deleteMany();
-                    break;
-                  case "ForumCategoryRequest":
-                    deleteCount = await tx.forumCategoryRequest.count();
-                    await tx.forumCategoryRequest.deleteMany();
-                    break;
-                  case "ForumThread":
-                    deleteCount = await tx.forumThread.count();
-                    await tx.forumThread.deleteMany();
-                    break;
-                  case "ForumPost":
-                    deleteCount = await tx.forumPost.count();
-                    await tx.forumPost.deleteMany();
-                    break;
-                  case "ForumReport":
-                    deleteCount = await tx.forumReport.count();
-                    await tx.forumReport.deleteMany();
-                    break;
-                  case "HelpWantedPost":
-                    deleteCount = await tx.helpWantedPost.count();
-                    await tx.helpWantedPost.deleteMany();
-                    break;
-                  case "HelpWantedComment":
-                    deleteCount = await tx.helpWantedComment.count();
-                    await tx.helpWantedComment.deleteMany();
-                    break;
-                  case "HelpWantedReport":
-                    deleteCount = await tx.helpWantedReport.count();
-                    await tx.helpWantedReport.deleteMany();
-                    break;
-                  case "IndexingJob":
-                    deleteCount = await tx.indexingJob.count();
-                    await tx.indexingJob.deleteMany();
-                    break;
-                  case "TokenBlacklist":
-                    deleteCount = await tx.tokenBlacklist.count();
-                    await tx.tokenBlacklist.deleteMany();
-                    break;
-                  case "card_tags":
-                    deleteCount = await tx.card_tags.count();
-                    await tx.card_tags.deleteMany();
-                    break;
-                  case "alembic_version":
-                    deleteCount = await tx.alembic_version.count();
-                    await tx.alembic_version.deleteMany();
-                    break;
+            // Delete existing data in reverse dependency order
+            const deleteOrder = [...importOrder].reverse();
+
+            for (const modelName of deleteOrder) {
+              const deleteAll = deleters[modelName];
+              if (includeModels.has(modelName) && deleteAll) {
+                try {
+                  const { count } = await deleteAll();
+                  logger.info(`Deleted ${count} existing ${modelName} records`);
+                } catch (error) {
+                  logger.error(`Error deleting ${modelName}:`, error);
+                  throw new Error(
+                    `Failed to delete existing ${modelName} data`
+                  );
                 }
-                logger.info(
-                  `Deleted ${deleteCount} existing ${modelName} records`
-                );
-              } catch (error) {
-                logger.error(`Error deleting ${modelName}:`, error);
-                throw new Error(`Failed to delete existing ${modelName} data`);
               }
             }
-          }
 
-          // Insert new data in dependency order
-          for (const modelName of importOrder) {
-            if (includeModels.includes(modelName) && importData[modelName]) {
-              const records = importData[modelName];
-              if (!Array.isArray(records)) continue;
+            // Bulk insert functions for each importable model
+            const importers: Record<
+              string,
+              (data: never[]) => Promise<unknown>
+            > = {
+              User: (data) => tx.user.createMany({ data }),
+              Tag: (data) => tx.tag.createMany({ data }),
+              Card: (data) => tx.card.createMany({ data }),
+              CardSubmission: (data) => tx.cardSubmission.createMany({ data }),
+              CardModification: (data) =>
+                tx.cardModification.createMany({ data }),
+              ResourceCategory: (data) =>
+                tx.resourceCategory.createMany({ data }),
+              QuickAccessItem: (data) =>
+                tx.quickAccessItem.createMany({ data }),
+              ResourceItem: (data) => tx.resourceItem.createMany({ data }),
+              ResourceConfig: (data) => tx.resourceConfig.createMany({ data }),
+              // Exports taken before reviews.hidden became NOT NULL may
+              // still carry nulls, which meant visible
+              Review: (data) =>
+                tx.review.createMany({
+                  data: data.map((review: Record<string, unknown>) => ({
+                    ...review,
+                    hidden: review["hidden"] ?? false,
+                  })) as never[],
+                }),
+              ForumCategory: (data) => tx.forumCategory.createMany({ data }),
+              ForumCategoryRequest: (data) =>
+                tx.forumCategoryRequest.createMany({ data }),
+              ForumThread: (data) => tx.forumThread.createMany({ data }),
+              ForumPost: (data) => tx.forumPost.createMany({ data }),
+              ForumReport: (data) => tx.forumReport.createMany({ data }),
+              HelpWantedPost: (data) => tx.helpWantedPost.createMany({ data }),
+              HelpWantedComment: (data) =>
+                tx.helpWantedComment.createMany({ data }),
+              HelpWantedReport: (data) =>
+                tx.helpWantedReport.createMany({ data }),
+              IndexingJob: (data) => tx.indexingJob.createMany({ data }),
+              TokenBlacklist: (data) => tx.tokenBlacklist.createMany({ data }),
+              card_tags: (data) => tx.card_tags.createMany({ data }),
+              alembic_version: (data) =>
+                tx.alembic_version.createMany({ data }),
+            };
 
-              try {
-                let addedCount = 0;
-
-                // Clean records by removing nested objects/relations for import
-                const cleanRecords = records.map(
-                  (record: Record<string, unknown>) => {
-                    const cleanRecord = { ...record };
-                    // Remove relations and computed fields that would cause issues during import
-                    Object.keys(cleanRecord).forEach((key) => {
-                      if (
-                        Array.isArray(cleanRecord[key]) &&
-                        typeof cleanRecord[key][0] === "object"
-                      ) {
-                        delete cleanRecord[key]; // Remove relation arrays
-                      }
-                      if (
-                        typeof cleanRecord[key] === "object" &&
-                        cleanRecord[key] !== null &&
-                        !(cleanRecord[key] as Date).getTime
-                      ) {
-                        delete cleanRecord[key]; // Remove relation objects (except dates)
-                      }
-                    });
-                    return cleanRecord;
+            // Insert new data in dependency order
+            for (const modelName of importOrder) {
+              if (includeModels.has(modelName) && importData[modelName]) {
+                const records = importData[modelName];
+                if (!Array.isArray(records)) continue;
+
+                try {
+                  let addedCount = 0;
+
+                  // Clean records by removing nested objects/relations for import
+                  const cleanRecords = records.map(toImportRecord);
+
+                  // Insert in fixed-size batches so a large export doesn't
+                  // become one enormous statement, and progress is visible
+                  const createMany = importers[modelName];
+                  if (!createMany) {
+                    throw new Error(`No importer for ${modelName}`);
+                  }
+                  for (
+                    let start = 0;
+                    start < cleanRecords.length;
+                    start += IMPORT_BATCH_SIZE
+                  ) {
+                    const batch = cleanRecords.slice(
+                      start,
+                      start + IMPORT_BATCH_SIZE
+                    );
+                    await createMany(batch as never[]);
+                    addedCount += batch.length;
+                    if (cleanRecords.length > IMPORT_BATCH_SIZE) {
+                      logger.info(
+                        `Imported ${addedCount}/${cleanRecords.length} ${modelName} records`
+                      );
+                    }
                   }
-                );
 
-                switch (modelName) {
-                  case "User":
-                    await tx.user.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "Tag":
-                    await tx.tag.createMany({ data: cleanRecords as never[] });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "Card":
-                    await tx.card.createMany({ data: cleanRecords as never[] });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "CardSubmission":
-                    await tx.cardSubmission.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "CardModification":
-                    await tx.cardModification.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "ResourceCategory":
-                    await tx.resourceCategory.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "QuickAccessItem":
-                    await tx.quickAccessItem.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "ResourceItem":
-                    await tx.resourceItem.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "ResourceConfig":
-                    await tx.resourceConfig.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "Review":
-                    await tx.review.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "ForumCategory":
-                    await tx.forumCategory.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "ForumCategoryRequest":
-                    await tx.forumCategoryRequest.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "ForumThread":
-                    await tx.forumThread.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "ForumPost":
-                    await tx.forumPost.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "ForumReport":
-                    await tx.forumReport.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "HelpWantedPost":
-                    await tx.helpWantedPost.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "HelpWantedComment":
-                    await tx.helpWantedComment.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "HelpWantedReport":
-                    await tx.helpWantedReport.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "IndexingJob":
-                    await tx.indexingJob.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "TokenBlacklist":
-                    await tx.tokenBlacklist.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "card_tags":
-                    await tx.card_tags.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
-                  case "alembic_version":
-                    await tx.alembic_version.createMany({
-                      data: cleanRecords as never[],
-                    });
-                    addedCount = cleanRecords.length;
-                    break;
+                  importStats[modelName] = { added: addedCount };
+                  logger.info(`Imported ${addedCount} ${modelName} records`);
+                } catch (error) {
+                  logger.error(`Error importing ${modelName}:`, error);
+                  throw new Error(
+                    `Failed to import ${modelName} data: ${(error as Error).message}`
+                  );
                 }
-
-                importStats[modelName] = { added: addedCount };
-                logger.info(`Imported ${addedCount} ${modelName} records`);
-              } catch (error) {
-                logger.error(`Error importing ${modelName}:`, error);
-                throw new Error(
-                  `Failed to import ${modelName} data: ${(error as Error).message}`
-                );
               }
             }
-          }
-        });
 
-        // Reset all sequences to prevent unique constraint violations
-        logger.info("Resetting database sequences...");
-        try {
-          const sequences = await prisma.$queryRaw<
-            Array<{ sequence_name: string }>
-          >`
-          SELECT sequence_name
-          FROM information_schema.sequences
-          WHERE sequence_schema = 'public'
-        `;
-
-          // Allowlist of valid table names from Prisma schema
-          // This prevents SQL injection by validating table names
-          const allowedTables = [
-            "User",
-            "Tag",
-            "Card",
-            "CardSubmission",
-            "CardModification",
-            "ResourceCategory",
-            "QuickAccessItem",
-            "ResourceItem",
-            "ResourceConfig",
-            "Review",
-            "ForumCategory",
-            "ForumCategoryRequest",
-            "ForumThread",
-            "ForumPost",
-            "ForumReport",
-            "HelpWantedPost",
-            "HelpWantedComment",
-            "HelpWantedReport",
-            "IndexingJob",
-            "TokenBlacklist",
-            "alembic_version",
-            "card_tags",
-            "PasswordResetToken",
-          ];
-
-          for (const seq of sequences) {
-            try {
-              // Extract table name from sequence name (assumes format: tablename_id_seq)
-              const tableName = seq.sequence_name.replace(/_id_seq$/, "");
-
-              // Security: Validate table name against allowlist to prevent SQL injection
-              if (!allowedTables.includes(tableName)) {
-                logger.warn(
-                  `Skipping unknown table: ${tableName} (not in allowlist)`
-                );
-                continue;
-              }
+            // Imported rows keep their original ids; reset the sequences so
+            // later inserts don't hit unique constraint violations
+            const serialTables = importOrder
+              .filter(
+                (modelName) =>
+                  includeModels.has(modelName) && hasSerialId(modelName)
+              )
+              .map((modelName) => MODEL_TABLES[modelName] as string);
 
-              // Security: Use Prisma.sql with Prisma.raw() for identifier to prevent SQL injection
-              // Prisma.raw() is safe for identifiers when combined with validation
-              const result = await prisma.$queryRaw<
-                Array<{ max_id: bigint | null }>
-              >`SELECT MAX(id) as max_id FROM ${Prisma.raw(tableName)}`;
-
-              if (result.length > 0 && result[0]) {
-                const maxId = Number(result[0].max_id || 0);
-                // Security: Use $executeRaw with parameterized query to prevent SQL injection
-                // The sequence name is parameterized, and maxId is a number
-                await prisma.$executeRaw`SELECT setval(${seq.sequence_name}, ${maxId}, true)`;
+            if (serialTables.length > 0) {
+              try {
+                await tx.$executeRaw(resetSequencesSql(serialTables));
                 logger.info(
-                  `Reset ${seq.sequence_name} to ${maxId} (next value: ${maxId + 1})`
+                  `Reset id sequences for ${serialTables.length} tables`
                 );
+              } catch (error) {
+                logger.error("Error resetting sequences:", error);
+                throw new Error("Failed to reset id sequences");
               }
-            } catch (error) {
-              logger.warn(
-                `Could not reset sequence ${seq.sequence_name}: ${error instanceof Error ? error.message : "Unknown error"}`
-              );
             }
-          }
-        } catch (error) {
-          logger.error("Error resetting sequences:", error);
-          // Don't fail the import if sequence reset fails, just log it
+          },
+          { timeout: IMPORT_TRANSACTION_TIMEOUT_MS }
+        );
+
+        if (includeModels.has("ResourceConfig")) {
+          resourceQueries.clearSiteConfigCache();
         }
 
         return NextResponse.json({
@@ -1,6 +1,8 @@
 import { NextResponse } from "next/server";
 import { withAuth } from "@/lib/auth/middleware";
 import { prisma } from "@/lib/db/client";
+import { MODEL_TABLES } from "@/lib/db/data-models";
+import { Prisma } from "@prisma/client";
 import { logger } from "@/lib/logger";
 
 /**
@@ -9,79 +11,26 @@ import { logger } from "@/lib/logger";
 export const GET = withAuth(
   async () => {
     try {
-      // Get record counts for all models
-      const [
-        userCount,
-        tagCount,
-        cardCount,
-        cardSubmissionCount,
-        cardModificationCount,
-        resourceCategoryCount,
-        quickAccessItemCount,
-        resourceItemCount,
-        resourceConfigCount,
-        reviewCount,
-        forumCategoryCount,
-        forumCategoryRequestCount,
-        forumThreadCount,
-        forumPostCount,
-        forumReportCount,
-        helpWantedPostCount,
-        helpWantedCommentCount,
-        helpWantedReportCount,
-        indexingJobCount,
-        tokenBlacklistCount,
-        cardTagsCount,
-        alembicVersionCount,
-      ] = await Promise.all([
-        prisma.user.count(),
-        prisma.tag.count(),
-        prisma.card.count(),
-        prisma.cardSubmission.count(),
-        prisma.cardModification.count(),
-        prisma.resourceCategory.count(),
-        prisma.quickAccessItem.count(),
-        prisma.resourceItem.count(),
-        prisma.resourceConfig.count(),
-        prisma.review.count(),
-        prisma.forumCategory.count(),
-        prisma.forumCategoryRequest.count(),
-        prisma.forumThread.count(),
-        prisma.forumPost.count(),
-        prisma.forumReport.count(),
-        prisma.helpWantedPost.count(),
-        prisma.helpWantedComment.count(),
-        prisma.helpWantedReport.count(),
-        prisma.indexingJob.count(),
-        prisma.tokenBlacklist.count(),
-        prisma.card_tags.count(),
-        prisma.alembic_version.count(),
-      ]);
+      // Count every table in a single UNION ALL query rather than one
+      // round-trip per model
+      const countQuery = Prisma.join(
+        Object.entries(MODEL_TABLES).map(
+          ([name, table]) =>
+            Prisma.sql`SELECT ${name}::text AS name, COUNT(*)::int AS count
+              FROM ${Prisma.raw(`"${table}"`)}`
+        ),
+        " UNION ALL "
+      );
+      const counts =
+        await prisma.$queryRaw<Array<{ name: string; count: number }>>(
+          countQuery
+        );
 
-      const models = [
-        { name: "User", count: userCount },
-        { name: "Tag", count: tagCount },
-        { name: "Card", count: cardCount },
-        { name: "CardSubmission", count: cardSubmissionCount },
-        { name: "CardModification", count: cardModificationCount },
-        { name: "ResourceCategory", count: resourceCategoryCount },
-        { name: "QuickAccessItem", count: quickAccessItemCount },
-        { name: "ResourceItem", count: resourceItemCount },
-        { name: "ResourceConfig", count: resourceConfigCount },
-        { name: "Review", count: reviewCount },
-        { name: "ForumCategory", count: forumCategoryCount },
-        { name: "ForumCategoryRequest", count: forumCategoryRequestCount },
-        { name: "ForumThread", count: forumThreadCount },
-        { name: "ForumPost", count: forumPostCount },
-        { name: "ForumReport", count: forumReportCount },
-        { name: "HelpWantedPost", count: helpWantedPostCount },
-        { name: "HelpWantedComment", count: helpWantedCommentCount },
-        { name: "HelpWantedReport", count: helpWantedReportCount },
-        { name: "IndexingJob", count: indexingJobCount },
-        { name: "TokenBlacklist", count: tokenBlacklistCount },
-        { name: "card_tags", count: cardTagsCount },
-        { name: "alembic_version", count: alembicVersionCount },
-      ];
+      const countByName = new Map(counts.map((row) => [row.name, row.count]));
+      const models = Object.keys(MODEL_TABLES).map((name) => ({
+        name,
+        count: countByName.get(name) ?? 0,
+      }));
 
       return NextResponse.json({ models });
     } catch (error) {
@@ -149,6 +149,7 @@ export const PUT = withCsrfProtection(
         // Check if category exists
         const existingCategory = await prisma.forumCategory.findUnique({
           where: { id: categoryId },
+          select: { id: true },
         });
 
         if (!existingCategory) {
@@ -165,15 +166,12 @@ export const PUT = withCsrfProtection(
 
         // Build update data
         const updateData: {
-          updatedDate: Date;
           name?: string;
           slug?: string;
           description?: string;
           displayOrder?: number;
           isActive?: boolean;
-        } = {
-          updatedDate: new Date(),
-        };
+        } = {};
 
         if (name !== undefined) {
           updateData.name = name.trim();
@@ -192,6 +190,7 @@ export const PUT = withCsrfProtection(
                 slug: updateData.slug,
                 id: { not: categoryId },
               },
+              select: { id: true },
             });
 
             if (conflictingCategory) {
@@ -333,6 +332,7 @@ export const DELETE = withCsrfProtection(
         // Check if category exists
         const existingCategory = await prisma.forumCategory.findUnique({
           where: { id: categoryId },
+          select: { name: true },
         });
 
         if (!existingCategory) {
@@ -347,29 +347,22 @@ export const DELETE = withCsrfProtection(
           );
         }
 
-        // Use transaction to delete category and all related data
-        await prisma.$transaction(async (tx) => {
-          // First, delete all posts in threads of this category
-          await tx.forumPost.deleteMany({
-            where: {
-              thread: {
-                categoryId: categoryId,
-              },
-            },
-          });
-
-          // Then delete all threads in this category
-          await tx.forumThread.deleteMany({
-            where: {
-              categoryId: categoryId,
+        // Threads and posts are removed by ON DELETE CASCADE. Reports are
+        // kept with their thread cleared, so resolve any still pending first.
+        await prisma.$transaction([
+          prisma.forumReport.updateMany({
+            where: { thread: { categoryId: categoryId }, status: "pending" },
+            data: {
+              status: "resolved",
+              reviewedBy: user.id,
+              reviewedDate: new Date(),
+              resolutionNotes: "Category deleted.",
             },
-          });
-
-          // Finally delete the category itself
-          await tx.forumCategory.delete({
+          }),
+          prisma.forumCategory.delete({
             where: { id: categoryId },
-          });
-        });
+          }),
+        ]);
 
         logger.info("Successfully deleted forum category", {
           categoryId,
@@ -12,60 +12,61 @@ export const GET = withAuth(
     try {
       logger.info("Admin fetching forum categories");
 
-      // Get all categories (including inactive ones for admin view)
-      const categories = await prisma.forumCategory.findMany({
-        include: {
-          creator: {
-            select: {
-              id: true,
-              firstName: true,
-              lastName: true,
-            },
-          },
-          _count: {
-            select: {
-              threads: true,
+      // Get all categories (including inactive ones for admin view), along
+      // with post counts for every category in a single grouped query
+      // rather than one COUNT per category.
+      const [categories, postCounts] = await Promise.all([
+        prisma.forumCategory.findMany({
+          include: {
+            creator: {
+              select: {
+                id: true,
+                firstName: true,
+                lastName: true,
+              },
             },
-          },
-        },
-        orderBy: [{ displayOrder: "asc" }, { name: "asc" }],
-      });
-
-      // For each category, calculate post count by summing posts across all threads
-      const categoriesWithStats = await Promise.all(
-        categories.map(async (category) => {
-          const postCount = await prisma.forumPost.count({
-            where: {
-              thread: {
-                categoryId: category.id,
+            _count: {
+              select: {
+                threads: true,
               },
             },
-          });
-
-          return {
-            id: category.id,
-            name: category.name,
-            description: category.description,
-            slug: category.slug,
-            display_order: category.displayOrder,
-            is_active: category.isActive,
-            created_date:
-              category.createdDate?.toISOString() ?? new Date().toISOString(),
-            updated_date:
-              category.updatedDate?.toISOString() ?? new Date().toISOString(),
-            creator: category.creator
-              ? {
-                  id: category.creator.id,
-                  first_name: category.creator.firstName,
-                  last_name: category.creator.lastName,
-                }
-              : null,
-            thread_count: category._count.threads,
-            post_count: postCount,
-          };
-        })
+          },
+          orderBy: [{ displayOrder: "asc" }, { name: "asc" }],
+        }),
+        prisma.$queryRaw<Array<{ category_id: number; post_count: bigint }>>`
+          SELECT t.category_id, COUNT(p.id) AS post_count
+          FROM forum_posts p
+          JOIN forum_threads t ON t.id = p.thread_id
+          GROUP BY t.category_id
+        `,
+      ]);
+
+      const postCountByCategory = new Map(
+        postCounts.map((row) => [row.category_id, Number(row.post_count)])
       );
 
+      const categoriesWithStats = categories.map((category) => ({
+        id: category.id,
+        name: category.name,
+        description: category.description,
+        slug: category.slug,
+        display_order: category.displayOrder,
+        is_active: category.isActive,
+        created_date:
+          category.createdDate?.toISOString() ?? new Date().toISOString(),
+        updated_date:
+          category.updatedDate?.toISOString() ?? new Date().toISOString(),
+        creator: category.creator
+          ? {
+              id: category.creator.id,
+              first_name: category.creator.firstName,
+              last_name: category.creator.lastName,
+            }
+          : null,
+        thread_count: category._count.threads,
+        post_count: postCountByCategory.get(category.id) ?? 0,
+      }));
+
       logger.info("Successfully fetched admin forum categories", {
         count: categoriesWithStats.length,
       });
@@ -134,6 +135,7 @@ export const POST = withCsrfProtection(
         // Check if slug already exists
         const existingCategory = await prisma.forumCategory.findUnique({
           where: { slug },
+          select: { id: true },
         });
 
         if (existingCategory) {
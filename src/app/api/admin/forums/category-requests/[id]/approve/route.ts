@@ -73,6 +73,7 @@ export const POST = withCsrfProtection(
         // Check if slug already exists
         const existingCategory = await prisma.forumCategory.findUnique({
           where: { slug },
+          select: { id: true },
         });
 
         if (existingCategory) {
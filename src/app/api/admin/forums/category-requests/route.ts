@@ -20,43 +20,42 @@ export const GET = withAuth(
         offset,
       });
 
-      const requests = await prisma.forumCategoryRequest.findMany({
-        where: whereClause,
-        include: {
-          requester: {
-            select: {
-              id: true,
-              firstName: true,
-              lastName: true,
-              email: true,
+      const [requests, total] = await Promise.all([
+        prisma.forumCategoryRequest.findMany({
+          where: whereClause,
+          include: {
+            requester: {
+              select: {
+                id: true,
+                firstName: true,
+                lastName: true,
+                email: true,
+              },
             },
-          },
-          reviewer: {
-            select: {
-              id: true,
-              firstName: true,
-              lastName: true,
-              email: true,
+            reviewer: {
+              select: {
+                id: true,
+                firstName: true,
+                lastName: true,
+                email: true,
+              },
             },
-          },
-          category: {
-            select: {
-              id: true,
-              name: true,
-              slug: true,
+            category: {
+              select: {
+                id: true,
+                name: true,
+                slug: true,
+              },
             },
           },
-        },
-        orderBy: {
-          createdDate: "desc",
-        },
-        skip: offset,
-        take: limit,
-      });
-
-      const total = await prisma.forumCategoryRequest.count({
-        where: whereClause,
-      });
+          orderBy: {
+            createdDate: "desc",
+          },
+          skip: offset,
+          take: limit,
+        }),
+        prisma.forumCategoryRequest.count({ where: whereClause }),
+      ]);
 
       // Transform to match expected response format
       const transformedRequests = requests.map((request) => ({
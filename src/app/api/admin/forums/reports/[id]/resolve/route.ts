@@ -75,17 +75,42 @@ export const POST = withCsrfProtection(
           );
         }
 
+        // A thread-level report, or one whose content is already gone, has
+        // nothing for the requested delete to remove
+        if (
+          (action === "delete_post" && !report.postId) ||
+          (action === "delete_thread" && !report.threadId)
+        ) {
+          return NextResponse.json(
+            {
+              error: {
+                message: `Report has no ${action === "delete_post" ? "post" : "thread"} to delete`,
+                code: 400,
+              },
+            },
+            { status: 400 }
+          );
+        }
+
+        // Record the moderation action alongside any admin notes. The report
+        // outlives the deleted content, so the notes are kept with it.
+        const resolutionNotes =
+          action === "dismiss"
+            ? notes || null
+            : `${action === "delete_post" ? "Post deleted" : "Thread deleted"}. ${notes || ""}`.trim();
+        const resolution = {
+          status: "resolved",
+          reviewedBy: user.id,
+          reviewedDate: new Date(),
+          resolutionNotes,
+        };
+
         // Perform the action in a transaction
         const result = await prisma.$transaction(async (tx) => {
           // Update the report status
           const updatedReport = await tx.forumReport.update({
             where: { id: reportId },
-            data: {
-              status: "resolved",
-              reviewedBy: user.id,
-              reviewedDate: new Date(),
-              resolutionNotes: notes || null,
-            },
+            data: resolution,
             include: {
               reporter: {
                 select: {
@@ -133,32 +158,22 @@ export const POST = withCsrfProtection(
             },
           });
 
-          // Perform the requested action
+          // Perform the requested action. Posts in a deleted thread are
+          // removed by ON DELETE CASCADE. Reports are kept with their thread
+          // and post cleared, so any other pending reports of the removed
+          // content are resolved along with this one.
           if (action === "delete_post" && report.postId) {
-            // First delete any other reports that reference this post (to avoid FK constraint violations)
-            await tx.forumReport.deleteMany({
-              where: {
-                postId: report.postId,
-                id: { not: reportId }, // Don't delete the current report, it's already updated
-              },
+            await tx.forumReport.updateMany({
+              where: { postId: report.postId, status: "pending" },
+              data: resolution,
             });
-
-            // Now delete the specific post
             await tx.forumPost.delete({
               where: { id: report.postId },
             });
-          } else if (action === "delete_thread") {
-            // First delete any other reports that reference this thread or its posts (to avoid FK constraint violations)
-            await tx.forumReport.deleteMany({
-              where: {
-                threadId: report.threadId,
-                id: { not: reportId }, // Don't delete the current report, it's already updated
-              },
-            });
-
-            // Delete all posts in the thread first, then the thread
-            await tx.forumPost.deleteMany({
-              where: { threadId: report.threadId },
+          } else if (action === "delete_thread" && report.threadId) {
+            await tx.forumReport.updateMany({
+              where: { threadId: report.threadId, status: "pending" },
+              data: resolution,
             });
             await tx.forumThread.delete({
               where: { id: report.threadId },
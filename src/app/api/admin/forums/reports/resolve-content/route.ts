@@ -100,58 +100,29 @@ export const POST = withCsrfProtection(
             );
           }
 
+          // Resolve the pending reports first. Deleting the content below
+          // keeps them as history with their thread and post cleared; posts
+          // in a deleted thread are removed by ON DELETE CASCADE.
+          await tx.forumReport.updateMany({
+            where: whereClause,
+            data: {
+              status: "resolved",
+              reviewedBy: user.id,
+              reviewedDate: new Date(),
+              resolutionNotes: notes || null,
+            },
+          });
+
           // Perform the requested action
           if (action === "delete_post" && type === "post") {
-            // When deleting content, delete all related reports first to avoid foreign key constraints
-            await tx.forumReport.deleteMany({
-              where: whereClause,
-            });
-
-            // Then delete the post
             await tx.forumPost.delete({
               where: { id: parseInt(contentId) },
             });
           } else if (action === "delete_thread" && type === "thread") {
-            // When deleting a thread, delete all reports for the thread first
-            await tx.forumReport.deleteMany({
-              where: { threadId: parseInt(contentId) },
-            });
-
-            // Get all post IDs in this thread to delete their reports too
-            const threadPosts = await tx.forumPost.findMany({
-              where: { threadId: parseInt(contentId) },
-              select: { id: true },
-            });
-
-            if (threadPosts.length > 0) {
-              await tx.forumReport.deleteMany({
-                where: {
-                  postId: {
-                    in: threadPosts.map((p) => p.id),
-                  },
-                },
-              });
-            }
-
-            // Delete all posts in the thread first, then the thread
-            await tx.forumPost.deleteMany({
-              where: { threadId: parseInt(contentId) },
-            });
             await tx.forumThread.delete({
               where: { id: parseInt(contentId) },
             });
           } else if (action === "dismiss") {
-            // For dismiss action, update reports to resolved status
-            await tx.forumReport.updateMany({
-              where: whereClause,
-              data: {
-                status: "resolved",
-                reviewedBy: user.id,
-                reviewedDate: new Date(),
-                resolutionNotes: notes || null,
-              },
-            });
-
             // Reset the report count to 0
             if (type === "thread") {
               await tx.forumThread.update({
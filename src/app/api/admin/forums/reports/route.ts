@@ -17,13 +17,33 @@ export const GET = withAuth(
         offset,
       });
 
+      // Only "pending" and "all" have any matching items; skip the queries
+      // entirely for anything else.
+      if (status !== "pending" && status !== "all") {
+        return NextResponse.json({
+          reports: [],
+          total: 0,
+          limit,
+          offset,
+          hasMore: false,
+        });
+      }
+
+      // Push the pending filter into the query as a join instead of loading
+      // every reported item and discarding those without pending reports.
+      const reportedWhere =
+        status === "pending"
+          ? {
+              reportCount: { gt: 0 },
+              reports: { some: { status: "pending" } },
+            }
+          : { reportCount: { gt: 0 } };
+
       // For the aggregated approach, we fetch threads and posts with reportCount > 0
       const [reportedThreads, reportedPosts] = await Promise.all([
         // Get reported threads
         prisma.forumThread.findMany({
-          where: {
-            reportCount: { gt: 0 },
-          },
+          where: reportedWhere,
           include: {
             category: {
               select: {
@@ -61,9 +81,7 @@ export const GET = withAuth(
 
         // Get reported posts
         prisma.forumPost.findMany({
-          where: {
-            reportCount: { gt: 0 },
-          },
+          where: reportedWhere,
           include: {
             thread: {
               select: {
@@ -108,121 +126,107 @@ export const GET = withAuth(
       ]);
 
       // Transform threads to the expected format
-      const transformedThreads = reportedThreads
-        .filter((thread) => {
-          // Apply status filter
-          if (status === "pending") return thread.reports.length > 0;
-          if (status === "all") return true;
-          return false;
-        })
-        .map((thread) => ({
-          type: "thread",
-          thread_id: thread.id,
-          post_id: null,
-          reportCount: thread.reportCount,
-          content_type: "thread",
-          status: thread.reports.length > 0 ? "pending" : "resolved",
-          thread: {
-            id: thread.id,
-            title: thread.title,
-            slug: thread.slug,
-            category: thread.category
-              ? {
-                  id: thread.category.id,
-                  name: thread.category.name,
-                  slug: thread.category.slug,
-                }
-              : null,
-            creator: thread.creator
-              ? {
-                  id: thread.creator.id,
-                  first_name: thread.creator.firstName,
-                  last_name: thread.creator.lastName,
-                }
-              : null,
-          },
-          post: null,
-          // Use most recent report for context
-          most_recent_report: thread.reports[0]
+      const transformedThreads = reportedThreads.map((thread) => ({
+        type: "thread",
+        thread_id: thread.id,
+        post_id: null,
+        reportCount: thread.reportCount,
+        content_type: "thread",
+        status: thread.reports.length > 0 ? "pending" : "resolved",
+        thread: {
+          id: thread.id,
+          title: thread.title,
+          slug: thread.slug,
+          category: thread.category
             ? {
-                id: thread.reports[0].id,
-                reason: thread.reports[0].reason,
-                details: thread.reports[0].details,
-                created_date:
-                  thread.reports[0].createdDate?.toISOString() ??
-                  new Date().toISOString(),
-                reporter: thread.reports[0].reporter
-                  ? {
-                      id: thread.reports[0].reporter.id,
-                      first_name: thread.reports[0].reporter.firstName,
-                      last_name: thread.reports[0].reporter.lastName,
-                      email: thread.reports[0].reporter.email,
-                    }
-                  : null,
+                id: thread.category.id,
+                name: thread.category.name,
+                slug: thread.category.slug,
               }
             : null,
-        }));
-
-      // Transform posts to the expected format
-      const transformedPosts = reportedPosts
-        .filter((post) => {
-          // Apply status filter
-          if (status === "pending") return post.reports.length > 0;
-          if (status === "all") return true;
-          return false;
-        })
-        .map((post) => ({
-          type: "post",
-          thread_id: post.threadId,
-          post_id: post.id,
-          reportCount: post.reportCount,
-          content_type: "post",
-          status: post.reports.length > 0 ? "pending" : "resolved",
-          thread: post.thread
+          creator: thread.creator
             ? {
-                id: post.thread.id,
-                title: post.thread.title,
-                slug: post.thread.slug,
-                category: post.thread.category
-                  ? {
-                      id: post.thread.category.id,
-                      name: post.thread.category.name,
-                      slug: post.thread.category.slug,
-                    }
-                  : null,
+                id: thread.creator.id,
+                first_name: thread.creator.firstName,
+                last_name: thread.creator.lastName,
               }
             : null,
-          post: {
-            id: post.id,
-            content: post.content.substring(0, 200) + "...", // Truncate for admin list
-            creator: post.creator
-              ? {
-                  id: post.creator.id,
-                  first_name: post.creator.firstName,
-                  last_name: post.creator.lastName,
-                }
-              : null,
-          },
-          // Use most recent report for context
-          most_recent_report: post.reports[0]
+        },
+        post: null,
+        // Use most recent report for context
+        most_recent_report: thread.reports[0]
+          ? {
+              id: thread.reports[0].id,
+              reason: thread.reports[0].reason,
+              details: thread.reports[0].details,
+              created_date:
+                thread.reports[0].createdDate?.toISOString() ??
+                new Date().toISOString(),
+              reporter: thread.reports[0].reporter
+                ? {
+                    id: thread.reports[0].reporter.id,
+                    first_name: thread.reports[0].reporter.firstName,
+                    last_name: thread.reports[0].reporter.lastName,
+                    email: thread.reports[0].reporter.email,
+                  }
+                : null,
+            }
+          : null,
+      }));
+
+      // Transform posts to the expected format
+      const transformedPosts = reportedPosts.map((post) => ({
+        type: "post",
+        thread_id: post.threadId,
+        post_id: post.id,
+        reportCount: post.reportCount,
+        content_type: "post",
+        status: post.reports.length > 0 ? "pending" : "resolved",
+        thread: post.thread
+          ? {
+              id: post.thread.id,
+              title: post.thread.title,
+              slug: post.thread.slug,
+              category: post.thread.category
+                ? {
+                    id: post.thread.category.id,
+                    name: post.thread.category.name,
+                    slug: post.thread.category.slug,
+                  }
+                : null,
+            }
+          : null,
+        post: {
+          id: post.id,
+          content: post.content.substring(0, 200) + "...", // Truncate for admin list
+          creator: post.creator
             ? {
-                id: post.reports[0].id,
-                reason: post.reports[0].reason,
-                details: post.reports[0].details,
-                created_date:
-                  post.reports[0].createdDate?.toISOString() ??
-                  new Date().toISOString(),
-                reporter: post.reports[0].reporter
-                  ? {
-                      id: post.reports[0].reporter.id,
-                      first_name: post.reports[0].reporter.firstName,
-                      last_name: post.reports[0].reporter.lastName,
-                      email: post.reports[0].reporter.email,
-                    }
-                  : null,
+                id: post.creator.id,
+                first_name: post.creator.firstName,
+                last_name: post.creator.lastName,
               }
             : null,
-        }));
+        },
+        // Use most recent report for context
+        most_recent_report: post.reports[0]
+          ? {
+              id: post.reports[0].id,
+              reason: post.reports[0].reason,
+              details: post.reports[0].details,
+              created_date:
+                post.reports[0].createdDate?.toISOString() ??
+                new Date().toISOString(),
+              reporter: post.reports[0].reporter
+                ? {
+                    id: post.reports[0].reporter.id,
+                    first_name: post.reports[0].reporter.firstName,
+                    last_name: post.reports[0].reporter.lastName,
+                    email: post.reports[0].reporter.email,
+                  }
+                : null,
+            }
+          : null,
+      }));
 
       // Combine and sort by report count (descending)
       const allReports = [...transformedThreads, ...transformedPosts].sort(
@@ -64,7 +64,6 @@ export const POST = withCsrfProtection(
           where: { id: threadId },
           data: {
             isLocked: is_locked,
-            updatedDate: new Date(),
           },
           include: {
             category: {
@@ -64,7 +64,6 @@ export const POST = withCsrfProtection(
           where: { id: threadId },
           data: {
             isPinned: is_pinned,
-            updatedDate: new Date(),
           },
           include: {
             category: {
@@ -37,6 +37,7 @@ export const DELETE = withCsrfProtection(
         // Check if thread exists
         const existingThread = await prisma.forumThread.findUnique({
           where: { id: threadId },
+          select: { title: true },
         });
 
         if (!existingThread) {
@@ -51,27 +52,22 @@ export const DELETE = withCsrfProtection(
           );
         }
 
-        // Use transaction to delete thread and all related data
-        await prisma.$transaction(async (tx) => {
-          // First, delete all reports related to posts in this thread
-          await tx.forumReport.deleteMany({
-            where: {
-              threadId: threadId,
+        // Posts are removed by ON DELETE CASCADE. Reports are kept with the
+        // thread cleared, so resolve any still pending first.
+        await prisma.$transaction([
+          prisma.forumReport.updateMany({
+            where: { threadId: threadId, status: "pending" },
+            data: {
+              status: "resolved",
+              reviewedBy: user.id,
+              reviewedDate: new Date(),
+              resolutionNotes: "Thread deleted.",
             },
-          });
-
-          // Then delete all posts in this thread
-          await tx.forumPost.deleteMany({
-            where: {
-              threadId: threadId,
-            },
-          });
-
-          // Finally delete the thread itself
-          await tx.forumThread.delete({
+          }),
+          prisma.forumThread.delete({
             where: { id: threadId },
-          });
-        });
+          }),
+        ]);
 
         logger.info("Successfully deleted forum thread", {
           threadId,
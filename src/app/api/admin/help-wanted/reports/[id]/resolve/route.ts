@@ -9,6 +9,8 @@ import {
 } from "@/lib/errors";
 import { prisma } from "@/lib/db/client";
 
+const RESOLUTION_ACTIONS = new Set(["dismiss", "delete_post"]);
+
 interface ReportResolutionData {
   action: string;
   notes: string | null;
@@ -20,8 +22,7 @@ function validateReportResolution(data: any) {
   // Using any for runtime validation
   const errors: string[] = [];
 
-  const validActions = ["dismiss", "delete_post"];
-  if (!data.action || !validActions.includes(data.action)) {
+  if (!data.action || !RESOLUTION_ACTIONS.has(data.action)) {
     errors.push("Action must be one of: dismiss, delete_post");
   }
 
@@ -85,13 +86,7 @@ export const POST = withCsrfProtection(
         // Check if report exists
         const existingReport = await prisma.helpWantedReport.findUnique({
           where: { id: reportId },
-          include: {
-            post: {
-              select: {
-                id: true,
-              },
-            },
-          },
+          select: { postId: true, status: true },
         });
 
         if (!existingReport) {
@@ -102,17 +97,34 @@ export const POST = withCsrfProtection(
           throw new BadRequestError("Report has already been resolved");
         }
 
+        const { action, notes } = validation.data;
+        const postId = existingReport.postId;
+
+        if (action === "delete_post" && postId === null) {
+          throw new BadRequestError(
+            "The reported post has already been deleted"
+          );
+        }
+
+        // Record the moderation action alongside any admin notes
+        const resolutionNotes =
+          action === "delete_post"
+            ? `Post deleted. ${notes || ""}`.trim()
+            : notes;
+
+        const resolution = {
+          status: "resolved",
+          reviewedBy: user.id,
+          reviewedDate: new Date(),
+          resolutionNotes,
+        };
+
         // Start transaction to handle report resolution and potential post deletion
         const result = await prisma.$transaction(async (tx) => {
           // Update the report
           const updatedReport = await tx.helpWantedReport.update({
             where: { id: reportId },
-            data: {
-              status: "resolved",
-              reviewedBy: user.id,
-              reviewedDate: new Date(),
-              resolutionNotes: validation.data!.notes,
-            },
+            data: resolution,
             include: {
               reporter: {
                 select: {
@@ -139,10 +151,16 @@ export const POST = withCsrfProtection(
             },
           });
 
-          // If action is delete_post, delete the post
-          if (validation.data!.action === "delete_post") {
+          // If action is delete_post, delete the post. Its comments are
+          // removed by ON DELETE CASCADE; reports are kept with the post
+          // cleared, so resolve the post's other open reports too.
+          if (action === "delete_post" && postId !== null) {
+            await tx.helpWantedReport.updateMany({
+              where: { postId: postId, status: { not: "resolved" } },
+              data: resolution,
+            });
             await tx.helpWantedPost.delete({
-              where: { id: existingReport.postId },
+              where: { id: postId },
             });
           }
 
@@ -184,7 +202,7 @@ export const POST = withCsrfProtection(
         };
 
         return NextResponse.json({
-          message: `Report resolved with action: ${validation.data.action}`,
+          message: `Report resolved with action: ${action}`,
           report: transformedReport,
         });
       } catch (error) {
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from "next/server";
 import { withAuth } from "@/lib/auth/middleware";
 import { withCsrfProtection } from "@/lib/auth/csrf";
 import { prisma } from "@/lib/db/client";
+import { resourceQueries } from "@/lib/db/queries";
 import { logger } from "@/lib/logger";
 
 /**
@@ -142,6 +143,8 @@ export const PUT = withCsrfProtection(
           },
         });
 
+        resourceQueries.clearSiteConfigCache();
+
         return NextResponse.json({
           message: "Config updated successfully",
           config: {
@@ -222,6 +225,8 @@ export const DELETE = withCsrfProtection(
           where: { id: configId },
         });
 
+        resourceQueries.clearSiteConfigCache();
+
         return NextResponse.json({
           message: "Config deleted successfully",
         });
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from "next/server";
 import { withAuth } from "@/lib/auth/middleware";
 import { withCsrfProtection } from "@/lib/auth/csrf";
 import { prisma } from "@/lib/db/client";
+import { resourceQueries } from "@/lib/db/queries";
 import { logger } from "@/lib/logger";
 
 /**
@@ -86,6 +87,8 @@ export const POST = withCsrfProtection(
           },
         });
 
+        resourceQueries.clearSiteConfigCache();
+
         return NextResponse.json(
           {
             message: "Config created successfully",
@@ -0,0 +1,35 @@
+import { NextRequest, NextResponse } from "next/server";
+import { withAuth } from "@/lib/auth/middleware";
+import { withCsrfProtection } from "@/lib/auth/csrf";
+import { reviewQueries } from "@/lib/db/queries";
+import { handleApiError, BadRequestError } from "@/lib/errors";
+
+// POST /api/admin/reviews/[id]/unhide - Unhide a review and clear its report
+export const POST = withCsrfProtection(
+  withAuth(
+    async (
+      _request: NextRequest,
+      _context: unknown,
+      { params }: { params: Promise<{ id: string }> }
+    ) => {
+      try {
+        const { id } = await params;
+        const reviewId = parseInt(id);
+
+        if (isNaN(reviewId)) {
+          throw new BadRequestError("Invalid review ID");
+        }
+
+        return NextResponse.json(
+          await reviewQueries.clearReviewReportResponse(
+            reviewId,
+            "Review unhidden successfully"
+          )
+        );
+      } catch (error) {
+        return handleApiError(error, "POST /api/admin/reviews/[id]/unhide");
+      }
+    },
+    { requireAdmin: true }
+  )
+);
@@ -46,10 +46,14 @@ export const POST = withCsrfProtection(
           );
         }
 
-        // Check if user exists
-        const existingUser = await prisma.user.findUnique({
-          where: { id: userId },
-        });
+        // Check if user exists while the new password hashes
+        const [existingUser, passwordHash] = await Promise.all([
+          prisma.user.findUnique({
+            where: { id: userId },
+            select: { id: true },
+          }),
+          hashPassword(new_password),
+        ]);
 
         if (!existingUser) {
           return NextResponse.json(
@@ -63,9 +67,6 @@ export const POST = withCsrfProtection(
           );
         }
 
-        // Hash new password
-        const passwordHash = await hashPassword(new_password);
-
         // Update password
         await prisma.user.update({
           where: { id: userId },
@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from "next/server";
 import { withAuth } from "@/lib/auth/middleware";
 import { withCsrfProtection } from "@/lib/auth/csrf";
 import { prisma } from "@/lib/db/client";
+import { validateEmailAddress } from "@/lib/auth/validation";
 import { logger } from "@/lib/logger";
 import {
   ensureDeletedUserExists,
@@ -35,7 +36,25 @@ export const PUT = withCsrfProtection(
         }
 
         const body = await request.json();
-        const { email, first_name, last_name, role, is_active } = body;
+        const { first_name, last_name, role, is_active } = body;
+
+        // Emails are stored lowercased so lookups hit the unique email index
+        let email: string | undefined;
+        if (body.email !== undefined) {
+          const emailValidation = validateEmailAddress(body.email);
+          if (!emailValidation.valid) {
+            return NextResponse.json(
+              {
+                error: {
+                  message: emailValidation.errors!["email"]![0],
+                  code: 400,
+                },
+              },
+              { status: 400 }
+            );
+          }
+          email = emailValidation.data;
+        }
 
         // Check if user exists
         const existingUser = await prisma.user.findUnique({
@@ -58,6 +77,7 @@ export const PUT = withCsrfProtection(
         if (email && email !== existingUser.email) {
           const emailExists = await prisma.user.findUnique({
             where: { email },
+            select: { id: true },
           });
 
           if (emailExists) {
@@ -43,6 +43,7 @@ describe("POST /api/auth/login", () => {
     const mockUser = createMockUser({
       email: "test@example.com",
       passwordHash: "$2b$10$validhash",
+      lastLogin: new Date(Date.now() - 60 * 60 * 1000),
     });
 
     (prisma.user.findUnique as ReturnType<typeof vi.fn>).mockResolvedValue(
@@ -79,6 +80,36 @@ describe("POST /api/auth/login", () => {
     });
   });
 
+  it("should skip the lastLogin write when the previous login was recent", async () => {
+    const recentLogin = new Date(Date.now() - 60 * 1000);
+    const mockUser = createMockUser({
+      email: "test@example.com",
+      passwordHash: "$2b$10$validhash",
+      lastLogin: recentLogin,
+    });
+
+    (prisma.user.findUnique as ReturnType<typeof vi.fn>).mockResolvedValue(
+      mockUser
+    );
+    vi.mocked(verifyPassword).mockResolvedValue(true);
+
+    const request = createMockRequest({
+      method: "POST",
+      url: "http://localhost:3000/api/auth/login",
+      body: {
+        email: "test@example.com",
+        password: "correctpassword",
+      },
+    });
+
+    const response = await POST(request);
+    const data = await parseJsonResponse(response);
+
+    expect(response.status).toBe(200);
+    expect(prisma.user.update).not.toHaveBeenCalled();
+    expect(data.user.last_login).toBe(recentLogin.toISOString());
+  });
+
   it("should return 401 for non-existent user", async () => {
     (prisma.user.findUnique as ReturnType<typeof vi.fn>).mockResolvedValue(
       null
@@ -98,6 +129,7 @@ describe("POST /api/auth/login", () => {
 
     expect(response.status).toBe(401);
     expect(data.error.message).toBe("Invalid credentials");
+    expect(verifyPassword).toHaveBeenCalledWith("password", undefined);
   });
 
   it("should return 401 for incorrect password", async () => {
@@ -11,6 +11,9 @@ import {
   UnauthorizedError,
 } from "@/lib/errors";
 
+// Minimum time between last_login writes for the same user
+const LAST_LOGIN_UPDATE_INTERVAL_MS = 5 * 60 * 1000;
+
 export const POST = withAuthRateLimit(
   "login",
   async function loginHandler(request: NextRequest) {
@@ -42,10 +45,9 @@ export const POST = withAuthRateLimit(
         },
       });
 
-      // Check if user exists, password is correct, and user is active
-      const passwordValid = user
-        ? await verifyPassword(password, user.passwordHash)
-        : false;
+      // Check if user exists, password is correct, and user is active.
+      // The KDF runs even for unknown emails so timing doesn't reveal them.
+      const passwordValid = await verifyPassword(password, user?.passwordHash);
 
       if (!user || !user.isActive || !passwordValid) {
         throw new UnauthorizedError("Invalid credentials");
@@ -56,11 +58,20 @@ export const POST = withAuthRateLimit(
         logger.warn(`Login with unverified email: ${user.email}`);
       }
 
-      // Update last login timestamp
-      await prisma.user.update({
-        where: { id: user.id },
-        data: { lastLogin: new Date() },
-      });
+      // Update last login timestamp, skipping the write when the previous
+      // login was recent (e.g. signing in again from another tab)
+      const now = new Date();
+      let lastLogin = user.lastLogin;
+      if (
+        !lastLogin ||
+        now.getTime() - lastLogin.getTime() >= LAST_LOGIN_UPDATE_INTERVAL_MS
+      ) {
+        await prisma.user.update({
+          where: { id: user.id },
+          data: { lastLogin: now },
+        });
+        lastLogin = now;
+      }
 
       // Generate access token
       const token = generateAccessToken({
@@ -86,7 +97,7 @@ export const POST = withAuthRateLimit(
         email_verified: user.emailVerified,
         created_date:
           user.createdDate?.toISOString() ?? new Date().toISOString(),
-        last_login: new Date().toISOString(), // Use current time since we just updated it
+        last_login: lastLogin.toISOString(),
       };
 
       logger.info(`User logged in: ${user.email}`);
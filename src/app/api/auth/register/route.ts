@@ -27,18 +27,21 @@ export const POST = withAuthRateLimit(
 
       const { email, password, first_name, last_name } = validation.data!;
 
-      // Check if user already exists
-      const existingUser = await prisma.user.findUnique({
-        where: { email },
-      });
+      // Check if user already exists while the password hashes. bcrypt runs
+      // on the libuv thread pool, so the lookup's round trip overlaps with it
+      // instead of adding to it.
+      const [existingUser, passwordHash] = await Promise.all([
+        prisma.user.findUnique({
+          where: { email },
+          select: { id: true },
+        }),
+        hashPassword(password),
+      ]);
 
       if (existingUser) {
         throw new ConflictError("Email already registered");
       }
 
-      // Hash password
-      const passwordHash = await hashPassword(password);
-
       // Get client IP address for registration logging
       const registrationIP = getClientIP(request);
 
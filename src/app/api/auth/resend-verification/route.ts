@@ -23,9 +23,12 @@ export const POST = withAuthRateLimit(
         throw new ValidationError("Email is required");
       }
 
+      // Emails are stored lowercased; normalize so mixed-case input matches
+      const normalizedEmail = String(email).toLowerCase().trim();
+
       // Find user by email
       const user = await prisma.user.findUnique({
-        where: { email },
+        where: { email: normalizedEmail },
         select: {
           id: true,
           email: true,
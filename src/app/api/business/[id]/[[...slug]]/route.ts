@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from "next/server";
 import { cardQueries } from "@/lib/db/queries";
 import { logger } from "@/lib/logger";
+import { jsonWithEtag } from "@/lib/utils/etag";
 
 // Cache for 5 minutes (300 seconds) to match Flask API
 export const revalidate = 300;
@@ -68,13 +69,9 @@ export async function GET(request: NextRequest, context: RouteContext) {
       );
     }
 
-    // Return response matching Flask API format
-    const response = NextResponse.json(card);
-
-    // Set cache headers to match Flask API
-    response.headers.set("Cache-Control", "public, max-age=300");
-
-    return response;
+    // Return response matching Flask API format, with an ETag so clients
+    // revalidating an unchanged card get an empty 304
+    return jsonWithEtag(request, card, "public, max-age=300");
   } catch (error) {
     logger.error("Failed to fetch business:", error);
 
@@ -4,6 +4,8 @@ import { validateReview } from "@/lib/validation/reviews";
 import { withAuth } from "@/lib/auth/middleware";
 import { withCsrfProtection } from "@/lib/auth/csrf";
 import { logger } from "@/lib/logger";
+import { jsonWithEtag } from "@/lib/utils/etag";
+import { decodeReviewCursor, encodeReviewCursor } from "@/lib/utils/cursor";
 import {
   handleApiError,
   BadRequestError,
@@ -38,8 +40,16 @@ export async function GET(request: NextRequest, context: RouteContext) {
     const limit = Math.min(parseInt(url.searchParams.get("limit") || "10"), 50);
     const offset = Math.max(parseInt(url.searchParams.get("offset") || "0"), 0);
 
+    // Keyset pagination: "after" continues from the last review of the
+    // previous page, so deep pages cost the same as the first one
+    const after = url.searchParams.get("after");
+    const cursor = after ? decodeReviewCursor(after) : null;
+    if (after && !cursor) {
+      throw new BadRequestError("Invalid cursor");
+    }
+
     // Check if card exists
-    const card = await cardQueries.getCardById(cardId);
+    const card = await cardQueries.getCardSummary(cardId);
     if (!card) {
       throw new NotFoundError("Card");
     }
@@ -48,14 +58,12 @@ export async function GET(request: NextRequest, context: RouteContext) {
     const reviewsData = await reviewQueries.getCardReviews(
       cardId,
       limit,
-      offset
+      offset,
+      cursor ?? undefined
     );
 
     // Get rating summary and distribution
-    const [ratingSummary, ratingDistribution] = await Promise.all([
-      reviewQueries.getCardRatingSummary(cardId),
-      reviewQueries.getCardRatingDistribution(cardId),
-    ]);
+    const ratingStats = await reviewQueries.getCardRatingStats(cardId);
 
     // Transform reviews to match expected API format
     const transformedReviews = reviewsData.reviews.map((review) => ({
@@ -80,21 +88,22 @@ export async function GET(request: NextRequest, context: RouteContext) {
       pagination: {
         limit,
         offset,
-        total_count: reviewsData.totalCount,
+        total_count: ratingStats.totalReviews,
         has_more: reviewsData.hasMore,
+        next_cursor: reviewsData.nextCursor
+          ? encodeReviewCursor(reviewsData.nextCursor)
+          : null,
       },
       summary: {
-        average_rating: ratingSummary.averageRating,
-        total_reviews: ratingSummary.totalReviews,
-        rating_distribution: ratingDistribution,
+        average_rating: ratingStats.averageRating,
+        total_reviews: ratingStats.totalReviews,
+        rating_distribution: ratingStats.distribution,
       },
     };
 
-    // Set cache headers (shorter cache for reviews)
-    const response = NextResponse.json(responseData);
-    response.headers.set("Cache-Control", "public, max-age=60");
-
-    return response;
+    // Shorter cache for reviews, with an ETag so clients revalidating an
+    // unchanged page of reviews get an empty 304
+    return jsonWithEtag(request, responseData, "public, max-age=60");
   } catch (error) {
     return handleApiError(error, "GET /api/cards/[id]/reviews");
   }
@@ -117,17 +126,13 @@ export const POST = withCsrfProtection(
       }
 
       // Check if card exists
-      const card = await cardQueries.getCardById(cardId);
+      const card = await cardQueries.getCardSummary(cardId);
       if (!card) {
         throw new NotFoundError("Card");
       }
 
       // Check if user already has a review for this card
-      const existingReview = await reviewQueries.getUserReviewForCard(
-        user.id,
-        cardId
-      );
-      if (existingReview) {
+      if (await reviewQueries.hasUserReviewedCard(user.id, cardId)) {
         throw new ConflictError(
           "You have already reviewed this business. Use PUT to update your review."
         );
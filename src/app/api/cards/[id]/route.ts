@@ -1,6 +1,7 @@
-import { NextRequest, NextResponse } from "next/server";
+import { NextRequest } from "next/server";
 import { cardQueries } from "@/lib/db/queries";
 import { logger } from "@/lib/logger";
+import { jsonWithEtag } from "@/lib/utils/etag";
 import { handleApiError, BadRequestError, NotFoundError } from "@/lib/errors";
 
 // Cache for 5 minutes (300 seconds) to match Flask API
@@ -44,13 +45,9 @@ export async function GET(request: NextRequest, context: RouteContext) {
       throw new NotFoundError("Card");
     }
 
-    // Return response matching Flask API format
-    const response = NextResponse.json(cardData);
-
-    // Set cache headers to match Flask API
-    response.headers.set("Cache-Control", "public, max-age=300");
-
-    return response;
+    // Return response matching Flask API format, with an ETag so clients
+    // revalidating an unchanged card get an empty 304
+    return jsonWithEtag(request, cardData, "public, max-age=300");
   } catch (error) {
     return handleApiError(error, "GET /api/cards/[id]");
   }
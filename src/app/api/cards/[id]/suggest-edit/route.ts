@@ -10,34 +10,10 @@ import {
   RateLimitError,
   ValidationError,
 } from "@/lib/errors";
+import { checkRateLimit } from "@/lib/utils/rateLimit";
 import { sendModificationNotification } from "@/lib/email/admin-notifications";
 import { logger } from "@/lib/logger";
 
-// Rate limiting storage (in-memory for now)
-const rateLimitStore = new Map<number, { count: number; resetTime: number }>();
-
-function checkRateLimit(userId: number, limitPerHour: number): boolean {
-  const now = Date.now();
-  const hourInMs = 60 * 60 * 1000;
-
-  const userLimits = rateLimitStore.get(userId);
-
-  // If no record exists or the hour has passed, reset
-  if (!userLimits || now >= userLimits.resetTime) {
-    rateLimitStore.set(userId, { count: 1, resetTime: now + hourInMs });
-    return true;
-  }
-
-  // Check if under the limit
-  if (userLimits.count >= limitPerHour) {
-    return false;
-  }
-
-  // Increment count
-  userLimits.count += 1;
-  return true;
-}
-
 // POST /api/cards/[id]/suggest-edit - Suggest edits to an existing card
 export const POST = withCsrfProtection(
   withAuth(
@@ -48,7 +24,7 @@ export const POST = withCsrfProtection(
     ) => {
       try {
         // Rate limiting: 10 requests per hour per user
-        if (!checkRateLimit(user.id, 10)) {
+        if (!checkRateLimit(user.id, "card-modification", 10)) {
           throw new RateLimitError();
         }
 
@@ -60,7 +36,7 @@ export const POST = withCsrfProtection(
         }
 
         // Verify the card exists
-        const existingCard = await cardQueries.getCardById(cardId);
+        const existingCard = await cardQueries.getCardSummary(cardId);
         if (!existingCard) {
           throw new NotFoundError("Card");
         }
@@ -137,24 +113,25 @@ export const POST = withCsrfProtection(
         if (validation.data.tagsText)
           modificationData.tags_text = validation.data.tagsText;
 
-        const modification =
-          await submissionQueries.createModification(modificationData);
+        const submitter = {
+          id: user.id,
+          firstName: user.firstName,
+          lastName: user.lastName,
+          email: user.email,
+        };
+
+        const modification = await submissionQueries.createModification(
+          modificationData,
+          submitter,
+          existingCard
+        );
 
         // Send email notification to admins
         try {
-          await sendModificationNotification(
-            modification,
-            {
-              id: user.id,
-              firstName: user.firstName,
-              lastName: user.lastName,
-              email: user.email,
-            },
-            {
-              id: existingCard.id,
-              name: existingCard.name,
-            }
-          );
+          await sendModificationNotification(modification, submitter, {
+            id: existingCard.id,
+            name: existingCard.name,
+          });
         } catch (emailError) {
           // Log email error but don't fail the modification
           logger.error(
@@ -1,7 +1,13 @@
 import { NextRequest, NextResponse } from "next/server";
 import { prisma } from "@/lib/db/client";
+import { cardQueries } from "@/lib/db/queries";
 import { PAGINATION_LIMITS, paginationUtils } from "@/lib/constants/pagination";
 import { logger } from "@/lib/logger";
+import {
+  cardsAfterCursor,
+  decodeCardCursor,
+  encodeCardCursor,
+} from "@/lib/utils/cursor";
 import { Prisma } from "@prisma/client";
 
 export async function GET(request: NextRequest) {
@@ -10,7 +16,24 @@ export async function GET(request: NextRequest) {
 
     // Parse query parameters
     const search = searchParams.get("search")?.trim() || "";
-    const tags = searchParams.getAll("tags");
+    // Normalize tag filters once: trim, lowercase, drop blanks and
+    // duplicates, and cap how many a single request can combine
+    const tags = Array.from(
+      new Set(
+        searchParams
+          .getAll("tags")
+          .map((tag) => tag.trim().toLowerCase())
+          .filter(Boolean)
+      )
+    );
+    if (tags.length > PAGINATION_LIMITS.CARDS_MAX_TAG_FILTERS) {
+      return NextResponse.json(
+        {
+          error: `Too many tag filters (max ${PAGINATION_LIMITS.CARDS_MAX_TAG_FILTERS})`,
+        },
+        { status: 400 }
+      );
+    }
     const tagMode = searchParams.get("tag_mode")?.toLowerCase() || "and";
     const featuredOnly = searchParams.get("featured")?.toLowerCase() === "true";
     const includeShareUrls =
@@ -25,6 +48,14 @@ export async function GET(request: NextRequest) {
       PAGINATION_LIMITS.CARDS_DEFAULT_LIMIT
     );
 
+    // Keyset pagination: "after" continues from the last card of the
+    // previous page, so deep pages cost the same as the first one
+    const after = searchParams.get("after");
+    const cursor = after ? decodeCardCursor(after) : null;
+    if (after && !cursor) {
+      return NextResponse.json({ error: "Invalid cursor" }, { status: 400 });
+    }
+
     // Build where clause for filtering
     const where: Prisma.CardWhereInput = {
       approved: true,
@@ -45,46 +76,47 @@ export async function GET(request: NextRequest) {
       where.featured = true;
     }
 
-    // Add tag filters
-    if (tags.length > 0) {
-      if (tagMode === "or") {
-        // OR logic: card must have at least one of the selected tags
-        where.card_tags = {
-          some: {
-            tags: {
-              name: {
-                in: tags.map((tag) => tag.toLowerCase()),
-                mode: "insensitive",
-              },
+    // OR logic: card must have at least one of the selected tags
+    if (tags.length > 0 && tagMode === "or") {
+      where.card_tags = {
+        some: {
+          tags: {
+            name: {
+              in: tags,
+              mode: "insensitive",
             },
           },
-        };
-      } else {
-        // AND logic (default): card must have all selected tags
-        where.AND = tags.map((tag) => ({
-          card_tags: {
-            some: {
-              tags: {
-                name: {
-                  contains: tag,
-                  mode: "insensitive",
-                },
-              },
-            },
-          },
-        }));
-      }
+        },
+      };
     }
 
-    // Get total count for pagination
-    const totalCount = await prisma.card.count({ where });
+    // AND logic (default): card must have all selected tags. Prisma can't
+    // express that as one filter, so the page is chosen by a SQL query that
+    // does the tag match inside it, and its cards are then loaded by id.
+    const matchAllTags = tags.length > 0 && tagMode !== "or";
+    const pageIds = matchAllTags
+      ? await cardQueries.getCardPageMatchingAllTags(tags, {
+          search,
+          featuredOnly,
+          cursor,
+          limit,
+          offset,
+        })
+      : null;
+
+    // Kept out of `where` so the total count below ignores the cursor
+    const pageWhere: Prisma.CardWhereInput = pageIds
+      ? { id: { in: pageIds } }
+      : cursor
+        ? { AND: [where, cardsAfterCursor(cursor)] }
+        : where;
 
     // Fetch cards with tags
     const cards = await prisma.card.findMany({
-      where,
+      where: pageWhere,
       include: {
         card_tags: {
-          include: {
+          select: {
             tags: {
               select: {
                 name: true,
@@ -118,11 +150,31 @@ export async function GET(request: NextRequest) {
             }
           : false,
       },
-      orderBy: [{ featured: "desc" }, { name: "asc" }],
-      skip: offset,
+      orderBy: [{ featured: "desc" }, { name: "asc" }, { id: "asc" }],
+      skip: cursor || pageIds ? undefined : offset,
       take: limit,
     });
 
+    // A full page may have a successor; hand out a cursor for it
+    const lastCard = cards.length === limit ? cards[cards.length - 1] : null;
+    const nextCursor = lastCard ? encodeCardCursor(lastCard) : null;
+
+    // A partially filled page is the last one, so the total is known without
+    // a second query. Only count when the page is full or past the end.
+    // Cursor pages skip the total entirely; its cost grows with the table.
+    let totalCount: number | undefined;
+    if (!cursor) {
+      totalCount =
+        cards.length < limit && (cards.length > 0 || offset === 0)
+          ? offset + cards.length
+          : matchAllTags
+            ? await cardQueries.countCardsMatchingAllTags(tags, {
+                search,
+                featuredOnly,
+              })
+            : await prisma.card.count({ where });
+    }
+
     // Transform cards to match API format
     const transformedCards = cards.map((card) => {
       // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -193,16 +245,28 @@ export async function GET(request: NextRequest) {
       return baseCard;
     });
 
-    const response = NextResponse.json({
-      cards: transformedCards,
-      total: totalCount,
-      offset,
-      limit,
-    });
+    const response = NextResponse.json(
+      cursor
+        ? { cards: transformedCards, limit, next_cursor: nextCursor }
+        : {
+            cards: transformedCards,
+            total: totalCount,
+            offset,
+            limit,
+            next_cursor: nextCursor,
+          }
+    );
 
     // Add cache headers (1 minute cache like Flask)
     response.headers.set("Cache-Control", "public, max-age=60");
 
+    if (nextCursor) {
+      const nextUrl = new URL(request.url);
+      nextUrl.searchParams.delete("offset");
+      nextUrl.searchParams.set("after", nextCursor);
+      response.headers.set("Link", `<${nextUrl.toString()}>; rel="next"`);
+    }
+
     return response;
   } catch (error: unknown) {
     const errorMessage =
@@ -4,9 +4,12 @@ import { withCsrfProtection } from "@/lib/auth/csrf";
 import { prisma } from "@/lib/db/client";
 import { logger } from "@/lib/logger";
 import { validateForumThread, ForumThreadData } from "@/lib/validation/forums";
-import { generateSlug } from "@/lib/utils/slugs";
+import { generateSlug, slugCandidates } from "@/lib/utils/slugs";
 import { PAGINATION_LIMITS, paginationUtils } from "@/lib/constants/pagination";
 
+// Slugs checked per query when finding a free one for a new thread
+const SLUG_CANDIDATE_BATCH_SIZE = 20;
+
 /**
  * GET /api/forums/categories/[slug]/threads
  * Get all threads in a category with pagination (public)
@@ -47,43 +50,43 @@ export async function GET(
       );
     }
 
-    // Get total count
-    const totalCount = await prisma.forumThread.count({
-      where: { categoryId: category.id },
-    });
-
-    // Get threads with authors and first posts (pinned first, then by updated date)
-    const threads = await prisma.forumThread.findMany({
-      where: { categoryId: category.id },
-      include: {
-        creator: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
+    // Get threads with authors and first posts (pinned first, then by
+    // updated date) and the total count concurrently
+    const where = { categoryId: category.id };
+    const [threads, totalCount] = await Promise.all([
+      prisma.forumThread.findMany({
+        where,
+        include: {
+          creator: {
+            select: {
+              id: true,
+              firstName: true,
+              lastName: true,
+            },
           },
-        },
-        posts: {
-          take: 1,
-          where: { isFirstPost: true },
-          include: {
-            creator: {
-              select: {
-                id: true,
-                firstName: true,
-                lastName: true,
+          posts: {
+            take: 1,
+            where: { isFirstPost: true },
+            include: {
+              creator: {
+                select: {
+                  id: true,
+                  firstName: true,
+                  lastName: true,
+                },
               },
             },
           },
+          _count: {
+            select: { posts: true },
+          },
         },
-        _count: {
-          select: { posts: true },
-        },
-      },
-      orderBy: [{ isPinned: "desc" }, { updatedDate: "desc" }],
-      skip: offset,
-      take: limit,
-    });
+        orderBy: [{ isPinned: "desc" }, { updatedDate: "desc" }],
+        skip: offset,
+        take: limit,
+      }),
+      prisma.forumThread.count({ where }),
+    ]);
 
     // Transform threads to match Flask API format
     const transformedThreads = threads.map((thread) => ({
@@ -234,17 +237,29 @@ export const POST = withCsrfProtection(
 
         const validatedData = validation.data as ForumThreadData;
 
-        // Generate unique slug for thread
+        // Generate unique slug for thread, checking a batch of candidate
+        // slugs per query instead of probing them one at a time
         const baseSlug = generateSlug(validatedData.title);
-        let threadSlug = baseSlug;
-        let counter = 1;
+        let threadSlug: string | undefined;
 
-        // Ensure slug is unique
-        while (
-          await prisma.forumThread.findFirst({ where: { slug: threadSlug } })
+        for (
+          let start = 0;
+          threadSlug === undefined;
+          start += SLUG_CANDIDATE_BATCH_SIZE
         ) {
-          threadSlug = `${baseSlug}-${counter}`;
-          counter += 1;
+          const candidates = slugCandidates(
+            baseSlug,
+            start,
+            SLUG_CANDIDATE_BATCH_SIZE
+          );
+          const taken = await prisma.forumThread.findMany({
+            where: { slug: { in: candidates } },
+            select: { slug: true },
+          });
+          const takenSlugs = new Set(taken.map((thread) => thread.slug));
+          threadSlug = candidates.find(
+            (candidate) => !takenSlugs.has(candidate)
+          );
         }
 
         logger.info("Creating new thread", {
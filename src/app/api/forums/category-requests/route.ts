@@ -70,6 +70,7 @@ export const POST = withCsrfProtection(
       // Check if a similar category already exists
       const existingCategory = await prisma.forumCategory.findFirst({
         where: { name: validatedData.name },
+        select: { id: true },
       });
 
       if (existingCategory) {
@@ -91,6 +92,7 @@ export const POST = withCsrfProtection(
           requestedBy: user.id,
           status: "pending",
         },
+        select: { id: true },
       });
 
       logger.info("Duplicate check for category request", {
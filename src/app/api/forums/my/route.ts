@@ -36,52 +36,41 @@ export const GET = withAuth(async (request: NextRequest, { user }) => {
     });
 
     if (type === "threads") {
-      // Get user's threads
-      const threads = await prisma.forumThread.findMany({
-        where: {
-          createdBy: user.id,
-          category: {
-            isActive: true, // Only show threads from active categories
-          },
+      // Get user's threads and the total count for pagination
+      const where = {
+        createdBy: user.id,
+        category: {
+          isActive: true, // Only show threads from active categories
         },
-        include: {
-          category: {
-            select: {
-              id: true,
-              name: true,
-              slug: true,
-              description: true,
-              isActive: true,
-              displayOrder: true,
+      };
+      const [threads, totalThreads] = await Promise.all([
+        prisma.forumThread.findMany({
+          where,
+          include: {
+            category: {
+              select: {
+                id: true,
+                name: true,
+                slug: true,
+                description: true,
+                isActive: true,
+                displayOrder: true,
+              },
             },
-          },
-          posts: {
-            select: {
-              id: true,
+            _count: {
+              select: {
+                posts: true,
+              },
             },
           },
-          _count: {
-            select: {
-              posts: true,
-            },
+          orderBy: {
+            updatedDate: "desc", // Most recently updated first
           },
-        },
-        orderBy: {
-          updatedDate: "desc", // Most recently updated first
-        },
-        skip: offset,
-        take: limit,
-      });
-
-      // Get total count for pagination
-      const totalThreads = await prisma.forumThread.count({
-        where: {
-          createdBy: user.id,
-          category: {
-            isActive: true,
-          },
-        },
-      });
+          skip: offset,
+          take: limit,
+        }),
+        prisma.forumThread.count({ where }),
+      ]);
 
       const totalPages = Math.ceil(totalThreads / limit);
 
@@ -133,51 +122,43 @@ export const GET = withAuth(async (request: NextRequest, { user }) => {
       return response;
     } else {
       // type === "posts"
-      // Get user's posts
-      const posts = await prisma.forumPost.findMany({
-        where: {
-          createdBy: user.id,
-          thread: {
-            category: {
-              isActive: true, // Only show posts from active categories
-            },
+      // Get user's posts and the total count for pagination
+      const where = {
+        createdBy: user.id,
+        thread: {
+          category: {
+            isActive: true, // Only show posts from active categories
           },
         },
-        include: {
-          thread: {
-            select: {
-              id: true,
-              title: true,
-              slug: true,
-              categoryId: true,
-              category: {
-                select: {
-                  id: true,
-                  name: true,
-                  slug: true,
+      };
+      const [posts, totalPosts] = await Promise.all([
+        prisma.forumPost.findMany({
+          where,
+          include: {
+            thread: {
+              select: {
+                id: true,
+                title: true,
+                slug: true,
+                categoryId: true,
+                category: {
+                  select: {
+                    id: true,
+                    name: true,
+                    slug: true,
+                  },
                 },
               },
             },
           },
-        },
-        orderBy: {
-          createdDate: "desc", // Most recent posts first
-        },
-        skip: offset,
-        take: limit,
-      });
-
-      // Get total count for pagination
-      const totalPosts = await prisma.forumPost.count({
-        where: {
-          createdBy: user.id,
-          thread: {
-            category: {
-              isActive: true,
-            },
+          orderBy: {
+            createdDate: "desc", // Most recent posts first
           },
-        },
-      });
+          skip: offset,
+          take: limit,
+        }),
+        prisma.forumPost.count({ where }),
+      ]);
 
       const totalPages = Math.ceil(totalPosts / limit);
 
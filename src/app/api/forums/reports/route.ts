@@ -77,25 +77,48 @@ export const POST = withCsrfProtection(
         reason: reportData.reason,
       });
 
-      // Verify thread exists and is accessible
-      const thread = await prisma.forumThread.findFirst({
-        where: {
-          id: threadId,
-          category: {
-            isActive: true,
+      // Verify the thread is accessible, that a reported post belongs to
+      // it, and that this user hasn't reported it already. The lookups are
+      // independent, so run them together.
+      const [thread, post, existingReport] = await Promise.all([
+        prisma.forumThread.findFirst({
+          where: {
+            id: threadId,
+            category: {
+              isActive: true,
+            },
           },
-        },
-        select: {
-          id: true,
-          title: true,
-          category: {
-            select: {
-              name: true,
-              slug: true,
+          select: {
+            id: true,
+            title: true,
+            category: {
+              select: {
+                name: true,
+                slug: true,
+              },
             },
           },
-        },
-      });
+        }),
+        postId
+          ? prisma.forumPost.findFirst({
+              where: {
+                id: postId,
+                threadId: threadId,
+              },
+              select: {
+                id: true,
+              },
+            })
+          : null,
+        prisma.forumReport.findFirst({
+          where: {
+            threadId: threadId,
+            postId: postId,
+            reportedBy: user.id,
+          },
+          select: { id: true },
+        }),
+      ]);
 
       if (!thread) {
         return NextResponse.json(
@@ -104,36 +127,13 @@ export const POST = withCsrfProtection(
         );
       }
 
-      // If reporting a post, verify it exists and belongs to the thread
-      if (postId) {
-        const post = await prisma.forumPost.findFirst({
-          where: {
-            id: postId,
-            threadId: threadId,
-          },
-          select: {
-            id: true,
-          },
-        });
-
-        if (!post) {
-          return NextResponse.json(
-            { error: { message: "Post not found in this thread", code: 404 } },
-            { status: 404 }
-          );
-        }
+      if (postId && !post) {
+        return NextResponse.json(
+          { error: { message: "Post not found in this thread", code: 404 } },
+          { status: 404 }
+        );
       }
 
-      // Check for duplicate report from the same user
-      const existingReport = await prisma.forumReport.findFirst({
-        where: {
-          threadId: threadId,
-          postId: postId,
-          reportedBy: user.id,
-        },
-        select: { id: true },
-      });
-
       if (existingReport) {
         return NextResponse.json(
           {
@@ -223,7 +223,7 @@ export const POST = withCsrfProtection(
       try {
         // Get the category information that we need for the email
         const thread = await prisma.forumThread.findUnique({
-          where: { id: report.threadId },
+          where: { id: threadId },
           include: {
             category: {
               select: {
@@ -234,7 +234,7 @@ export const POST = withCsrfProtection(
           },
         });
 
-        if (thread) {
+        if (thread && report.thread) {
           const reportData = {
             id: report.id,
             thread: {
@@ -303,12 +303,14 @@ export const POST = withCsrfProtection(
           first_name: report.reporter.firstName,
           last_name: report.reporter.lastName,
         },
-        thread: {
-          id: report.thread.id,
-          title: report.thread.title,
-          slug: report.thread.slug,
-          category_id: report.thread.categoryId,
-        },
+        thread: report.thread
+          ? {
+              id: report.thread.id,
+              title: report.thread.title,
+              slug: report.thread.slug,
+              category_id: report.thread.categoryId,
+            }
+          : null,
         post: report.post
           ? {
               id: report.post.id,
@@ -412,16 +414,19 @@ export const GET = withAuth(async (request: NextRequest, { user }) => {
         report.createdDate?.toISOString() ?? new Date().toISOString(),
       reviewed_date: report.reviewedDate?.toISOString() || null,
       resolution_notes: report.resolutionNotes,
-      thread: {
-        id: report.thread.id,
-        title: report.thread.title,
-        slug: report.thread.slug,
-        category_id: report.thread.categoryId,
-        category: {
-          name: report.thread.category.name,
-          slug: report.thread.category.slug,
-        },
-      },
+      // The thread is cleared once it has been deleted
+      thread: report.thread
+        ? {
+            id: report.thread.id,
+            title: report.thread.title,
+            slug: report.thread.slug,
+            category_id: report.thread.categoryId,
+            category: {
+              name: report.thread.category.name,
+              slug: report.thread.category.slug,
+            },
+          }
+        : null,
       post: report.post
         ? {
             id: report.post.id,
@@ -178,45 +178,41 @@ export const POST = withCsrfProtection(
           throw new BadRequestError("Validation failed - no data");
         }
 
-        // Check if post exists
-        const post = await prisma.helpWantedPost.findUnique({
-          where: { id: postId },
-          select: { id: true },
-        });
+        // Check that the post exists and, if parent_id is provided, that the
+        // parent comment exists. The lookups are independent, so run both
+        // at once.
+        const parentId = validation.data.parent_id;
+        const [post, parentComment] = await Promise.all([
+          prisma.helpWantedPost.findUnique({
+            where: { id: postId },
+            select: { id: true },
+          }),
+          parentId
+            ? prisma.helpWantedComment.findUnique({
+                where: { id: parentId },
+                select: { postId: true },
+              })
+            : null,
+        ]);
 
         if (!post) {
           throw new NotFoundError("Help wanted post not found");
         }
 
-        // If parent_id is provided, check if parent comment exists and belongs to the same post
-        if (validation.data.parent_id) {
-          const parentComment = await prisma.helpWantedComment.findUnique({
-            where: { id: validation.data.parent_id },
-            select: { postId: true },
-          });
-
-          if (!parentComment || parentComment.postId !== postId) {
-            throw new BadRequestError("Invalid parent comment");
-          }
+        // The parent comment must belong to the same post
+        if (parentId && (!parentComment || parentComment.postId !== postId)) {
+          throw new BadRequestError("Invalid parent comment");
         }
 
-        // Create comment
+        // Create comment. The creator is the authenticated user, so it is
+        // taken from the session rather than loaded back from the database.
         const comment = await prisma.helpWantedComment.create({
           data: {
             postId: postId,
             content: validation.data.content,
-            parentId: validation.data.parent_id,
+            parentId: parentId,
             createdBy: user.id,
           },
-          include: {
-            creator: {
-              select: {
-                id: true,
-                firstName: true,
-                lastName: true,
-              },
-            },
-          },
         });
 
         // Transform data to match the expected API format
@@ -227,13 +223,11 @@ export const POST = withCsrfProtection(
           parent_id: comment.parentId,
           created_date: comment.createdDate?.toISOString(),
           updated_date: comment.updatedDate?.toISOString(),
-          creator: comment.creator
-            ? {
-                id: comment.creator.id,
-                first_name: comment.creator.firstName,
-                last_name: comment.creator.lastName,
-              }
-            : undefined,
+          creator: {
+            id: user.id,
+            first_name: user.firstName,
+            last_name: user.lastName,
+          },
         };
 
         return NextResponse.json(transformedComment, { status: 201 });
@@ -9,12 +9,18 @@ import {
 } from "@/lib/errors";
 import { prisma } from "@/lib/db/client";
 
+const REPORT_REASONS = new Set([
+  "spam",
+  "inappropriate",
+  "misleading",
+  "other",
+]);
+
 // Validation helper for reports
 function validateReport(data: Record<string, unknown>) {
   const errors: string[] = [];
 
-  const validReasons = ["spam", "inappropriate", "misleading", "other"];
-  if (!data["reason"] || !validReasons.includes(data["reason"] as string)) {
+  if (!data["reason"] || !REPORT_REASONS.has(data["reason"] as string)) {
     errors.push(
       "Reason must be one of: spam, inappropriate, misleading, other"
     );
@@ -80,64 +86,63 @@ export const POST = withCsrfProtection(
           throw new BadRequestError("Validation failed - no data");
         }
 
-        // Check if post exists
-        const post = await prisma.helpWantedPost.findUnique({
-          where: { id: postId },
-          select: { id: true },
-        });
+        // Check that the post exists and that this user hasn't reported it
+        // already. The lookups are independent, so run them together.
+        const [post, existingReport] = await Promise.all([
+          prisma.helpWantedPost.findUnique({
+            where: { id: postId },
+            select: { id: true },
+          }),
+          prisma.helpWantedReport.findFirst({
+            where: { postId: postId, reportedBy: user.id },
+            select: { id: true },
+          }),
+        ]);
 
         if (!post) {
           throw new NotFoundError("Help wanted post not found");
         }
 
-        // Check if user has already reported this post
-        const existingReport = await prisma.helpWantedReport.findFirst({
-          where: {
-            postId: postId,
-            reportedBy: user.id,
-          },
-        });
-
         if (existingReport) {
           throw new BadRequestError("You have already reported this post");
         }
 
-        // Create report
-        const report = await prisma.helpWantedReport.create({
-          data: {
-            postId: postId,
-            reason: validation.data.reason,
-            details: validation.data.details,
-            status: "pending",
-            reportedBy: user.id,
-          },
-          include: {
-            reporter: {
-              select: {
-                id: true,
-                firstName: true,
-                lastName: true,
-                email: true,
-              },
+        // Create the report and update the post's report count together
+        const [report] = await prisma.$transaction([
+          prisma.helpWantedReport.create({
+            data: {
+              postId: postId,
+              reason: validation.data.reason,
+              details: validation.data.details,
+              status: "pending",
+              reportedBy: user.id,
             },
-            post: {
-              select: {
-                id: true,
-                title: true,
+            include: {
+              reporter: {
+                select: {
+                  id: true,
+                  firstName: true,
+                  lastName: true,
+                  email: true,
+                },
+              },
+              post: {
+                select: {
+                  id: true,
+                  title: true,
+                },
               },
             },
-          },
-        });
-
-        // Update post report count
-        await prisma.helpWantedPost.update({
-          where: { id: postId },
-          data: {
-            reportCount: {
-              increment: 1,
+          }),
+          prisma.helpWantedPost.update({
+            where: { id: postId },
+            data: {
+              reportCount: {
+                increment: 1,
+              },
             },
-          },
-        });
+          }),
+        ]);
 
         // Transform data to match the expected API format
         const transformedReport = {
@@ -10,6 +10,9 @@ import {
 } from "@/lib/errors";
 import { prisma } from "@/lib/db/client";
 
+const HELP_WANTED_CATEGORIES = new Set(["hiring", "collaboration", "general"]);
+const HELP_WANTED_STATUSES = new Set(["open", "closed"]);
+
 // Validation helper for help wanted post updates
 function validateHelpWantedPostUpdate(data: Record<string, unknown>) {
   const errors: string[] = [];
@@ -35,15 +38,13 @@ function validateHelpWantedPostUpdate(data: Record<string, unknown>) {
   }
 
   if (data["category"] !== undefined) {
-    const validCategories = ["hiring", "collaboration", "general"];
-    if (!validCategories.includes(data["category"] as string)) {
+    if (!HELP_WANTED_CATEGORIES.has(data["category"] as string)) {
       errors.push("Category must be one of: hiring, collaboration, general");
     }
   }
 
   if (data["status"] !== undefined) {
-    const validStatuses = ["open", "closed"];
-    if (!validStatuses.includes(data["status"] as string)) {
+    if (!HELP_WANTED_STATUSES.has(data["status"] as string)) {
       errors.push("Status must be one of: open, closed");
     }
   }
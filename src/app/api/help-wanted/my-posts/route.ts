@@ -1,14 +1,39 @@
 import { NextRequest, NextResponse } from "next/server";
 import { withAuth } from "@/lib/auth/middleware";
-import { handleApiError } from "@/lib/errors";
+import { BadRequestError, handleApiError } from "@/lib/errors";
 import { prisma } from "@/lib/db/client";
+import { PAGINATION_LIMITS, paginationUtils } from "@/lib/constants/pagination";
+import {
+  decodeHelpWantedPostCursor,
+  encodeHelpWantedPostCursor,
+  helpWantedPostsAfterCursor,
+} from "@/lib/utils/cursor";
 
 // GET /api/help-wanted/my-posts - Get user's help wanted posts
-export const GET = withAuth(async (_request: NextRequest, { user }) => {
+//
+// Without a "limit" the full list is returned as an array. With one, the
+// response is a page of { posts, next_cursor }; pass next_cursor back as
+// "after" to continue from the last post of the previous page.
+export const GET = withAuth(async (request: NextRequest, { user }) => {
   try {
+    const { searchParams } = new URL(request.url);
+    const paginated = searchParams.has("limit");
+    const limit = paginationUtils.validateLimit(
+      searchParams.get("limit"),
+      PAGINATION_LIMITS.HELP_WANTED_MY_POSTS_MAX_LIMIT,
+      PAGINATION_LIMITS.HELP_WANTED_MY_POSTS_DEFAULT_LIMIT
+    );
+
+    const after = searchParams.get("after");
+    const afterPost = after ? decodeHelpWantedPostCursor(after) : null;
+    if (after && !afterPost) {
+      throw new BadRequestError("Invalid cursor");
+    }
+
     const posts = await prisma.helpWantedPost.findMany({
       where: {
         createdBy: user.id,
+        ...(paginated && afterPost && helpWantedPostsAfterCursor(afterPost)),
       },
       include: {
         creator: {
@@ -19,11 +44,6 @@ export const GET = withAuth(async (_request: NextRequest, { user }) => {
             email: true,
           },
         },
-        comments: {
-          select: {
-            id: true,
-          },
-        },
         _count: {
           select: {
             comments: true,
@@ -31,9 +51,11 @@ export const GET = withAuth(async (_request: NextRequest, { user }) => {
           },
         },
       },
-      orderBy: {
-        createdDate: "desc",
-      },
+      orderBy: [{ createdDate: "desc" }, { id: "desc" }],
+      // Keyset pagination: continue after the cursor's (created_date, id)
+      // rather than skipping an offset, so later pages cost the same as the
+      // first
+      ...(paginated && { take: limit }),
     });
 
     // Transform data to match the expected API format
@@ -60,7 +82,17 @@ export const GET = withAuth(async (_request: NextRequest, { user }) => {
       comment_count: post._count.comments,
     }));
 
-    return NextResponse.json(transformedPosts);
+    if (!paginated) {
+      return NextResponse.json(transformedPosts);
+    }
+
+    // A full page may have a successor; hand out a cursor for it
+    const lastPost = posts.length === limit ? posts[posts.length - 1] : null;
+
+    return NextResponse.json({
+      posts: transformedPosts,
+      next_cursor: lastPost ? encodeHelpWantedPostCursor(lastPost) : null,
+    });
   } catch (error) {
     return handleApiError(error, "GET /api/help-wanted/my-posts");
   }
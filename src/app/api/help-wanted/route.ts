@@ -7,33 +7,11 @@ import {
   RateLimitError,
   ValidationError,
 } from "@/lib/errors";
+import { checkRateLimit } from "@/lib/utils/rateLimit";
 import { prisma } from "@/lib/db/client";
 import { apiCache } from "@/lib/cache";
 
-// Rate limiting storage (in-memory for now)
-const rateLimitStore = new Map<number, { count: number; resetTime: number }>();
-
-function checkRateLimit(userId: number, limitPerHour: number): boolean {
-  const now = Date.now();
-  const hourInMs = 60 * 60 * 1000;
-
-  const userLimits = rateLimitStore.get(userId);
-
-  // If no record exists or the hour has passed, reset
-  if (!userLimits || now >= userLimits.resetTime) {
-    rateLimitStore.set(userId, { count: 1, resetTime: now + hourInMs });
-    return true;
-  }
-
-  // Check if under the limit
-  if (userLimits.count >= limitPerHour) {
-    return false;
-  }
-
-  // Increment count
-  userLimits.count += 1;
-  return true;
-}
+const HELP_WANTED_CATEGORIES = new Set(["hiring", "collaboration", "general"]);
 
 // Validation helper for help wanted posts
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -59,8 +37,7 @@ function validateHelpWantedPost(data: any) {
     errors.push("Description is required");
   }
 
-  const validCategories = ["hiring", "collaboration", "general"];
-  if (!data.category || !validCategories.includes(data.category as string)) {
+  if (!data.category || !HELP_WANTED_CATEGORIES.has(data.category)) {
     errors.push("Category must be one of: hiring, collaboration, general");
   }
 
@@ -222,7 +199,7 @@ export const POST = withCsrfProtection(
     async (request: NextRequest, { user }: { user: AuthenticatedUser }) => {
       try {
         // Rate limiting: 10 requests per hour per user
-        if (!checkRateLimit(user.id, 10)) {
+        if (!checkRateLimit(user.id, "help-wanted-post", 10)) {
           throw new RateLimitError();
         }
 
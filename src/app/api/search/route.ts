@@ -2,6 +2,7 @@ import { NextRequest, NextResponse } from "next/server";
 import { Client } from "@opensearch-project/opensearch";
 import { handleApiError, BadRequestError } from "@/lib/errors";
 import { metrics } from "@/lib/monitoring/metrics";
+import { stripTags } from "@/lib/utils/strip-tags";
 
 // Rate limiting could be added here similar to other endpoints
 // For now, we'll implement the core search functionality
@@ -29,15 +30,60 @@ interface SearchResult {
 interface SearchResponse {
   query: string;
   total: number;
+  total_relation: "eq" | "gte";
   page: number;
   size: number;
   total_pages: number;
   has_next: boolean;
   has_prev: boolean;
+  next_cursor: string | null;
   results: SearchResult[];
   error?: string;
 }
 
+// Exact hit counts beyond this are not worth counting every shard for
+const SEARCH_TOTAL_HITS_LIMIT = 10000;
+
+// Query-independent parts of the search body, built once at module load;
+// each request only adds the query text and its paging window
+const SEARCH_MULTI_MATCH_OPTIONS = {
+  fields: ["title^3", "description^2", "content", "category"],
+  type: "best_fields" as const,
+  fuzziness: "AUTO" as const,
+};
+
+const SEARCH_BODY_TEMPLATE = {
+  // Full page content can be several KB per hit; the excerpt comes from the
+  // content_preview field the indexer stores alongside it
+  _source: { excludes: ["content"] },
+  highlight: {
+    fields: {
+      title: {},
+      description: {},
+      content: { fragment_size: 300, number_of_fragments: 3 },
+    },
+  },
+  // resource_id breaks score ties so search_after has a total order
+  sort: [{ _score: "desc" as const }, { resource_id: "asc" as const }],
+  // Stop counting matches past this bound so OpenSearch can terminate
+  // early; totals above it are reported as a lower bound
+  track_total_hits: SEARCH_TOTAL_HITS_LIMIT,
+};
+
+// Reuse one OpenSearch client (and its keep-alive connection pool) across
+// requests instead of paying a TCP/TLS handshake on every search
+declare global {
+  var __opensearchClient: Client | undefined;
+}
+
+// Transport settings shared by every connection to the cluster
+const OPENSEARCH_TRANSPORT_OPTIONS = {
+  maxRetries: 2,
+  requestTimeout: 5000,
+  suggestCompression: true,
+  agent: { keepAlive: true, maxSockets: 25 },
+};
+
 // Initialize OpenSearch client
 function createOpenSearchClient() {
   const opensearchHost = process.env["OPENSEARCH_HOST"] || "opensearch-service";
@@ -46,6 +92,7 @@ function createOpenSearchClient() {
 
   const baseConfig = {
     node: `${useHttps ? "https" : "http"}://${opensearchHost}:${opensearchPort}`,
+    ...OPENSEARCH_TRANSPORT_OPTIONS,
   };
 
   // Only add SSL config if using HTTPS
@@ -61,6 +108,43 @@ function createOpenSearchClient() {
   return new Client(baseConfig);
 }
 
+function getOpenSearchClient(): Client {
+  if (!globalThis.__opensearchClient) {
+    globalThis.__opensearchClient = createOpenSearchClient();
+  }
+  return globalThis.__opensearchClient;
+}
+
+/**
+ * Encode a hit's sort values ([score, resource_id]) as an opaque cursor
+ */
+function encodeSearchCursor(sortValues: unknown[]): string {
+  return Buffer.from(JSON.stringify(sortValues)).toString("base64url");
+}
+
+/**
+ * Decode a cursor produced by encodeSearchCursor.
+ * Returns null for anything malformed.
+ */
+function decodeSearchCursor(value: string): [number, number] | null {
+  try {
+    const decoded = JSON.parse(Buffer.from(value, "base64url").toString());
+
+    if (
+      !Array.isArray(decoded) ||
+      decoded.length !== 2 ||
+      typeof decoded[0] !== "number" ||
+      !Number.isInteger(decoded[1])
+    ) {
+      return null;
+    }
+
+    return [decoded[0], decoded[1]];
+  } catch {
+    return null;
+  }
+}
+
 export async function GET(request: NextRequest): Promise<NextResponse> {
   try {
     const { searchParams } = new URL(request.url);
@@ -77,30 +161,27 @@ export async function GET(request: NextRequest): Promise<NextResponse> {
     );
 
     const offset = (page - 1) * size;
+
+    // Deep pages: "after" continues from the last hit of the previous page
+    // with search_after, so OpenSearch does not collect and discard every
+    // earlier hit the way from/size does
+    const after = searchParams.get("after");
+    const searchAfter = after ? decodeSearchCursor(after) : null;
+    if (after && !searchAfter) {
+      throw new BadRequestError("Invalid cursor");
+    }
     const namespace = process.env["NAMESPACE"] || "community";
     const indexName = `${namespace}-resources`;
 
-    // Create OpenSearch client
-    const client = createOpenSearchClient();
+    const client = getOpenSearchClient();
 
     // Build search query body (matching Flask implementation)
     const searchBody = {
+      ...SEARCH_BODY_TEMPLATE,
       query: {
-        multi_match: {
-          query: query,
-          fields: ["title^3", "description^2", "content", "category"],
-          type: "best_fields" as const,
-          fuzziness: "AUTO" as const,
-        },
-      },
-      highlight: {
-        fields: {
-          title: {},
-          description: {},
-          content: { fragment_size: 300, number_of_fragments: 3 },
-        },
+        multi_match: { ...SEARCH_MULTI_MATCH_OPTIONS, query: query },
       },
-      from: offset,
+      ...(searchAfter ? { search_after: searchAfter } : { from: offset }),
       size: size,
     };
 
@@ -120,15 +201,15 @@ export async function GET(request: NextRequest): Promise<NextResponse> {
       for (const hit of response.body.hits.hits) {
         const source = hit._source as Record<string, unknown>;
 
-        // Create content excerpt
+        // Create content excerpt. The indexer already trims content_preview
+        // to length; documents indexed before it existed fall back to the
+        // highlighted content fragments, as plain text.
+        const highlightedContent = hit.highlight?.["content"];
         let contentExcerpt = "";
-        if (source?.["content"] && typeof source["content"] === "string") {
-          const contentText = source["content"];
-          if (contentText.length > 800) {
-            contentExcerpt = contentText.substring(0, 800) + "...";
-          } else {
-            contentExcerpt = contentText;
-          }
+        if (typeof source?.["content_preview"] === "string") {
+          contentExcerpt = source["content_preview"];
+        } else if (Array.isArray(highlightedContent)) {
+          contentExcerpt = stripTags(highlightedContent.join(" ... "));
         }
 
         const displayDescription =
@@ -189,16 +270,36 @@ export async function GET(request: NextRequest): Promise<NextResponse> {
             typeof totalHitsObj.value === "number"
           ? totalHitsObj.value
           : 0;
+    const totalRelation =
+      totalHitsObj &&
+      typeof totalHitsObj === "object" &&
+      "relation" in totalHitsObj &&
+      totalHitsObj.relation === "gte"
+        ? "gte"
+        : "eq";
     const totalPages = Math.ceil(totalHits / size);
 
+    // A full page may have a successor; hand out a cursor for it
+    const hits = response.body?.hits?.hits ?? [];
+    const lastHit = hits.length === size ? hits[hits.length - 1] : undefined;
+    const nextCursor = lastHit?.sort ? encodeSearchCursor(lastHit.sort) : null;
+
+    // Cursor clients and capped totals cannot rely on total_pages, so a full
+    // page is taken to mean there may be more
+    const hasNext = searchAfter
+      ? nextCursor !== null
+      : page < totalPages || (totalRelation === "gte" && hits.length === size);
+
     const searchResponse: SearchResponse = {
       query: query,
       total: totalHits,
+      total_relation: totalRelation,
       page: page,
       size: size,
       total_pages: totalPages,
-      has_next: page < totalPages,
-      has_prev: page > 1,
+      has_next: hasNext,
+      has_prev: searchAfter !== null || page > 1,
+      next_cursor: nextCursor,
       results: results,
     };
 
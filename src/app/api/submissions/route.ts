@@ -9,41 +9,17 @@ import {
   RateLimitError,
   ValidationError,
 } from "@/lib/errors";
+import { checkRateLimit } from "@/lib/utils/rateLimit";
 import { sendSubmissionNotification } from "@/lib/email/admin-notifications";
 import { metrics } from "@/lib/monitoring/metrics";
 import { logger } from "@/lib/logger";
 
-// Rate limiting storage (in-memory for now)
-const rateLimitStore = new Map<number, { count: number; resetTime: number }>();
-
-function checkRateLimit(userId: number, limitPerHour: number): boolean {
-  const now = Date.now();
-  const hourInMs = 60 * 60 * 1000;
-
-  const userLimits = rateLimitStore.get(userId);
-
-  // If no record exists or the hour has passed, reset
-  if (!userLimits || now >= userLimits.resetTime) {
-    rateLimitStore.set(userId, { count: 1, resetTime: now + hourInMs });
-    return true;
-  }
-
-  // Check if under the limit
-  if (userLimits.count >= limitPerHour) {
-    return false;
-  }
-
-  // Increment count
-  userLimits.count += 1;
-  return true;
-}
-
 // POST /api/submissions - Create a new card submission
 export const POST = withCsrfProtection(
   withAuth(async (request: NextRequest, { user }) => {
     try {
       // Rate limiting: 10 requests per hour per user
-      if (!checkRateLimit(user.id, 10)) {
+      if (!checkRateLimit(user.id, "card-submission", 10)) {
         throw new RateLimitError();
       }
 
@@ -116,20 +92,24 @@ export const POST = withCsrfProtection(
       if (validation.data.tagsText)
         submissionData.tags_text = validation.data.tagsText;
 
-      const submission =
-        await submissionQueries.createSubmission(submissionData);
+      const submitter = {
+        id: user.id,
+        firstName: user.firstName,
+        lastName: user.lastName,
+        email: user.email,
+      };
+
+      const submission = await submissionQueries.createSubmission(
+        submissionData,
+        submitter
+      );
 
       // Track business submission in metrics
       metrics.incrementCounter("businessSubmissions");
 
       // Send email notification to admins
       try {
-        await sendSubmissionNotification(submission, {
-          id: user.id,
-          firstName: user.firstName,
-          lastName: user.lastName,
-          email: user.email,
-        });
+        await sendSubmissionNotification(submission, submitter);
       } catch (emailError) {
         // Log email error but don't fail the submission
         logger.error(
@@ -4,6 +4,7 @@ import { logger } from "@/lib/logger";
 import { checkDatabaseHealth } from "@/lib/db/client";
 import { PAGINATION_LIMITS, paginationUtils } from "@/lib/constants/pagination";
 import { handleApiError } from "@/lib/errors";
+import { apiCache } from "@/lib/cache";
 
 // Cache for 5 minutes (300 seconds) to match Flask API
 export const revalidate = 300;
@@ -23,6 +24,18 @@ export async function GET(request: NextRequest) {
       PAGINATION_LIMITS.TAGS_DEFAULT_LIMIT
     );
 
+    // Serve from the in-process cache when possible. Tag counts only change
+    // on card approval/edits and the response is already publicly cacheable
+    // for 5 minutes, so a 1 minute server-side TTL is safe.
+    const cacheKey = `tags:${limit}:${offset}`;
+    const cachedTags = apiCache.get(cacheKey);
+    if (cachedTags) {
+      const response = NextResponse.json(cachedTags);
+      response.headers.set("Cache-Control", "public, max-age=300");
+      response.headers.set("X-Cache", "HIT");
+      return response;
+    }
+
     // Check if database is available first (important for Docker builds)
     const dbHealth = await checkDatabaseHealth();
     if (dbHealth.status !== "healthy") {
@@ -49,11 +62,14 @@ export async function GET(request: NextRequest) {
 
     logger.info(`Returning ${transformedTags.length} tags`);
 
+    apiCache.set(cacheKey, transformedTags, 60);
+
     // Return response matching Flask API format
     const response = NextResponse.json(transformedTags);
 
     // Set cache headers to match Flask API
     response.headers.set("Cache-Control", "public, max-age=300");
+    response.headers.set("X-Cache", "MISS");
 
     return response;
   } catch (error) {
@@ -2,9 +2,8 @@ import { NextRequest, NextResponse } from "next/server";
 import { withAuth } from "@/lib/auth/middleware";
 import { isCsrfExempt, validateCsrfToken } from "@/lib/auth/csrf";
 import { v4 as uuidv4 } from "uuid";
-import { v2 as cloudinary } from "cloudinary";
-import { S3Client, PutObjectCommand } from "@aws-sdk/client-s3";
-import { writeFile, mkdir } from "fs/promises";
+import type { UploadApiResponse, v2 as CloudinarySdk } from "cloudinary";
+import { writeFile, mkdir, open, unlink } from "fs/promises";
 import { existsSync } from "fs";
 import path from "path";
 import { logger } from "@/lib/logger";
@@ -78,9 +77,16 @@ async function parseMultipartForTests(
   return null;
 }
 
+/**
+ * Lowercased extension after the last dot, or "" when there is none
+ */
+function getFileExtension(filename: string): string {
+  const dot = filename.lastIndexOf(".");
+  return dot === -1 ? "" : filename.slice(dot + 1).toLowerCase();
+}
+
 function isAllowedFile(filename: string): boolean {
-  const ext = filename.toLowerCase().split(".").pop();
-  return ext ? ALLOWED_EXTENSIONS.has(ext) : false;
+  return ALLOWED_EXTENSIONS.has(getFileExtension(filename));
 }
 
 function makeFilenameSecure(filename: string): string {
@@ -108,21 +114,39 @@ function isCloudinaryConfigured(): boolean {
   );
 }
 
-function configureCloudinary(): void {
+// Credentials last applied with cloudinary.config(), so repeat uploads
+// with unchanged settings skip reconfiguring the SDK
+let appliedCloudinaryConfig: string | null = null;
+
+/**
+ * Apply the Cloudinary credentials from the environment to the SDK.
+ * Returns the configured SDK, or null when the credentials are incomplete.
+ * The SDK is imported on first use, so deployments storing uploads
+ * elsewhere never load it.
+ */
+async function configureCloudinary(): Promise<typeof CloudinarySdk | null> {
   const cloudName = process.env["CLOUDINARY_CLOUD_NAME"];
   const apiKey = process.env["CLOUDINARY_API_KEY"];
   const apiSecret = process.env["CLOUDINARY_API_SECRET"];
 
   if (!cloudName || !apiKey || !apiSecret) {
-    throw new Error("Cloudinary configuration is incomplete");
+    return null;
+  }
+
+  const { v2: cloudinary } = await import("cloudinary");
+
+  const configKey = `${cloudName}\0${apiKey}\0${apiSecret}`;
+  if (configKey !== appliedCloudinaryConfig) {
+    cloudinary.config({
+      cloud_name: cloudName,
+      api_key: apiKey,
+      api_secret: apiSecret,
+      secure: true,
+    });
+    appliedCloudinaryConfig = configKey;
   }
 
-  cloudinary.config({
-    cloud_name: cloudName,
-    api_key: apiKey,
-    api_secret: apiSecret,
-    secure: true,
-  });
+  return cloudinary;
 }
 
 function isS3Configured(): boolean {
@@ -154,6 +178,9 @@ async function uploadToS3(
     const secretAccessKey = process.env["S3_SECRET_ACCESS_KEY"]!;
     const region = process.env["S3_REGION"] || "us-east-1";
 
+    // Imported on first use, like the Cloudinary SDK
+    const { S3Client, PutObjectCommand } = await import("@aws-sdk/client-s3");
+
     const s3Client = new S3Client({
       region,
       endpoint,
@@ -169,7 +196,7 @@ async function uploadToS3(
     const key = `uploads/${uniqueFilename}`;
 
     // Determine content type
-    const ext = filename.toLowerCase().split(".").pop();
+    const ext = getFileExtension(filename);
     const contentTypeMap: Record<string, string> = {
       png: "image/png",
       jpg: "image/jpeg",
@@ -177,7 +204,7 @@ async function uploadToS3(
       gif: "image/gif",
       webp: "image/webp",
     };
-    const contentType = contentTypeMap[ext || ""] || "application/octet-stream";
+    const contentType = contentTypeMap[ext] || "application/octet-stream";
 
     const command = new PutObjectCommand({
       Bucket: bucket,
@@ -205,39 +232,45 @@ async function uploadToS3(
   }
 }
 
-async function uploadToCloudinary(
-  fileBuffer: ArrayBuffer,
-  filename: string
-): Promise<{
+async function uploadToCloudinary(fileBuffer: ArrayBuffer): Promise<{
   success: boolean;
   url?: string;
   publicId?: string;
   error?: string;
 }> {
   try {
-    if (!isCloudinaryConfigured()) {
+    const cloudinary = await configureCloudinary();
+    if (!cloudinary) {
       return { success: false, error: "Cloudinary not configured" };
     }
 
-    configureCloudinary();
-
-    // Convert ArrayBuffer to base64 for Cloudinary
-    const base64File = Buffer.from(fileBuffer).toString("base64");
-    const dataUrl = `data:image/${filename.split(".").pop()};base64,${base64File}`;
-
-    const result = await cloudinary.uploader.upload(dataUrl, {
-      folder: "cityforge/uploads",
-      resource_type: "image",
-      format: "auto", // Auto-optimize format (WebP when supported)
-      quality: "auto:good", // Auto-optimize quality
-      fetch_format: "auto", // Deliver optimal format
-      flags: "progressive", // Progressive JPEG for better loading
-      transformation: [
-        { quality: "auto:good" },
-        { fetch_format: "auto" },
-        { width: 800, height: 600, crop: "limit" }, // Limit max size
-        { flags: "progressive" },
-      ],
+    // Stream the raw bytes rather than inflating them into a base64 data URL
+    const result = await new Promise<UploadApiResponse>((resolve, reject) => {
+      cloudinary.uploader
+        .upload_stream(
+          {
+            folder: "cityforge/uploads",
+            resource_type: "image",
+            format: "auto", // Auto-optimize format (WebP when supported)
+            quality: "auto:good", // Auto-optimize quality
+            fetch_format: "auto", // Deliver optimal format
+            flags: "progressive", // Progressive JPEG for better loading
+            transformation: [
+              { quality: "auto:good" },
+              { fetch_format: "auto" },
+              { width: 800, height: 600, crop: "limit" }, // Limit max size
+              { flags: "progressive" },
+            ],
+          },
+          (error, response) => {
+            if (error || !response) {
+              reject(error ?? new Error("Empty response from Cloudinary"));
+              return;
+            }
+            resolve(response);
+          }
+        )
+        .end(Buffer.from(fileBuffer));
     });
 
     logger.info(
@@ -254,8 +287,38 @@ async function uploadToCloudinary(
   }
 }
 
+/**
+ * Stream an uploaded file to a new file on disk chunk by chunk, rather than
+ * materializing the whole upload as one buffer first
+ */
+async function writeUploadToDisk(file: File, filePath: string): Promise<void> {
+  // Files built by the test multipart parser may lack stream()
+  if (typeof file.stream !== "function") {
+    await writeFile(filePath, new Uint8Array(await file.arrayBuffer()), {
+      flag: "wx",
+    });
+    return;
+  }
+
+  // "wx" fails rather than overwriting if the name is somehow taken
+  const handle = await open(filePath, "wx", 0o644);
+  try {
+    const reader = file.stream().getReader();
+    let chunk = await reader.read();
+    while (!chunk.done) {
+      await handle.write(chunk.value);
+      chunk = await reader.read();
+    }
+  } catch (error) {
+    await handle.close();
+    await unlink(filePath).catch(() => undefined);
+    throw error;
+  }
+  await handle.close();
+}
+
 async function uploadToLocal(
-  fileBuffer: ArrayBuffer,
+  file: File,
   filename: string
 ): Promise<{
   success: boolean;
@@ -294,8 +357,7 @@ async function uploadToLocal(
       throw new Error("Invalid file path - outside upload directory");
     }
 
-    const uint8Array = new Uint8Array(fileBuffer);
-    await writeFile(filePath, uint8Array);
+    await writeUploadToDisk(file, filePath);
 
     logger.info(
       `Successfully uploaded file to local storage: ${uniqueFilename}`
@@ -385,11 +447,15 @@ export const POST = withAuth(async (request: NextRequest) => {
       throw new BadRequestError("Invalid file type");
     }
 
-    // Convert file to ArrayBuffer
-    const fileBuffer = await file.arrayBuffer();
+    // S3 and Cloudinary need the whole file in memory; local storage
+    // streams it straight to disk instead
+    const fileBuffer =
+      isS3Configured() || isCloudinaryConfigured()
+        ? await file.arrayBuffer()
+        : null;
 
     // Try S3 first if configured
-    if (isS3Configured()) {
+    if (fileBuffer && isS3Configured()) {
       logger.info("Using S3-compatible storage for file upload");
       const s3Result = await uploadToS3(fileBuffer, file.name);
 
@@ -407,9 +473,9 @@ export const POST = withAuth(async (request: NextRequest) => {
     }
 
     // Try Cloudinary next if configured
-    if (isCloudinaryConfigured()) {
+    if (fileBuffer && isCloudinaryConfigured()) {
       logger.info("Using Cloudinary for file upload");
-      const cloudinaryResult = await uploadToCloudinary(fileBuffer, file.name);
+      const cloudinaryResult = await uploadToCloudinary(fileBuffer);
 
       if (
         cloudinaryResult.success &&
@@ -430,7 +496,7 @@ export const POST = withAuth(async (request: NextRequest) => {
 
     // Fallback to local storage
     logger.info("Using local storage for file upload");
-    const localResult = await uploadToLocal(fileBuffer, file.name);
+    const localResult = await uploadToLocal(file, file.name);
 
     if (localResult.success && localResult.url && localResult.filename) {
       return NextResponse.json({
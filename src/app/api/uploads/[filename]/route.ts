@@ -1,15 +1,17 @@
 import { NextRequest, NextResponse } from "next/server";
-import { readFile } from "fs/promises";
-import { existsSync } from "fs";
+import { stat } from "fs/promises";
+import { createReadStream } from "fs";
+import { Readable } from "stream";
 import path from "path";
 import { logger } from "@/lib/logger";
+import { etagMatches } from "@/lib/utils/etag";
 
 interface RouteParams {
   params: Promise<{ filename: string }>;
 }
 
 export async function GET(
-  _request: NextRequest,
+  request: NextRequest,
   { params }: RouteParams
 ): Promise<NextResponse> {
   const { filename } = await params;
@@ -50,14 +52,12 @@ export async function GET(
     }
 
     // Check if file exists
-    if (!existsSync(filePath)) {
+    const fileStats = await stat(filePath).catch(() => null);
+    if (!fileStats?.isFile()) {
       logger.warn(`File not found: ${filename}`);
       return NextResponse.json({ message: "File not found" }, { status: 404 });
     }
 
-    // Read the file
-    const fileBuffer = await readFile(filePath);
-
     // Determine content type based on file extension
     const ext = filename.toLowerCase().split(".").pop();
     let contentType = "application/octet-stream"; // Default fallback
@@ -78,12 +78,41 @@ export async function GET(
         break;
     }
 
-    // Return the file with appropriate headers
-    return new NextResponse(new Uint8Array(fileBuffer), {
+    // Upload names embed a random UUID and are never rewritten, so the
+    // name itself is a strong validator for the content
+    const etag = `"${filename}"`;
+    const headers: Record<string, string> = {
+      "Content-Type": contentType,
+      "Cache-Control": "public, max-age=31536000, immutable", // Cache for 1 year
+      "Content-Disposition": `inline; filename="${filename}"`,
+      ETag: etag,
+    };
+
+    if (etagMatches(request.headers.get("if-none-match"), etag)) {
+      return new NextResponse(null, { status: 304, headers });
+    }
+
+    // Behind nginx, hand the transfer to its internal uploads location so
+    // the bytes are sent with sendfile(2) and never pass through Node
+    const accelPrefix = process.env["UPLOAD_ACCEL_REDIRECT_PREFIX"];
+    if (accelPrefix) {
+      return new NextResponse(null, {
+        headers: {
+          ...headers,
+          "X-Accel-Redirect": `${accelPrefix.replace(/\/+$/, "")}/${filename}`,
+        },
+      });
+    }
+
+    // Stream the file rather than buffering it in memory
+    const stream = Readable.toWeb(
+      createReadStream(filePath)
+    ) as ReadableStream<Uint8Array>;
+
+    return new NextResponse(stream, {
       headers: {
-        "Content-Type": contentType,
-        "Cache-Control": "public, max-age=31536000, immutable", // Cache for 1 year
-        "Content-Disposition": `inline; filename="${filename}"`,
+        ...headers,
+        "Content-Length": String(fileStats.size),
       },
     });
   } catch (error) {
@@ -99,6 +99,7 @@ export interface CardsResponse {
   total: number;
   offset: number;
   limit: number;
+  next_cursor?: string | null;
 }
 
 export interface SubmissionsResponse {
@@ -217,7 +218,7 @@ export interface HelpWantedComment {
 
 export interface HelpWantedReport {
   id: number;
-  post_id: number;
+  post_id: number | null;
   reason: "spam" | "inappropriate" | "misleading" | "other";
   details?: string;
   status: "pending" | "reviewed" | "resolved";
@@ -346,7 +347,7 @@ export interface ForumPost {
 
 export interface ForumReport {
   id: number;
-  thread_id: number;
+  thread_id: number | null;
   post_id?: number;
   reason: "spam" | "inappropriate" | "harassment" | "off_topic" | "other";
   details?: string;
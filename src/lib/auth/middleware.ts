@@ -176,17 +176,22 @@ export async function authenticate(
       throw new InvalidTokenError("Invalid token format");
     }
 
-    if (await isTokenBlacklisted(jti)) {
-      throw new AuthenticationError("Token has been revoked");
-    }
-
-    // Load user
     const userId = parseInt(payload.sub);
     if (!userId) {
       throw new InvalidTokenError("Invalid token payload");
     }
 
-    const user = await loadUser(userId);
+    // The blacklist check and user load are independent lookups, so run them
+    // concurrently to keep authentication to a single database round trip
+    const [revoked, user] = await Promise.all([
+      isTokenBlacklisted(jti),
+      loadUser(userId),
+    ]);
+
+    if (revoked) {
+      throw new AuthenticationError("Token has been revoked");
+    }
+
     if (!user) {
       throw new AuthenticationError("User not found or inactive");
     }
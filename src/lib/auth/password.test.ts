@@ -54,6 +54,11 @@ describe("Password Utilities", () => {
 
       expect(isValid).toBe(false);
     });
+
+    it("should reject when there is no hash to compare against", async () => {
+      expect(await verifyPassword("TestPassword123!", null)).toBe(false);
+      expect(await verifyPassword("TestPassword123!", undefined)).toBe(false);
+    });
   });
 
   describe("validatePasswordStrength", () => {
@@ -1,20 +1,46 @@
 import bcrypt from "bcrypt";
+import { randomBytes } from "crypto";
+
+const SALT_ROUNDS = 12; // Higher than Flask default for better security
+
+// Hash compared against when there is no real hash (e.g. unknown email), so
+// that a failed lookup costs the same as a failed password check. Computed
+// once on first use.
+let dummyHashPromise: Promise<string> | null = null;
+
+function getDummyHash(): Promise<string> {
+  if (!dummyHashPromise) {
+    dummyHashPromise = bcrypt.hash(
+      randomBytes(16).toString("hex"),
+      SALT_ROUNDS
+    );
+  }
+  return dummyHashPromise;
+}
 
 /**
  * Hash a password using bcrypt
  */
 export async function hashPassword(password: string): Promise<string> {
-  const saltRounds = 12; // Higher than Flask default for better security
-  return bcrypt.hash(password, saltRounds);
+  return bcrypt.hash(password, SALT_ROUNDS);
 }
 
 /**
- * Verify a password against a hash
+ * Verify a password against a hash.
+ *
+ * bcrypt's async API runs on the libuv threadpool, so this never blocks the
+ * event loop. When no hash is given the password is checked against a dummy
+ * hash and false is returned, keeping response timing independent of whether
+ * the account exists.
  */
 export async function verifyPassword(
   password: string,
-  hash: string
+  hash: string | null | undefined
 ): Promise<boolean> {
+  if (!hash) {
+    await bcrypt.compare(password, await getDummyHash());
+    return false;
+  }
   return bcrypt.compare(password, hash);
 }
 
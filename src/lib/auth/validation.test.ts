@@ -1,5 +1,9 @@
 import { describe, it, expect } from "vitest";
-import { validateUserRegistration, validateUserLogin } from "./validation";
+import {
+  validateUserRegistration,
+  validateUserLogin,
+  validateEmailAddress,
+} from "./validation";
 
 describe("Auth Validation", () => {
   describe("validateUserRegistration", () => {
@@ -49,6 +53,21 @@ describe("Auth Validation", () => {
       expect(result.data?.last_name).toBe("Doe");
     });
 
+    it("should keep plain-text names as typed apart from trimming", () => {
+      const data = {
+        email: "test@example.com",
+        password: "ValidPass123",
+        first_name: "  Mary & Jo  ",
+        last_name: "O'Neil",
+      };
+
+      const result = validateUserRegistration(data);
+
+      expect(result.valid).toBe(true);
+      expect(result.data?.first_name).toBe("Mary & Jo");
+      expect(result.data?.last_name).toBe("O'Neil");
+    });
+
     describe("XSS protection (SECURITY)", () => {
       it("should block nested tag XSS bypass attempt", () => {
         const data = {
@@ -639,4 +658,27 @@ describe("Auth Validation", () => {
       );
     });
   });
+
+  describe("validateEmailAddress", () => {
+    it("should return the normalized email", () => {
+      const result = validateEmailAddress("  New.User@Example.COM ");
+
+      expect(result.valid).toBe(true);
+      expect(result.data).toBe("new.user@example.com");
+    });
+
+    it("should reject addresses without a domain suffix", () => {
+      const result = validateEmailAddress("user@localhost");
+
+      expect(result.valid).toBe(false);
+      expect(result.errors?.["email"]).toContain("Invalid email format");
+    });
+
+    it("should reject empty values", () => {
+      const result = validateEmailAddress("   ");
+
+      expect(result.valid).toBe(false);
+      expect(result.errors?.["email"]).toContain("Email is required");
+    });
+  });
 });
@@ -4,6 +4,7 @@
  */
 
 import DOMPurify from "isomorphic-dompurify";
+import { isValidEmailFormat } from "@/lib/validation/email";
 
 export interface ValidationResult<T> {
   valid: boolean;
@@ -24,7 +25,7 @@ export interface UserLoginData {
 }
 
 /**
- * Validate email format using a simple regex
+ * Validate email format
  */
 function validateEmail(email: string): string[] {
   const errors: string[] = [];
@@ -41,8 +42,7 @@ function validateEmail(email: string): string[] {
   }
 
   // Basic email validation
-  const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-  if (!emailRegex.test(email)) {
+  if (!isValidEmailFormat(email)) {
     errors.push("Invalid email format");
   }
 
@@ -92,6 +92,10 @@ function validatePassword(password: string): string[] {
 function sanitizeString(value: string): string {
   if (!value) return "";
 
+  // Without a "<" there is no markup to remove and DOMPurify would return
+  // the input unchanged, so skip its per-call config parsing
+  if (!value.includes("<")) return value.trim();
+
   // Use DOMPurify to strip all HTML while preserving text content
   const clean = DOMPurify.sanitize(value, {
     ALLOWED_TAGS: [], // Remove all HTML tags
@@ -211,6 +215,23 @@ export function validateUserLogin(
   };
 }
 
+/**
+ * Validate a standalone email address (e.g. an admin changing a user's
+ * email). Returns the normalized form used for storage and lookups.
+ */
+export function validateEmailAddress(
+  value: unknown
+): ValidationResult<string> {
+  const email = String(value ?? "").toLowerCase().trim();
+
+  const emailErrors = validateEmail(email);
+  if (emailErrors.length > 0) {
+    return { valid: false, errors: { email: emailErrors } };
+  }
+
+  return { valid: true, data: email };
+}
+
 /**
  * Validate password strength (exported for password reset)
  */
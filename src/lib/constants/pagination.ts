@@ -8,6 +8,7 @@ export const PAGINATION_LIMITS = {
   // Main content limits
   CARDS_MAX_LIMIT: 100,
   CARDS_DEFAULT_LIMIT: 20,
+  CARDS_MAX_TAG_FILTERS: 20,
 
   // User-generated content limits
   REVIEWS_MAX_LIMIT: 50,
@@ -43,6 +44,10 @@ export const PAGINATION_LIMITS = {
 
   FORUM_POSTS_MAX_LIMIT: 100,
   FORUM_POSTS_DEFAULT_LIMIT: 25,
+
+  // Help wanted limits
+  HELP_WANTED_MY_POSTS_MAX_LIMIT: 100,
+  HELP_WANTED_MY_POSTS_DEFAULT_LIMIT: 25,
 } as const;
 
 // Utility functions for pagination parameter validation
@@ -33,6 +33,7 @@ vi.mock("../logger", () => ({
 
 // Import after mocking
 import {
+  applyPoolSettings,
   connectToDatabase,
   checkDatabaseHealth,
   withTransaction,
@@ -51,6 +52,46 @@ describe("Database Client", () => {
     vi.clearAllMocks();
   });
 
+  describe("applyPoolSettings", () => {
+    it("should add default pool settings", () => {
+      const url = new URL(
+        applyPoolSettings("postgresql://user:pass@db:5432/cityforge")
+      );
+
+      expect(url.searchParams.get("connection_limit")).toBe("10");
+      expect(url.searchParams.get("pool_timeout")).toBe("30");
+    });
+
+    it("should keep settings already present in the URL", () => {
+      const url = new URL(
+        applyPoolSettings(
+          "postgresql://user:pass@db:5432/cityforge?connection_limit=3&schema=public"
+        )
+      );
+
+      expect(url.searchParams.get("connection_limit")).toBe("3");
+      expect(url.searchParams.get("pool_timeout")).toBe("30");
+      expect(url.searchParams.get("schema")).toBe("public");
+    });
+
+    it("should use pool settings from the environment", () => {
+      vi.stubEnv("DATABASE_CONNECTION_LIMIT", "25");
+      vi.stubEnv("DATABASE_POOL_TIMEOUT", "5");
+
+      const url = new URL(
+        applyPoolSettings("postgresql://user:pass@db:5432/cityforge")
+      );
+
+      expect(url.searchParams.get("connection_limit")).toBe("25");
+      expect(url.searchParams.get("pool_timeout")).toBe("5");
+      vi.unstubAllEnvs();
+    });
+
+    it("should return unparseable URLs unchanged", () => {
+      expect(applyPoolSettings("not a url")).toBe("not a url");
+    });
+  });
+
   describe("connectToDatabase", () => {
     it("should return true on successful connection", async () => {
       mockConnect.mockResolvedValue(undefined);
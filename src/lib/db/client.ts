@@ -8,6 +8,37 @@ declare global {
   var __prisma: PrismaClient | undefined;
 }
 
+/**
+ * Apply explicit connection pool settings to a database URL.
+ * Prisma sizes its pool from the connection_limit and pool_timeout URL
+ * parameters (default: 2 * CPUs + 1 connections, 10s timeout). Settings
+ * already present in the URL win over DATABASE_CONNECTION_LIMIT and
+ * DATABASE_POOL_TIMEOUT, which fall back to 10 connections and 30 seconds.
+ */
+export function applyPoolSettings(databaseUrl: string): string {
+  let url: URL;
+  try {
+    url = new URL(databaseUrl);
+  } catch {
+    return databaseUrl;
+  }
+
+  if (!url.searchParams.has("connection_limit")) {
+    url.searchParams.set(
+      "connection_limit",
+      process.env["DATABASE_CONNECTION_LIMIT"] || "10"
+    );
+  }
+  if (!url.searchParams.has("pool_timeout")) {
+    url.searchParams.set(
+      "pool_timeout",
+      process.env["DATABASE_POOL_TIMEOUT"] || "30"
+    );
+  }
+
+  return url.toString();
+}
+
 // Build DATABASE_URL from individual components if not provided
 function getDatabaseUrl(): string {
   if (process.env["DATABASE_URL"]) {
@@ -15,7 +46,7 @@ function getDatabaseUrl(): string {
     logger.debug(
       `[Database] Connection URL: ${redactDatabaseUrl(process.env["DATABASE_URL"])}`
     );
-    return process.env["DATABASE_URL"];
+    return applyPoolSettings(process.env["DATABASE_URL"]);
   }
 
   // Build from individual components (for Kubernetes deployments)
@@ -38,7 +69,7 @@ function getDatabaseUrl(): string {
     redactDatabaseUrl(constructedUrl)
   );
 
-  return constructedUrl;
+  return applyPoolSettings(constructedUrl);
 }
 
 // Create a singleton Prisma client instance with explicit database URL for Docker compatibility
@@ -0,0 +1,52 @@
+/**
+ * Models covered by the admin data export/import, mapped to their database
+ * tables, in display order
+ */
+export const MODEL_TABLES: Record<string, string> = {
+  User: "users",
+  Tag: "tags",
+  Card: "cards",
+  CardSubmission: "card_submissions",
+  CardModification: "card_modifications",
+  ResourceCategory: "resource_categories",
+  QuickAccessItem: "quick_access_items",
+  ResourceItem: "resource_items",
+  ResourceConfig: "resource_config",
+  Review: "reviews",
+  ForumCategory: "forum_categories",
+  ForumCategoryRequest: "forum_category_requests",
+  ForumThread: "forum_threads",
+  ForumPost: "forum_posts",
+  ForumReport: "forum_reports",
+  HelpWantedPost: "help_wanted_posts",
+  HelpWantedComment: "help_wanted_comments",
+  HelpWantedReport: "help_wanted_reports",
+  IndexingJob: "indexing_jobs",
+  TokenBlacklist: "token_blacklist",
+  card_tags: "card_tags",
+  alembic_version: "alembic_version",
+};
+
+/**
+ * Models whose rows the database deletes or rewrites (ON DELETE CASCADE or
+ * SET NULL) when rows of the keyed model are deleted. Replacing a model's
+ * data therefore changes these too, so they must be imported alongside it.
+ */
+export const DEPENDENT_MODELS: Record<string, string[]> = {
+  ForumCategory: ["ForumCategoryRequest", "ForumThread"],
+  ForumThread: ["ForumPost", "ForumReport"],
+  ForumPost: ["ForumReport"],
+  HelpWantedPost: ["HelpWantedComment", "HelpWantedReport"],
+};
+
+/**
+ * Models without an autoincrement "id" column, and so without a sequence
+ */
+const MODELS_WITHOUT_SERIAL_ID = new Set(["card_tags", "alembic_version"]);
+
+/**
+ * Whether a model's table has an "id" column backed by a sequence
+ */
+export function hasSerialId(modelName: string): boolean {
+  return modelName in MODEL_TABLES && !MODELS_WITHOUT_SERIAL_ID.has(modelName);
+}
@@ -10,9 +10,11 @@ vi.mock("./client", () => {
   const mockDelete = vi.fn();
   const mockFindFirst = vi.fn();
   const mockAggregate = vi.fn();
+  const mockQueryRaw = vi.fn();
 
   return {
     prisma: {
+      $queryRaw: mockQueryRaw,
       card: {
         findMany: mockFindMany,
         count: mockCount,
@@ -86,6 +88,7 @@ vi.mock("./client", () => {
       mockDelete,
       mockFindFirst,
       mockAggregate,
+      mockQueryRaw,
     },
   };
 });
@@ -109,6 +112,8 @@ import {
   resourceQueries,
   submissionQueries,
 } from "./queries";
+import { apiCache } from "../cache";
+import { Prisma } from "@prisma/client";
 
 // Get mock references
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
@@ -122,11 +127,19 @@ const {
   mockDelete,
   mockFindFirst,
   mockAggregate,
+  mockQueryRaw,
 } = prismaModule.__mocks || {};
 
+// Rebuild the query a tagged-template $queryRaw call was given
+function lastRawQuery(): Prisma.Sql {
+  const [strings, ...values] = mockQueryRaw.mock.lastCall;
+  return Prisma.sql(strings, ...values);
+}
+
 describe("Database Queries", () => {
   beforeEach(() => {
     vi.clearAllMocks();
+    apiCache.clear();
   });
 
   describe("cardQueries", () => {
@@ -436,6 +449,59 @@ describe("Database Queries", () => {
       });
     });
 
+    describe("getCardPageMatchingAllTags", () => {
+      it("should select the page with the tag match inside one query", async () => {
+        mockQueryRaw.mockResolvedValue([{ id: 3 }, { id: 7 }]);
+
+        const result = await cardQueries.getCardPageMatchingAllTags(
+          ["Restaurant", "restaurant", "50%_off"],
+          { limit: 20, offset: 40 }
+        );
+
+        expect(result).toEqual([3, 7]);
+        expect(mockQueryRaw).toHaveBeenCalledTimes(1);
+        const query = lastRawQuery();
+        expect(query.sql).toContain("HAVING COUNT(DISTINCT p.pattern) = ?");
+        expect(query.sql).toContain("LIMIT ?");
+        // Duplicate tags collapse and LIKE wildcards are escaped
+        expect(query.values).toContainEqual(["%restaurant%", "%50\\%\\_off%"]);
+        expect(query.values).toEqual(expect.arrayContaining([2, 20, 40]));
+      });
+
+      it("should continue after a cursor instead of using the offset", async () => {
+        mockQueryRaw.mockResolvedValue([]);
+
+        await cardQueries.getCardPageMatchingAllTags(["food"], {
+          cursor: { featured: true, name: "Cafe", id: 5 },
+          limit: 20,
+          offset: 40,
+        });
+
+        const query = lastRawQuery();
+        expect(query.sql).toContain("c.featured = false OR");
+        expect(query.values).toEqual(
+          expect.arrayContaining(["Cafe", 5, 20, 0])
+        );
+        expect(query.values).not.toContain(40);
+      });
+    });
+
+    describe("countCardsMatchingAllTags", () => {
+      it("should count matches with the listing filters applied", async () => {
+        mockQueryRaw.mockResolvedValue([{ count: BigInt(12) }]);
+
+        const result = await cardQueries.countCardsMatchingAllTags(["food"], {
+          search: "cafe",
+          featuredOnly: true,
+        });
+
+        expect(result).toBe(12);
+        const query = lastRawQuery();
+        expect(query.sql).toContain("c.featured = true");
+        expect(query.values).toContain("%cafe%");
+      });
+    });
+
     describe("getCardById", () => {
       it("should fetch a card by ID", async () => {
         const mockCard = {
@@ -561,6 +627,21 @@ describe("Database Queries", () => {
       });
     });
 
+    describe("getCardSummary", () => {
+      it("should select only identifying fields of an approved card", async () => {
+        const mockCard = { id: 1, name: "Test Business", approved: true };
+        mockFindUnique.mockResolvedValue(mockCard);
+
+        const result = await cardQueries.getCardSummary(1);
+
+        expect(result).toEqual(mockCard);
+        expect(mockFindUnique).toHaveBeenCalledWith({
+          where: { id: 1, approved: true },
+          select: { id: true, name: true, approved: true },
+        });
+      });
+    });
+
     describe("createCard", () => {
       it("should create a new card with required fields", async () => {
         const cardData = {
@@ -849,52 +930,96 @@ describe("Database Queries", () => {
         ];
 
         mockFindMany.mockResolvedValue(mockReviews);
-        mockCount.mockResolvedValue(1);
 
         const result = await reviewQueries.getCardReviews(1);
 
         expect(result.reviews).toHaveLength(1);
         expect(result.reviews[0]!.rating).toBe(5);
-        expect(result.totalCount).toBe(1);
+        expect(result.hasMore).toBe(false);
+        expect(result.nextCursor).toBeNull();
+        expect(mockCount).not.toHaveBeenCalled();
       });
 
       it("should support pagination options", async () => {
         mockFindMany.mockResolvedValue([]);
-        mockCount.mockResolvedValue(0);
 
         const result = await reviewQueries.getCardReviews(1, 20, 10);
 
         expect(result.reviews).toBeDefined();
-        expect(result.totalCount).toBe(0);
+        expect(result.hasMore).toBe(false);
         expect(mockFindMany).toHaveBeenCalledWith(
           expect.objectContaining({
-            take: 20,
+            take: 21,
             skip: 10,
           })
         );
       });
-    });
 
-    describe("getCardRatingSummary", () => {
-      it("should calculate rating statistics", async () => {
-        mockAggregate.mockResolvedValue({
-          _avg: { rating: 4.5 },
-          _count: { id: 10 },
+      it("should continue after a cursor position instead of an offset", async () => {
+        const date = new Date("2024-03-01T12:00:00Z");
+        mockFindMany.mockResolvedValue([
+          { id: 7, createdDate: date },
+          { id: 4, createdDate: date },
+          { id: 2, createdDate: date },
+        ]);
+
+        const result = await reviewQueries.getCardReviews(1, 2, 0, {
+          createdDate: date,
+          id: 8,
         });
 
-        const result = await reviewQueries.getCardRatingSummary(1);
+        expect(mockFindMany).toHaveBeenCalledWith(
+          expect.objectContaining({
+            where: {
+              cardId: 1,
+              hidden: false,
+              OR: [
+                { createdDate: { lt: date } },
+                { createdDate: date, id: { lt: 8 } },
+              ],
+            },
+            orderBy: [{ createdDate: "desc" }, { id: "desc" }],
+            take: 3,
+            skip: undefined,
+          })
+        );
+        expect(result.reviews).toHaveLength(2);
+        expect(result.nextCursor).toEqual({ createdDate: date, id: 4 });
+        expect(result.hasMore).toBe(true);
+      });
+
+      it("should not hand out a cursor when the last page is exactly full", async () => {
+        mockFindMany.mockResolvedValue([{ id: 7 }, { id: 4 }]);
+
+        const result = await reviewQueries.getCardReviews(1, 2);
+
+        expect(result.reviews).toHaveLength(2);
+        expect(result.hasMore).toBe(false);
+        expect(result.nextCursor).toBeNull();
+      });
+    });
+
+    describe("getCardRatingStats", () => {
+      it("should calculate rating statistics from the distribution", async () => {
+        const mockGroupBy = vi.fn().mockResolvedValue([
+          { rating: 4, _count: { rating: 5 } },
+          { rating: 5, _count: { rating: 5 } },
+        ]);
+        prismaModule.prisma.review.groupBy = mockGroupBy;
+
+        const result = await reviewQueries.getCardRatingStats(1);
 
         expect(result.averageRating).toBe(4.5);
         expect(result.totalReviews).toBe(10);
+        expect(result.distribution).toEqual([0, 0, 0, 5, 5]);
+        expect(mockGroupBy).toHaveBeenCalledTimes(1);
+        expect(mockAggregate).not.toHaveBeenCalled();
       });
 
       it("should handle cards with no reviews", async () => {
-        mockAggregate.mockResolvedValue({
-          _avg: { rating: null },
-          _count: { id: 0 },
-        });
+        prismaModule.prisma.review.groupBy = vi.fn().mockResolvedValue([]);
 
-        const result = await reviewQueries.getCardRatingSummary(1);
+        const result = await reviewQueries.getCardRatingStats(1);
 
         expect(result.averageRating).toBeNull();
         expect(result.totalReviews).toBe(0);
@@ -1077,6 +1202,26 @@ describe("Database Queries", () => {
       });
     });
 
+    describe("hasUserReviewedCard", () => {
+      it("should only select the review id", async () => {
+        mockFindFirst.mockResolvedValue({ id: 4 });
+
+        const result = await reviewQueries.hasUserReviewedCard(1, 2);
+
+        expect(result).toBe(true);
+        expect(mockFindFirst).toHaveBeenCalledWith({
+          where: { userId: 1, cardId: 2 },
+          select: { id: true },
+        });
+      });
+
+      it("should return false when there is no review", async () => {
+        mockFindFirst.mockResolvedValue(null);
+
+        expect(await reviewQueries.hasUserReviewedCard(1, 2)).toBe(false);
+      });
+    });
+
     describe("reportReview", () => {
       it("should mark a review as reported with reason", async () => {
         const mockReportedReview = {
@@ -1187,7 +1332,7 @@ describe("Database Queries", () => {
             by: ["rating"],
             where: expect.objectContaining({
               cardId: 1,
-              OR: [{ hidden: false }, { hidden: null }],
+              hidden: false,
             }),
             _count: { rating: true },
             orderBy: { rating: "asc" },
@@ -1234,7 +1379,7 @@ describe("Database Queries", () => {
         expect(mockGroupBy).toHaveBeenCalledWith(
           expect.objectContaining({
             where: expect.objectContaining({
-              OR: [{ hidden: false }, { hidden: null }],
+              hidden: false,
             }),
           })
         );
@@ -1336,6 +1481,28 @@ describe("Database Queries", () => {
         expect(result).toBeDefined();
         expect(mockFindMany).toHaveBeenCalled();
       });
+
+      it("should serve repeat reads from the in-process cache", async () => {
+        mockFindMany.mockResolvedValue([
+          { id: 1, key: "site_title", value: "CityForge" },
+        ]);
+
+        await resourceQueries.getSiteConfig();
+        const result = await resourceQueries.getSiteConfig();
+
+        expect(result).toEqual({ site_title: "CityForge" });
+        expect(mockFindMany).toHaveBeenCalledTimes(1);
+      });
+
+      it("should reload after the cache is cleared", async () => {
+        mockFindMany.mockResolvedValue([]);
+
+        await resourceQueries.getSiteConfig();
+        resourceQueries.clearSiteConfigCache();
+        await resourceQueries.getSiteConfig();
+
+        expect(mockFindMany).toHaveBeenCalledTimes(2);
+      });
     });
 
     describe("getResourceCategoryList", () => {
@@ -1551,6 +1718,13 @@ describe("Database Queries", () => {
   });
 
   describe("submissionQueries", () => {
+    const submitter = {
+      id: 1,
+      firstName: "John",
+      lastName: "Doe",
+      email: "john@example.com",
+    };
+
     describe("createSubmission", () => {
       it("should create a new card submission", async () => {
         const submissionData = {
@@ -1567,10 +1741,21 @@ describe("Database Queries", () => {
         };
         mockCreate.mockResolvedValue(mockSubmission);
 
-        const result = await submissionQueries.createSubmission(submissionData);
+        const result = await submissionQueries.createSubmission(
+          submissionData,
+          submitter
+        );
 
         expect(result).toBeDefined();
         expect(mockCreate).toHaveBeenCalled();
+        expect(mockCreate.mock.calls[0][0]).not.toHaveProperty("include");
+        expect(result.submitter).toEqual({
+          id: 1,
+          first_name: "John",
+          last_name: "Doe",
+          email: "john@example.com",
+        });
+        expect(result.reviewer).toBeNull();
       });
     });
 
@@ -1622,11 +1807,20 @@ describe("Database Queries", () => {
         };
         mockCreate.mockResolvedValue(mockModification);
 
-        const result =
-          await submissionQueries.createModification(modificationData);
+        const result = await submissionQueries.createModification(
+          modificationData,
+          submitter,
+          { id: 1, name: "Original Name", approved: true }
+        );
 
         expect(result).toBeDefined();
         expect(mockCreate).toHaveBeenCalled();
+        expect(mockCreate.mock.calls[0][0]).not.toHaveProperty("include");
+        expect(result.card).toEqual({
+          id: 1,
+          name: "Original Name",
+          approved: true,
+        });
       });
     });
   });
@@ -1789,9 +1983,11 @@ describe("Database Queries", () => {
 
       it("should handle memory errors for aggregation queries", async () => {
         const memoryError = new Error("Out of memory");
-        mockAggregate.mockRejectedValue(memoryError);
+        prismaModule.prisma.review.groupBy = vi
+          .fn()
+          .mockRejectedValue(memoryError);
 
-        await expect(reviewQueries.getCardRatingSummary(1)).rejects.toThrow(
+        await expect(reviewQueries.getCardRatingStats(1)).rejects.toThrow(
           "Out of memory"
         );
       });
@@ -1937,11 +2133,13 @@ describe("Database Queries", () => {
       });
 
       it("should handle empty or corrupted aggregation results", async () => {
-        // This test exposes that getCardRatingSummary doesn't handle null results properly
+        // This test exposes that getCardRatingStats doesn't handle null results properly
         const nullAggregationError = new Error("Failed to aggregate data");
-        mockAggregate.mockRejectedValue(nullAggregationError);
+        prismaModule.prisma.review.groupBy = vi
+          .fn()
+          .mockRejectedValue(nullAggregationError);
 
-        await expect(reviewQueries.getCardRatingSummary(1)).rejects.toThrow(
+        await expect(reviewQueries.getCardRatingStats(1)).rejects.toThrow(
           "Failed to aggregate data"
         );
       });
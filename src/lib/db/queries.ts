@@ -1,6 +1,66 @@
 import { prisma } from "./client";
 import { logger } from "../logger";
-import type { Prisma } from "@prisma/client";
+import { apiCache } from "../cache";
+import {
+  cardsAfterCursorSql,
+  reviewsAfterCursor,
+  type CardCursor,
+  type ReviewCursor,
+} from "../utils/cursor";
+import { Prisma } from "@prisma/client";
+
+/**
+ * Filters shared by the public card listing and its AND-mode tag query
+ */
+interface CardListingFilters {
+  search?: string;
+  featuredOnly?: boolean;
+}
+
+/**
+ * ILIKE pattern matching values that contain the given text, with LIKE
+ * wildcards in it escaped
+ */
+function containsPattern(text: string): string {
+  return `%${text.toLowerCase().replace(/[\\%_]/g, "\\$&")}%`;
+}
+
+/**
+ * WHERE conditions for approved cards that have a tag matching every given
+ * tag (case-insensitive substring match), narrowed by the listing filters.
+ * The tag match is one join + GROUP BY/HAVING subquery instead of a
+ * correlated EXISTS per tag.
+ */
+function cardsMatchingAllTagsSql(
+  tags: string[],
+  { search, featuredOnly }: CardListingFilters
+): Prisma.Sql {
+  const patterns = Array.from(new Set(tags.map(containsPattern)));
+  const conditions = [
+    Prisma.sql`c.approved = true`,
+    Prisma.sql`c.id IN (
+      SELECT ct.card_id
+      FROM card_tags ct
+      JOIN tags t ON t.id = ct.tag_id
+      JOIN unnest(${patterns}::text[]) AS p(pattern) ON t.name ILIKE p.pattern
+      GROUP BY ct.card_id
+      HAVING COUNT(DISTINCT p.pattern) = ${patterns.length}
+    )`,
+  ];
+
+  if (featuredOnly) {
+    conditions.push(Prisma.sql`c.featured = true`);
+  }
+
+  if (search) {
+    const pattern = containsPattern(search);
+    conditions.push(
+      Prisma.sql`(c.name ILIKE ${pattern} OR c.description ILIKE ${pattern} OR c.address ILIKE ${pattern} OR c.contact_name ILIKE ${pattern})`
+    );
+  }
+
+  return Prisma.join(conditions, " AND ");
+}
 
 // Card-related queries
 export const cardQueries = {
@@ -146,6 +206,58 @@ export const cardQueries = {
     };
   },
 
+  /**
+   * Get the IDs of one page of approved cards that have a tag matching
+   * every given tag, in listing order (featured DESC, name ASC, id ASC).
+   * The tag match runs inside the page query, so only the page's IDs come
+   * back. A cursor continues after that card; otherwise offset applies.
+   */
+  async getCardPageMatchingAllTags(
+    tags: string[],
+    {
+      cursor,
+      limit,
+      offset,
+      ...filters
+    }: CardListingFilters & {
+      cursor?: CardCursor | null;
+      limit: number;
+      offset: number;
+    }
+  ): Promise<number[]> {
+    const where = cardsMatchingAllTagsSql(tags, filters);
+    const afterCursor = cursor
+      ? Prisma.sql`AND ${cardsAfterCursorSql(cursor)}`
+      : Prisma.empty;
+
+    const rows = await prisma.$queryRaw<Array<{ id: number }>>`
+      SELECT c.id
+      FROM cards c
+      WHERE ${where} ${afterCursor}
+      ORDER BY c.featured DESC, c.name ASC, c.id ASC
+      LIMIT ${limit}
+      OFFSET ${cursor ? 0 : offset}
+    `;
+
+    return rows.map((row) => row.id);
+  },
+
+  /**
+   * Count approved cards that have a tag matching every given tag
+   */
+  async countCardsMatchingAllTags(
+    tags: string[],
+    filters: CardListingFilters = {}
+  ): Promise<number> {
+    const [row] = await prisma.$queryRaw<Array<{ count: bigint }>>`
+      SELECT COUNT(*) AS count
+      FROM cards c
+      WHERE ${cardsMatchingAllTagsSql(tags, filters)}
+    `;
+
+    return Number(row?.count ?? 0);
+  },
+
   /**
    * Get a single card by ID with all related data
    */
@@ -158,7 +270,8 @@ export const cardQueries = {
       const card = await prisma.card.findUnique({
         where: { id, approved: true },
         include: {
-          card_tags: { include: { tags: true } },
+          // Only tag names are serialized; skip the join table columns
+          card_tags: { select: { tags: { select: { name: true } } } },
           reviews: {
             where: { hidden: false },
             include: {
@@ -234,6 +347,18 @@ export const cardQueries = {
     }
   },
 
+  /**
+   * Get the identifying fields of an approved card, or null if there is
+   * none. For routes that only need to confirm the card exists; unlike
+   * getCardById it loads no tags, reviews or users.
+   */
+  async getCardSummary(id: number) {
+    return prisma.card.findUnique({
+      where: { id, approved: true },
+      select: { id: true, name: true, approved: true },
+    });
+  },
+
   /**
    * Create a new card
    */
@@ -372,34 +497,44 @@ export const reviewQueries = {
   },
 
   /**
-   * Get reviews for a card
+   * Get reviews for a card, newest first.
+   * Pass the position of the last review of the previous page as `after`
+   * to continue from it (keyset) instead of skipping `offset` rows.
    */
-  async getCardReviews(cardId: number, limit = 10, offset = 0) {
-    const [reviews, totalCount] = await Promise.all([
-      prisma.review.findMany({
-        where: {
-          cardId,
-          OR: [{ hidden: false }, { hidden: null }],
-        },
-        include: {
-          user: { select: { firstName: true, lastName: true } },
-        },
-        orderBy: { createdDate: "desc" },
-        take: limit,
-        skip: offset,
-      }),
-      prisma.review.count({
-        where: {
-          cardId,
-          OR: [{ hidden: false }, { hidden: null }],
-        },
-      }),
-    ]);
+  async getCardReviews(
+    cardId: number,
+    limit = 10,
+    offset = 0,
+    after?: ReviewCursor
+  ) {
+    // Fetch one extra row to learn whether another page follows, instead
+    // of counting every visible review on each request; callers needing
+    // the total already have it from getCardRatingStats
+    const rows = await prisma.review.findMany({
+      where: {
+        cardId,
+        hidden: false,
+        ...(after && reviewsAfterCursor(after)),
+      },
+      include: {
+        user: { select: { firstName: true, lastName: true } },
+      },
+      orderBy: [{ createdDate: "desc" }, { id: "desc" }],
+      take: limit + 1,
+      skip: after ? undefined : offset,
+    });
+
+    const hasMore = rows.length > limit;
+    const reviews = hasMore ? rows.slice(0, limit) : rows;
+    const lastReview = reviews[reviews.length - 1];
 
     return {
       reviews,
-      totalCount,
-      hasMore: offset + reviews.length < totalCount,
+      hasMore,
+      nextCursor:
+        hasMore && lastReview
+          ? { createdDate: lastReview.createdDate, id: lastReview.id }
+          : null,
     };
   },
 
@@ -455,6 +590,22 @@ export const reviewQueries = {
     });
   },
 
+  /**
+   * Check whether a user has already reviewed a card, without loading the
+   * review itself
+   */
+  async hasUserReviewedCard(userId: number, cardId: number) {
+    const review = await prisma.review.findFirst({
+      where: {
+        userId,
+        cardId,
+      },
+      select: { id: true },
+    });
+
+    return review !== null;
+  },
+
   /**
    * Report a review
    */
@@ -476,27 +627,71 @@ export const reviewQueries = {
   },
 
   /**
-   * Get card rating summary (average rating and count)
+   * Clear a review's report state (and unhide it) in one statement.
+   * Selecting only scalar columns lets Prisma issue a single
+   * UPDATE ... RETURNING without a prior lookup; a missing review
+   * surfaces as P2025.
    */
-  async getCardRatingSummary(cardId: number) {
-    const result = await prisma.review.aggregate({
-      where: {
-        cardId,
-        OR: [{ hidden: false }, { hidden: null }],
-      },
-      _avg: {
-        rating: true,
-      },
-      _count: {
-        id: true,
+  async clearReviewReport(reviewId: number) {
+    return await prisma.review.update({
+      where: { id: reviewId },
+      data: {
+        hidden: false,
+        reported: false,
+        reportedBy: null,
+        reportedDate: null,
+        reportedReason: null,
       },
     });
+  },
+
+  /**
+   * Clear a review's report state and shape the admin response for it.
+   * The dismiss-report and unhide routes share this and differ only in
+   * the message.
+   */
+  async clearReviewReportResponse(reviewId: number, message: string) {
+    const review = await this.clearReviewReport(reviewId);
+
+    return {
+      message,
+      review: {
+        id: review.id,
+        card_id: review.cardId,
+        user_id: review.userId,
+        rating: review.rating,
+        title: review.title,
+        comment: review.comment,
+        reported: review.reported || false,
+        reported_by: review.reportedBy,
+        reported_date: review.reportedDate?.toISOString(),
+        reported_reason: review.reportedReason,
+        created_date: review.createdDate?.toISOString(),
+        hidden: review.hidden,
+      },
+    };
+  },
+
+  /**
+   * Get card rating summary (average rating and count) together with the
+   * rating distribution. Both come from the one GROUP BY rating query, so
+   * the summary costs no extra round trip.
+   */
+  async getCardRatingStats(cardId: number) {
+    const distribution = await this.getCardRatingDistribution(cardId);
+
+    const totalReviews = distribution.reduce((sum, count) => sum + count, 0);
+    const ratingSum = distribution.reduce(
+      (sum, count, index) => sum + count * (index + 1),
+      0
+    );
 
     return {
-      averageRating: result._avg.rating
-        ? Math.round(result._avg.rating * 10) / 10
+      averageRating: totalReviews
+        ? Math.round((ratingSum / totalReviews) * 10) / 10
         : null,
-      totalReviews: result._count.id,
+      totalReviews,
+      distribution,
     };
   },
 
@@ -508,7 +703,7 @@ export const reviewQueries = {
       by: ["rating"],
       where: {
         cardId,
-        OR: [{ hidden: false }, { hidden: null }],
+        hidden: false,
       },
       _count: {
         rating: true,
@@ -531,6 +726,10 @@ export const reviewQueries = {
 };
 
 // Resource-related queries
+// In-process cache of the ResourceConfig key-value map
+const SITE_CONFIG_CACHE_KEY = "site_config";
+const SITE_CONFIG_CACHE_TTL = 300; // seconds
+
 export const resourceQueries = {
   /**
    * Get all resource categories with items
@@ -635,18 +834,37 @@ export const resourceQueries = {
 
   /**
    * Get site configuration (matches Flask API)
+   *
+   * The key-value map changes rarely but is read on every config and
+   * resources request, so it is cached in-process. Admin changes to
+   * ResourceConfig call clearSiteConfigCache().
    */
   async getSiteConfig() {
+    const cached = apiCache.get<Record<string, string>>(SITE_CONFIG_CACHE_KEY);
+    if (cached) {
+      return cached;
+    }
+
     const configs = await prisma.resourceConfig.findMany();
 
     // Convert to key-value object
-    return configs.reduce(
+    const configDict = configs.reduce(
       (acc, config) => {
         acc[config.key] = config.value;
         return acc;
       },
       {} as Record<string, string>
     );
+
+    apiCache.set(SITE_CONFIG_CACHE_KEY, configDict, SITE_CONFIG_CACHE_TTL);
+    return configDict;
+  },
+
+  /**
+   * Drop the cached site configuration after ResourceConfig changes
+   */
+  clearSiteConfigCache() {
+    apiCache.delete(SITE_CONFIG_CACHE_KEY);
   },
 
   /**
@@ -698,23 +916,36 @@ export const resourceQueries = {
 };
 
 // Submission-related queries
+type SubmissionUser = {
+  id: number;
+  firstName: string;
+  lastName: string;
+  email: string;
+};
+
 export const submissionQueries = {
   /**
    * Create a new card submission (matches Flask API)
+   *
+   * The caller passes the submitting user it already has loaded, and a new
+   * submission has no reviewer, so the insert needs no relation lookups.
    */
-  async createSubmission(data: {
-    name: string;
-    description?: string;
-    website_url?: string;
-    phone_number?: string;
-    email?: string;
-    address?: string;
-    address_override_url?: string;
-    contact_name?: string;
-    image_url?: string;
-    tags_text?: string;
-    submitted_by: number;
-  }) {
+  async createSubmission(
+    data: {
+      name: string;
+      description?: string;
+      website_url?: string;
+      phone_number?: string;
+      email?: string;
+      address?: string;
+      address_override_url?: string;
+      contact_name?: string;
+      image_url?: string;
+      tags_text?: string;
+      submitted_by: number;
+    },
+    submitter: SubmissionUser
+  ) {
     const submission = await prisma.cardSubmission.create({
       data: {
         name: data.name,
@@ -731,24 +962,6 @@ export const submissionQueries = {
         status: "pending",
         createdDate: new Date(),
       },
-      include: {
-        submitter: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-            email: true,
-          },
-        },
-        reviewer: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-            email: true,
-          },
-        },
-      },
     });
 
     // Transform to match Flask API format (to_dict method)
@@ -771,22 +984,13 @@ export const submissionQueries = {
       reviewed_date: submission.reviewedDate
         ? submission.reviewedDate.toISOString()
         : null,
-      submitter: submission.submitter
-        ? {
-            id: submission.submitter.id,
-            first_name: submission.submitter.firstName,
-            last_name: submission.submitter.lastName,
-            email: submission.submitter.email,
-          }
-        : null,
-      reviewer: submission.reviewer
-        ? {
-            id: submission.reviewer.id,
-            first_name: submission.reviewer.firstName,
-            last_name: submission.reviewer.lastName,
-            email: submission.reviewer.email,
-          }
-        : null,
+      submitter: {
+        id: submitter.id,
+        first_name: submitter.firstName,
+        last_name: submitter.lastName,
+        email: submitter.email,
+      },
+      reviewer: null,
       card_id: submission.cardId,
     };
   },
@@ -860,21 +1064,28 @@ export const submissionQueries = {
 
   /**
    * Create a card modification suggestion (matches Flask API)
+   *
+   * Like createSubmission, the submitter and target card come from the
+   * caller instead of being re-read through relation includes.
    */
-  async createModification(data: {
-    card_id: number;
-    name: string;
-    description?: string;
-    website_url?: string;
-    phone_number?: string;
-    email?: string;
-    address?: string;
-    address_override_url?: string;
-    contact_name?: string;
-    image_url?: string;
-    tags_text?: string;
-    submitted_by: number;
-  }) {
+  async createModification(
+    data: {
+      card_id: number;
+      name: string;
+      description?: string;
+      website_url?: string;
+      phone_number?: string;
+      email?: string;
+      address?: string;
+      address_override_url?: string;
+      contact_name?: string;
+      image_url?: string;
+      tags_text?: string;
+      submitted_by: number;
+    },
+    submitter: SubmissionUser,
+    card: { id: number; name: string; approved: boolean | null }
+  ) {
     const modification = await prisma.cardModification.create({
       data: {
         cardId: data.card_id,
@@ -892,31 +1103,6 @@ export const submissionQueries = {
         status: "pending",
         createdDate: new Date(),
       },
-      include: {
-        submitter: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-            email: true,
-          },
-        },
-        reviewer: {
-          select: {
-            id: true,
-            firstName: true,
-            lastName: true,
-            email: true,
-          },
-        },
-        card: {
-          select: {
-            id: true,
-            name: true,
-            approved: true,
-          },
-        },
-      },
     });
 
     // Transform to match Flask API format (to_dict method)
@@ -940,29 +1126,18 @@ export const submissionQueries = {
       reviewed_date: modification.reviewedDate
         ? modification.reviewedDate.toISOString()
         : null,
-      submitter: modification.submitter
-        ? {
-            id: modification.submitter.id,
-            first_name: modification.submitter.firstName,
-            last_name: modification.submitter.lastName,
-            email: modification.submitter.email,
-          }
-        : null,
-      reviewer: modification.reviewer
-        ? {
-            id: modification.reviewer.id,
-            first_name: modification.reviewer.firstName,
-            last_name: modification.reviewer.lastName,
-            email: modification.reviewer.email,
-          }
-        : null,
-      card: modification.card
-        ? {
-            id: modification.card.id,
-            name: modification.card.name,
-            approved: modification.card.approved,
-          }
-        : null,
+      submitter: {
+        id: submitter.id,
+        first_name: submitter.firstName,
+        last_name: submitter.lastName,
+        email: submitter.email,
+      },
+      reviewer: null,
+      card: {
+        id: card.id,
+        name: card.name,
+        approved: card.approved,
+      },
     };
   },
 };
@@ -0,0 +1,130 @@
+import { describe, it, expect } from "vitest";
+import {
+  cardsAfterCursor,
+  decodeCardCursor,
+  decodeReviewCursor,
+  encodeCardCursor,
+  encodeReviewCursor,
+  reviewsAfterCursor,
+} from "./cursor";
+
+describe("card cursor utilities", () => {
+  describe("encodeCardCursor / decodeCardCursor", () => {
+    it("should round-trip a card position", () => {
+      const cursor = { featured: true, name: "Café & Bakery", id: 42 };
+
+      const encoded = encodeCardCursor(cursor);
+
+      expect(encoded).toMatch(/^[A-Za-z0-9_-]+$/);
+      expect(decodeCardCursor(encoded)).toEqual(cursor);
+    });
+
+    it("should accept a null featured flag", () => {
+      const cursor = { featured: null, name: "Shop", id: 1 };
+
+      expect(decodeCardCursor(encodeCardCursor(cursor))).toEqual(cursor);
+    });
+
+    it("should return null for malformed cursors", () => {
+      const encode = (value: unknown) =>
+        Buffer.from(JSON.stringify(value)).toString("base64url");
+
+      expect(decodeCardCursor("not-a-cursor")).toBeNull();
+      expect(decodeCardCursor(encode({ id: 1 }))).toBeNull();
+      expect(decodeCardCursor(encode([true, "Shop"]))).toBeNull();
+      expect(decodeCardCursor(encode(["yes", "Shop", 1]))).toBeNull();
+      expect(decodeCardCursor(encode([true, 5, 1]))).toBeNull();
+      expect(decodeCardCursor(encode([true, "Shop", 1.5]))).toBeNull();
+      expect(decodeCardCursor(encode([true, "Shop", -1]))).toBeNull();
+    });
+  });
+
+  describe("cardsAfterCursor", () => {
+    it("should include non-featured cards after a featured cursor", () => {
+      expect(
+        cardsAfterCursor({ featured: true, name: "Shop", id: 7 })
+      ).toEqual({
+        OR: [
+          { featured: false },
+          { featured: true, name: { gt: "Shop" } },
+          { featured: true, name: "Shop", id: { gt: 7 } },
+        ],
+      });
+    });
+
+    it("should only page within the group for a non-featured cursor", () => {
+      expect(
+        cardsAfterCursor({ featured: false, name: "Shop", id: 7 })
+      ).toEqual({
+        OR: [
+          { featured: false, name: { gt: "Shop" } },
+          { featured: false, name: "Shop", id: { gt: 7 } },
+        ],
+      });
+    });
+
+    it("should include all flagged cards after a null featured cursor", () => {
+      expect(
+        cardsAfterCursor({ featured: null, name: "Shop", id: 7 })
+      ).toEqual({
+        OR: [
+          { featured: { not: null } },
+          { featured: null, name: { gt: "Shop" } },
+          { featured: null, name: "Shop", id: { gt: 7 } },
+        ],
+      });
+    });
+  });
+});
+
+describe("review cursor utilities", () => {
+  describe("encodeReviewCursor / decodeReviewCursor", () => {
+    it("should round-trip a review position", () => {
+      const cursor = { createdDate: new Date("2024-03-01T12:00:00Z"), id: 42 };
+
+      const encoded = encodeReviewCursor(cursor);
+
+      expect(encoded).toMatch(/^[A-Za-z0-9_-]+$/);
+      expect(decodeReviewCursor(encoded)).toEqual(cursor);
+    });
+
+    it("should accept a missing created date", () => {
+      const cursor = { createdDate: null, id: 1 };
+
+      expect(decodeReviewCursor(encodeReviewCursor(cursor))).toEqual(cursor);
+    });
+
+    it("should return null for malformed cursors", () => {
+      const encode = (value: unknown) =>
+        Buffer.from(JSON.stringify(value)).toString("base64url");
+
+      expect(decodeReviewCursor("8")).toBeNull();
+      expect(decodeReviewCursor(encode(["2024-03-01T12:00:00Z"]))).toBeNull();
+      expect(decodeReviewCursor(encode(["yesterday", 1]))).toBeNull();
+      expect(decodeReviewCursor(encode([5, 1]))).toBeNull();
+      expect(decodeReviewCursor(encode([null, 0]))).toBeNull();
+    });
+  });
+
+  describe("reviewsAfterCursor", () => {
+    it("should page past older reviews and same-time ties", () => {
+      const createdDate = new Date("2024-03-01T12:00:00Z");
+
+      expect(reviewsAfterCursor({ createdDate, id: 7 })).toEqual({
+        OR: [
+          { createdDate: { lt: createdDate } },
+          { createdDate, id: { lt: 7 } },
+        ],
+      });
+    });
+
+    it("should include all dated reviews after an undated cursor", () => {
+      expect(reviewsAfterCursor({ createdDate: null, id: 7 })).toEqual({
+        OR: [
+          { createdDate: { not: null } },
+          { createdDate: null, id: { lt: 7 } },
+        ],
+      });
+    });
+  });
+});
@@ -0,0 +1,216 @@
+import { Prisma } from "@prisma/client";
+
+/**
+ * Position of a card in the public listing order
+ * (featured DESC, name ASC, id ASC)
+ */
+export interface CardCursor {
+  featured: boolean | null;
+  name: string;
+  id: number;
+}
+
+/**
+ * Encode a card's sort key as an opaque, URL-safe cursor
+ */
+export function encodeCardCursor(card: CardCursor): string {
+  return Buffer.from(
+    JSON.stringify([card.featured, card.name, card.id])
+  ).toString("base64url");
+}
+
+/**
+ * Decode a cursor produced by encodeCardCursor.
+ * Returns null for anything malformed.
+ */
+export function decodeCardCursor(value: string): CardCursor | null {
+  try {
+    const decoded = JSON.parse(Buffer.from(value, "base64url").toString());
+
+    if (!Array.isArray(decoded) || decoded.length !== 3) {
+      return null;
+    }
+
+    const [featured, name, id] = decoded;
+    if (
+      (featured !== null && typeof featured !== "boolean") ||
+      typeof name !== "string" ||
+      !Number.isInteger(id) ||
+      id <= 0
+    ) {
+      return null;
+    }
+
+    return { featured, name, id };
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Build a filter matching cards that sort strictly after the cursor.
+ *
+ * Postgres puts NULLs first for DESC, so the featured groups come in the
+ * order null, true, false.
+ */
+export function cardsAfterCursor(cursor: CardCursor): Prisma.CardWhereInput {
+  const { featured, name, id } = cursor;
+
+  const conditions: Prisma.CardWhereInput[] = [
+    { featured, name: { gt: name } },
+    { featured, name, id: { gt: id } },
+  ];
+
+  if (featured === null) {
+    conditions.unshift({ featured: { not: null } });
+  } else if (featured) {
+    conditions.unshift({ featured: false });
+  }
+
+  return { OR: conditions };
+}
+
+/**
+ * SQL counterpart of cardsAfterCursor for raw queries over "cards" aliased
+ * as c.
+ */
+export function cardsAfterCursorSql(cursor: CardCursor): Prisma.Sql {
+  const { featured, name, id } = cursor;
+  const afterInGroup = Prisma.sql`(c.name > ${name} OR (c.name = ${name} AND c.id > ${id}))`;
+
+  if (featured === null) {
+    return Prisma.sql`(c.featured IS NOT NULL OR (c.featured IS NULL AND ${afterInGroup}))`;
+  }
+  if (featured) {
+    return Prisma.sql`(c.featured = false OR (c.featured = true AND ${afterInGroup}))`;
+  }
+  return Prisma.sql`(c.featured = false AND ${afterInGroup})`;
+}
+
+/**
+ * Position of a row in a (created_date DESC, id DESC) listing
+ */
+interface CreatedDateCursor {
+  createdDate: Date | null;
+  id: number;
+}
+
+function encodeCreatedDateCursor(row: CreatedDateCursor): string {
+  return Buffer.from(
+    JSON.stringify([row.createdDate?.toISOString() ?? null, row.id])
+  ).toString("base64url");
+}
+
+function decodeCreatedDateCursor(value: string): CreatedDateCursor | null {
+  try {
+    const decoded = JSON.parse(Buffer.from(value, "base64url").toString());
+
+    if (!Array.isArray(decoded) || decoded.length !== 2) {
+      return null;
+    }
+
+    const [createdDate, id] = decoded;
+    if (
+      (createdDate !== null && typeof createdDate !== "string") ||
+      !Number.isInteger(id) ||
+      id <= 0
+    ) {
+      return null;
+    }
+
+    const date = createdDate === null ? null : new Date(createdDate);
+    if (date && isNaN(date.getTime())) {
+      return null;
+    }
+
+    return { createdDate: date, id };
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Postgres puts NULLs first for DESC, so undated rows come before all dated
+ * ones.
+ */
+function afterCreatedDateCursor(cursor: CreatedDateCursor) {
+  const { createdDate, id } = cursor;
+
+  if (createdDate === null) {
+    return {
+      OR: [
+        { createdDate: { not: null } },
+        { createdDate: null, id: { lt: id } },
+      ],
+    };
+  }
+
+  return {
+    OR: [{ createdDate: { lt: createdDate } }, { createdDate, id: { lt: id } }],
+  };
+}
+
+/**
+ * Position of a review in a card's review listing
+ * (created_date DESC, id DESC)
+ */
+export type ReviewCursor = CreatedDateCursor;
+
+/**
+ * Encode a review's sort key as an opaque, URL-safe cursor
+ */
+export function encodeReviewCursor(review: ReviewCursor): string {
+  return encodeCreatedDateCursor(review);
+}
+
+/**
+ * Decode a cursor produced by encodeReviewCursor.
+ * Returns null for anything malformed.
+ */
+export function decodeReviewCursor(value: string): ReviewCursor | null {
+  return decodeCreatedDateCursor(value);
+}
+
+/**
+ * Build a filter matching reviews that sort strictly after the cursor.
+ * Unlike a row cursor, this still works when the cursor review has since
+ * been deleted or hidden.
+ */
+export function reviewsAfterCursor(
+  cursor: ReviewCursor
+): Prisma.ReviewWhereInput {
+  return afterCreatedDateCursor(cursor);
+}
+
+/**
+ * Position of a help wanted post in a user's post listing
+ * (created_date DESC, id DESC)
+ */
+export type HelpWantedPostCursor = CreatedDateCursor;
+
+/**
+ * Encode a help wanted post's sort key as an opaque, URL-safe cursor
+ */
+export function encodeHelpWantedPostCursor(post: HelpWantedPostCursor): string {
+  return encodeCreatedDateCursor(post);
+}
+
+/**
+ * Decode a cursor produced by encodeHelpWantedPostCursor.
+ * Returns null for anything malformed.
+ */
+export function decodeHelpWantedPostCursor(
+  value: string
+): HelpWantedPostCursor | null {
+  return decodeCreatedDateCursor(value);
+}
+
+/**
+ * Build a filter matching help wanted posts that sort strictly after the
+ * cursor. This still works when the cursor post has since been deleted.
+ */
+export function helpWantedPostsAfterCursor(
+  cursor: HelpWantedPostCursor
+): Prisma.HelpWantedPostWhereInput {
+  return afterCreatedDateCursor(cursor);
+}
@@ -0,0 +1,76 @@
+import { describe, it, expect } from "vitest";
+import { NextRequest } from "next/server";
+import { computeEtag, etagMatches, jsonWithEtag } from "./etag";
+
+function createRequest(ifNoneMatch?: string) {
+  return new NextRequest("http://localhost:3000/api/cards/1", {
+    headers: ifNoneMatch ? { "If-None-Match": ifNoneMatch } : {},
+  });
+}
+
+describe("etag utilities", () => {
+  describe("computeEtag", () => {
+    it("should return the same quoted tag for the same body", () => {
+      const etag = computeEtag('{"id":1}');
+
+      expect(etag).toMatch(/^".+"$/);
+      expect(computeEtag('{"id":1}')).toBe(etag);
+      expect(computeEtag('{"id":2}')).not.toBe(etag);
+    });
+  });
+
+  describe("etagMatches", () => {
+    const etag = computeEtag("body");
+
+    it("should not match without a header", () => {
+      expect(etagMatches(null, etag)).toBe(false);
+    });
+
+    it("should match exact, weak, listed and wildcard validators", () => {
+      expect(etagMatches(etag, etag)).toBe(true);
+      expect(etagMatches(`W/${etag}`, etag)).toBe(true);
+      expect(etagMatches(`"other", ${etag}`, etag)).toBe(true);
+      expect(etagMatches("*", etag)).toBe(true);
+    });
+
+    it("should not match a different tag", () => {
+      expect(etagMatches('"other"', etag)).toBe(false);
+    });
+  });
+
+  describe("jsonWithEtag", () => {
+    const data = { id: 1, name: "Test Business" };
+
+    it("should return the JSON body with ETag and Cache-Control", async () => {
+      const response = jsonWithEtag(
+        createRequest(),
+        data,
+        "public, max-age=300"
+      );
+
+      expect(response.status).toBe(200);
+      expect(response.headers.get("ETag")).toBe(
+        computeEtag(JSON.stringify(data))
+      );
+      expect(response.headers.get("Cache-Control")).toBe("public, max-age=300");
+      expect(response.headers.get("Content-Type")).toContain(
+        "application/json"
+      );
+      expect(await response.json()).toEqual(data);
+    });
+
+    it("should return an empty 304 when If-None-Match matches", async () => {
+      const etag = computeEtag(JSON.stringify(data));
+
+      const response = jsonWithEtag(
+        createRequest(etag),
+        data,
+        "public, max-age=300"
+      );
+
+      expect(response.status).toBe(304);
+      expect(response.headers.get("ETag")).toBe(etag);
+      expect(await response.text()).toBe("");
+    });
+  });
+});
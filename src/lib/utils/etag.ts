@@ -0,0 +1,59 @@
+import { createHash } from "crypto";
+import { NextRequest, NextResponse } from "next/server";
+
+/**
+ * Build a strong ETag from a serialized response body
+ */
+export function computeEtag(body: string): string {
+  return `"${createHash("sha1").update(body).digest("base64url")}"`;
+}
+
+/**
+ * Check whether an If-None-Match header matches the given ETag.
+ * Handles comma-separated lists, weak validators and "*".
+ */
+export function etagMatches(
+  ifNoneMatch: string | null,
+  etag: string
+): boolean {
+  if (!ifNoneMatch) {
+    return false;
+  }
+
+  return ifNoneMatch.split(",").some((candidate) => {
+    const tag = candidate.trim().replace(/^W\//, "");
+    return tag === "*" || tag === etag;
+  });
+}
+
+/**
+ * Create a JSON response carrying an ETag, or an empty 304 Not Modified
+ * when the client already holds the same representation.
+ *
+ * Usage:
+ * return jsonWithEtag(request, data, "public, max-age=300");
+ */
+export function jsonWithEtag(
+  request: NextRequest,
+  data: unknown,
+  cacheControl: string
+): NextResponse {
+  const body = JSON.stringify(data);
+  const etag = computeEtag(body);
+
+  if (etagMatches(request.headers.get("if-none-match"), etag)) {
+    return new NextResponse(null, {
+      status: 304,
+      headers: { ETag: etag, "Cache-Control": cacheControl },
+    });
+  }
+
+  return new NextResponse(body, {
+    status: 200,
+    headers: {
+      "Content-Type": "application/json",
+      ETag: etag,
+      "Cache-Control": cacheControl,
+    },
+  });
+}
@@ -1,5 +1,9 @@
 import { describe, test, expect, beforeEach, vi, afterEach } from "vitest";
-import { checkRateLimit, createRateLimitResponse } from "./rateLimit";
+import {
+  checkRateLimit,
+  cleanupExpiredRateLimits,
+  createRateLimitResponse,
+} from "./rateLimit";
 
 describe("rateLimit utilities", () => {
   // Mock Date.now for consistent testing
@@ -109,6 +113,23 @@ describe("rateLimit utilities", () => {
     });
   });
 
+  describe("cleanupExpiredRateLimits", () => {
+    test("should drop expired windows and keep active ones", () => {
+      // Exhaust a limit, then let its window end
+      checkRateLimit(20, "cleanup-action", 1);
+      expect(checkRateLimit(20, "cleanup-action", 1)).toBe(false);
+      vi.advanceTimersByTime(60 * 60 * 1000 + 1);
+      checkRateLimit(21, "cleanup-active", 1);
+
+      expect(cleanupExpiredRateLimits()).toBeGreaterThanOrEqual(1);
+
+      // Still-active window is untouched
+      expect(checkRateLimit(21, "cleanup-active", 1)).toBe(false);
+      // Expired window starts fresh
+      expect(checkRateLimit(20, "cleanup-action", 1)).toBe(true);
+    });
+  });
+
   describe("createRateLimitResponse", () => {
     test("should create proper error response structure", () => {
       const response = createRateLimitResponse("5 posts per hour");
@@ -1,6 +1,28 @@
 // Rate limiting storage (in-memory for now)
 const rateLimitStore = new Map<string, { count: number; resetTime: number }>();
 
+/**
+ * Remove entries whose window has already ended
+ * Called periodically so users who stop posting don't stay in memory
+ */
+export function cleanupExpiredRateLimits(now: number = Date.now()): number {
+  let deletedCount = 0;
+
+  for (const [key, entry] of rateLimitStore.entries()) {
+    if (now >= entry.resetTime) {
+      rateLimitStore.delete(key);
+      deletedCount++;
+    }
+  }
+
+  return deletedCount;
+}
+
+// Run cleanup every 30 minutes (server-side only)
+if (typeof window === "undefined") {
+  setInterval(cleanupExpiredRateLimits, 30 * 60 * 1000);
+}
+
 /**
  * Check if a user is within rate limit
  * @param userId User ID
@@ -1,5 +1,5 @@
 import { describe, test, expect } from "vitest";
-import { generateSlug } from "./slugs";
+import { generateSlug, slugCandidates } from "./slugs";
 
 describe("generateSlug", () => {
   test("should convert text to lowercase", () => {
@@ -50,6 +50,8 @@ describe("generateSlug", () => {
     );
     expect(generateSlug("  --  Test  --  ")).toBe("test");
     expect(generateSlug("Forum Category (2024)")).toBe("forum-category-2024");
+    expect(generateSlug("Fish - & - Chips")).toBe("fish-chips");
+    expect(generateSlug("Tips &- Tricks !")).toBe("tips-tricks");
   });
 
   test("should handle unicode characters", () => {
@@ -63,3 +65,20 @@ describe("generateSlug", () => {
     expect(result).toBe("a".repeat(100) + "-" + "b".repeat(100));
   });
 });
+
+describe("slugCandidates", () => {
+  test("should start with the base slug", () => {
+    expect(slugCandidates("my-thread", 0, 3)).toEqual([
+      "my-thread",
+      "my-thread-1",
+      "my-thread-2",
+    ]);
+  });
+
+  test("should continue numbering from a later start", () => {
+    expect(slugCandidates("my-thread", 3, 2)).toEqual([
+      "my-thread-3",
+      "my-thread-4",
+    ]);
+  });
+});
@@ -1,17 +1,35 @@
+// Compiled once at module load and shared by every slug generation.
+// One alternation handles both rewrite rules in a single scan: a run of
+// spaces/hyphens (with any characters that get dropped in between) becomes
+// one hyphen, and any other run of non-word characters is dropped.
+const SLUG_REWRITE_REGEX = /([-\s]+(?:[^\w\s-]+[-\s]+)*)|[^\w\s-]+/g;
+const SLUG_EDGE_HYPHENS_REGEX = /^-+|-+$/g;
+
 /**
  * Generate a URL-friendly slug from text
  * Based on the Flask backend helper function
  */
 export function generateSlug(text: string): string {
-  // Convert to lowercase and remove non-word characters except spaces and hyphens
-  let slug = text
+  const slug = text
     .toLowerCase()
-    .replace(/[^\w\s-]/g, "")
-    .trim();
+    .replace(SLUG_REWRITE_REGEX, (_, separator?: string) =>
+      separator ? "-" : ""
+    );
 
-  // Replace multiple spaces or hyphens with single hyphen
-  slug = slug.replace(/[-\s]+/g, "-");
+  // Remove leading/trailing hyphens (including former edge whitespace)
+  return slug.replace(SLUG_EDGE_HYPHENS_REGEX, "");
+}
 
-  // Remove leading/trailing hyphens
-  return slug.replace(/^-+|-+$/g, "");
+/**
+ * Candidate slugs in the order they should be tried: the base slug itself,
+ * then base-1, base-2, ... Returns `count` candidates starting at `start`.
+ */
+export function slugCandidates(
+  baseSlug: string,
+  start: number,
+  count: number
+): string[] {
+  return Array.from({ length: count }, (_, i) =>
+    start + i === 0 ? baseSlug : `${baseSlug}-${start + i}`
+  );
 }
@@ -0,0 +1,32 @@
+import { describe, it, expect } from "vitest";
+import { stripTags } from "./strip-tags";
+
+describe("stripTags", () => {
+  it("should remove tags and keep their text", () => {
+    expect(stripTags("<b>Bold</b> and <i>italic</i>")).toBe("Bold and italic");
+    expect(stripTags('<script>alert("x")</script>Safe')).toBe(
+      'alert("x")Safe'
+    );
+  });
+
+  it("should decode basic entities", () => {
+    expect(stripTags("Tom &amp; Jerry &lt;3 &quot;quoted&quot; &#x27;s")).toBe(
+      'Tom & Jerry <3 "quoted" \'s'
+    );
+  });
+
+  it("should decode each entity only once", () => {
+    expect(stripTags("&amp;lt;b&amp;gt;")).toBe("&lt;b&gt;");
+    expect(stripTags("&amp;quot;")).toBe("&quot;");
+  });
+
+  it("should not strip tags produced by decoding", () => {
+    expect(stripTags("&lt;b&gt;text&lt;/b&gt;")).toBe("<b>text</b>");
+  });
+
+  it("should trim and handle empty input", () => {
+    expect(stripTags("  padded  ")).toBe("padded");
+    expect(stripTags("  a > b  ")).toBe("a > b");
+    expect(stripTags("")).toBe("");
+  });
+});
@@ -0,0 +1,33 @@
+/**
+ * Plain-text sanitization for user-supplied fields.
+ *
+ * Removes HTML tags and decodes the handful of entities browsers and form
+ * libraries commonly produce, in a single left-to-right pass over the
+ * input.
+ */
+
+// Matches either a tag or one of the supported entities, so both are
+// handled by the same scan
+const TAG_OR_ENTITY_REGEX = /<[^>]*>|&(?:lt|gt|amp|quot|#x27);/g;
+
+const ENTITY_REPLACEMENTS: Record<string, string> = {
+  "&lt;": "<",
+  "&gt;": ">",
+  "&amp;": "&",
+  "&quot;": '"',
+  "&#x27;": "'",
+};
+
+/**
+ * Strip HTML tags, decode basic entities and trim the result
+ */
+export function stripTags(value: string): string {
+  if (!value) return "";
+
+  // Names, emails and most free text contain neither, so skip the regex
+  if (!value.includes("<") && !value.includes("&")) return value.trim();
+
+  return value
+    .replace(TAG_OR_ENTITY_REGEX, (match) => ENTITY_REPLACEMENTS[match] ?? "")
+    .trim();
+}
@@ -0,0 +1,37 @@
+import { describe, it, expect } from "vitest";
+import { isValidEmailFormat } from "./email";
+
+describe("isValidEmailFormat", () => {
+  it("should accept ordinary addresses", () => {
+    expect(isValidEmailFormat("user@example.com")).toBe(true);
+    expect(isValidEmailFormat("first.last+tag@mail.example.co.uk")).toBe(true);
+    expect(isValidEmailFormat("a@b.c")).toBe(true);
+  });
+
+  it("should require exactly one @ with a non-empty local part", () => {
+    expect(isValidEmailFormat("userexample.com")).toBe(false);
+    expect(isValidEmailFormat("@example.com")).toBe(false);
+    expect(isValidEmailFormat("user@@example.com")).toBe(false);
+    expect(isValidEmailFormat("user@example.com@x.org")).toBe(false);
+  });
+
+  it("should require a dot inside the domain", () => {
+    expect(isValidEmailFormat("user@localhost")).toBe(false);
+    expect(isValidEmailFormat("user@.com")).toBe(false);
+    expect(isValidEmailFormat("user@example.")).toBe(false);
+  });
+
+  it("should reject whitespace anywhere", () => {
+    expect(isValidEmailFormat("us er@example.com")).toBe(false);
+    expect(isValidEmailFormat("user@example.com ")).toBe(false);
+    expect(isValidEmailFormat("user@exa\tmple.com")).toBe(false);
+  });
+
+  it("should reject long dotted domains without slowing down", () => {
+    const value = `a@${".".repeat(50000)} `;
+    const start = Date.now();
+
+    expect(isValidEmailFormat(value)).toBe(false);
+    expect(Date.now() - start).toBeLessThan(100);
+  });
+});
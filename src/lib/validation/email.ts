@@ -0,0 +1,28 @@
+/**
+ * Email address format check shared by the auth and submission validators.
+ *
+ * Accepts the same addresses as /^[^\s@]+@[^\s@]+\.[^\s@]+$/ (one "@", no
+ * whitespace, a dot inside the domain) but checks them with a fixed number
+ * of linear scans, so long inputs cannot trigger regex backtracking.
+ */
+
+const WHITESPACE_REGEX = /\s/;
+
+/**
+ * Check that a value looks like an email address
+ */
+export function isValidEmailFormat(value: string): boolean {
+  const at = value.indexOf("@");
+  if (at < 1 || value.indexOf("@", at + 1) !== -1) {
+    return false;
+  }
+
+  // The domain needs a dot with at least one character on either side
+  const domain = value.slice(at + 1);
+  const dot = domain.indexOf(".", 1);
+  if (dot === -1 || dot === domain.length - 1) {
+    return false;
+  }
+
+  return !WHITESPACE_REGEX.test(value);
+}
@@ -37,6 +37,10 @@ export interface ValidationResult<T = unknown> {
 function sanitizeString(value: string): string {
   if (!value) return "";
 
+  // Without a "<" there is no markup to remove and DOMPurify would return
+  // the input unchanged, so skip its per-call config parsing
+  if (!value.includes("<")) return value.trim();
+
   // Use DOMPurify to strip all HTML while preserving text content
   const clean = DOMPurify.sanitize(value, {
     ALLOWED_TAGS: [], // Remove all HTML tags
@@ -264,27 +268,27 @@ export interface ForumReportData {
   details?: string;
 }
 
+const FORUM_REPORT_REASONS = [
+  "spam",
+  "inappropriate",
+  "harassment",
+  "off_topic",
+  "other",
+];
+
 export function validateForumReport(
   data: ValidationInput
 ): ValidationResult<ForumReportData> {
   const errors: ValidationError[] = [];
   const sanitizedData: Partial<ForumReportData> = {};
 
-  const validReasons = [
-    "spam",
-    "inappropriate",
-    "harassment",
-    "off_topic",
-    "other",
-  ];
-
   // Required field: reason
   if (!data.reason || typeof data.reason !== "string") {
     errors.push({ field: "reason", message: "Reason is required" });
-  } else if (!validReasons.includes(data.reason)) {
+  } else if (!FORUM_REPORT_REASONS.includes(data.reason)) {
     errors.push({
       field: "reason",
-      message: `Invalid reason. Must be one of: ${validReasons.join(", ")}`,
+      message: `Invalid reason. Must be one of: ${FORUM_REPORT_REASONS.join(", ")}`,
     });
   } else {
     sanitizedData.reason = data.reason as ForumReportData["reason"];
@@ -4,6 +4,8 @@
  * This module provides comprehensive validation for review operations.
  */
 
+import { stripTags } from "@/lib/utils/strip-tags";
+
 // Validation functions accept dynamic input data that may have any structure
 /* eslint-disable @typescript-eslint/no-explicit-any */
 
@@ -23,23 +25,6 @@ export interface ValidationResult<T = unknown> {
   data: T | undefined;
 }
 
-/**
- * Sanitize HTML to prevent XSS attacks
- * Removes all HTML tags but preserves text content
- */
-function sanitizeString(value: string): string {
-  if (!value) return "";
-  // Remove HTML tags and preserve line breaks
-  return value
-    .replace(/<[^>]*>/g, "") // Remove HTML tags
-    .replace(/&lt;/g, "<") // Decode HTML entities
-    .replace(/&gt;/g, ">")
-    .replace(/&amp;/g, "&")
-    .replace(/&quot;/g, '"')
-    .replace(/&#x27;/g, "'")
-    .trim();
-}
-
 // Review validation
 export interface ReviewData {
   rating: number;
@@ -74,7 +59,7 @@ export function validateReview(
 
   // Optional field: title
   if (data.title && typeof data.title === "string") {
-    const title = sanitizeString(data.title);
+    const title = stripTags(data.title);
     if (title.length > 255) {
       errors.push({
         field: "title",
@@ -87,7 +72,7 @@ export function validateReview(
 
   // Optional field: comment
   if (data.comment && typeof data.comment === "string") {
-    const comment = sanitizeString(data.comment);
+    const comment = stripTags(data.comment);
     if (comment.length > 2000) {
       errors.push({
         field: "comment",
@@ -118,21 +103,27 @@ export interface ReviewReportData {
   details?: string;
 }
 
+const REVIEW_REPORT_REASONS = [
+  "spam",
+  "inappropriate",
+  "harassment",
+  "fake",
+  "other",
+];
+
 export function validateReviewReport(
   data: ValidationInput
 ): ValidationResult<ReviewReportData> {
   const errors: ValidationError[] = [];
   const sanitizedData: Partial<ReviewReportData> = {};
 
-  const validReasons = ["spam", "inappropriate", "harassment", "fake", "other"];
-
   // Required field: reason
   if (!data.reason || typeof data.reason !== "string") {
     errors.push({ field: "reason", message: "Reason is required" });
-  } else if (!validReasons.includes(data.reason)) {
+  } else if (!REVIEW_REPORT_REASONS.includes(data.reason)) {
     errors.push({
       field: "reason",
-      message: `Invalid reason. Must be one of: ${validReasons.join(", ")}`,
+      message: `Invalid reason. Must be one of: ${REVIEW_REPORT_REASONS.join(", ")}`,
     });
   } else {
     sanitizedData.reason = data.reason as ReviewReportData["reason"];
@@ -140,7 +131,7 @@ export function validateReviewReport(
 
   // Optional field: details
   if (data.details && typeof data.details === "string") {
-    const details = sanitizeString(data.details);
+    const details = stripTags(data.details);
     if (details.length > 1000) {
       errors.push({
         field: "details",
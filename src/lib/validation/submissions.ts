@@ -9,6 +9,9 @@
  * - Tags (format and length)
  */
 
+import { stripTags } from "@/lib/utils/strip-tags";
+import { isValidEmailFormat } from "@/lib/validation/email";
+
 // Validation functions accept dynamic input data that may have any structure
 /* eslint-disable @typescript-eslint/no-explicit-any */
 
@@ -17,6 +20,10 @@
 // and will be validated at runtime
 type ValidationInput = any;
 
+// Compiled once at module load and shared by every validation call.
+// Allow alphanumeric, spaces, hyphens, and common punctuation
+const TAG_NAME_REGEX = /^[\w\s\-.,&()]+$/u;
+
 export interface ValidationError {
   field: string;
   message: string;
@@ -28,23 +35,6 @@ export interface ValidationResult<T = CardSubmissionData> {
   data: T | undefined;
 }
 
-/**
- * Sanitize HTML to prevent XSS attacks
- * Removes all HTML tags but preserves text content
- */
-function sanitizeString(value: string): string {
-  if (!value) return "";
-  // Remove HTML tags and preserve line breaks
-  return value
-    .replace(/<[^>]*>/g, "") // Remove HTML tags
-    .replace(/&lt;/g, "<") // Decode HTML entities
-    .replace(/&gt;/g, ">")
-    .replace(/&amp;/g, "&")
-    .replace(/&quot;/g, '"')
-    .replace(/&#x27;/g, "'")
-    .trim();
-}
-
 /**
  * Validate phone number using basic patterns
  * Supports common formats: (508) 555-0123, +15085550123, 508-555-0123, etc.
@@ -101,8 +91,7 @@ function validateUrl(value: string): string | null {
 function validateEmail(value: string): string | null {
   if (!value) return null;
 
-  const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
-  if (!emailRegex.test(value)) {
+  if (!isValidEmailFormat(value)) {
     return "Invalid email address format";
   }
   return null;
@@ -118,9 +107,7 @@ function validateTagName(value: string): string | null {
     return "Tag name must not exceed 500 characters";
   }
 
-  // Allow alphanumeric, spaces, hyphens, and common punctuation
-  const tagRegex = /^[\w\s\-.,&()]+$/u;
-  if (!tagRegex.test(value)) {
+  if (!TAG_NAME_REGEX.test(value)) {
     return "Tag name can only contain letters, numbers, spaces, hyphens, and basic punctuation";
   }
 
@@ -178,12 +165,13 @@ export interface CardModificationData {
 }
 
 /**
- * Validate card submission data
- * Returns validation result with sanitized data if valid
+ * Validate and sanitize the card fields shared by submissions and
+ * modifications. Both use the same rules, so one field table serves both.
  */
-export function validateCardSubmission(
-  data: ValidationInput
-): ValidationResult<CardSubmissionData> {
+function validateCardFields(data: ValidationInput): {
+  errors: ValidationError[];
+  sanitizedData: Partial<CardSubmissionData>;
+} {
   const errors: ValidationError[] = [];
   const sanitizedData: Partial<CardSubmissionData> = {};
 
@@ -191,7 +179,7 @@ export function validateCardSubmission(
   if (!data.name || typeof data.name !== "string") {
     errors.push({ field: "name", message: "Name is required" });
   } else {
-    const name = sanitizeString(data.name);
+    const name = stripTags(data.name);
     if (name.length === 0) {
       errors.push({ field: "name", message: "Name cannot be empty" });
     } else if (name.length > 255) {
@@ -206,7 +194,7 @@ export function validateCardSubmission(
 
   // Optional field: description
   if (data.description && typeof data.description === "string") {
-    const description = sanitizeString(data.description);
+    const description = stripTags(data.description);
     if (description.length > 5000) {
       errors.push({
         field: "description",
@@ -249,7 +237,7 @@ export function validateCardSubmission(
 
   // Optional field: address
   if (data.address && typeof data.address === "string") {
-    const address = sanitizeString(data.address);
+    const address = stripTags(data.address);
     if (address.length > 500) {
       errors.push({
         field: "address",
@@ -272,7 +260,7 @@ export function validateCardSubmission(
 
   // Optional field: contactName
   if (data.contactName && typeof data.contactName === "string") {
-    const contactName = sanitizeString(data.contactName);
+    const contactName = stripTags(data.contactName);
     if (contactName.length > 100) {
       errors.push({
         field: "contactName",
@@ -295,7 +283,7 @@ export function validateCardSubmission(
 
   // Optional field: tagsText
   if (data.tagsText && typeof data.tagsText === "string") {
-    const tagsText = sanitizeString(data.tagsText);
+    const tagsText = stripTags(data.tagsText);
     const tagsError = validateTagsText(tagsText);
     if (tagsError) {
       errors.push({ field: "tagsText", message: tagsError });
@@ -304,6 +292,18 @@ export function validateCardSubmission(
     }
   }
 
+  return { errors, sanitizedData };
+}
+
+/**
+ * Validate card submission data
+ * Returns validation result with sanitized data if valid
+ */
+export function validateCardSubmission(
+  data: ValidationInput
+): ValidationResult<CardSubmissionData> {
+  const { errors, sanitizedData } = validateCardFields(data);
+
   return {
     isValid: errors.length === 0,
     errors,
@@ -320,125 +320,7 @@ export function validateCardSubmission(
 export function validateCardModification(
   data: ValidationInput
 ): ValidationResult<CardModificationData> {
-  const errors: ValidationError[] = [];
-  const sanitizedData: Partial<CardModificationData> = {};
-
-  // Required field: name (for modifications, we need to know what to change it TO)
-  if (!data.name || typeof data.name !== "string") {
-    errors.push({ field: "name", message: "Name is required" });
-  } else {
-    const name = sanitizeString(data.name);
-    if (name.length === 0) {
-      errors.push({ field: "name", message: "Name cannot be empty" });
-    } else if (name.length > 255) {
-      errors.push({
-        field: "name",
-        message: "Name must not exceed 255 characters",
-      });
-    } else {
-      sanitizedData.name = name;
-    }
-  }
-
-  // Optional field: description
-  if (data.description && typeof data.description === "string") {
-    const description = sanitizeString(data.description);
-    if (description.length > 5000) {
-      errors.push({
-        field: "description",
-        message: "Description must not exceed 5000 characters",
-      });
-    } else if (description) {
-      sanitizedData.description = description;
-    }
-  }
-
-  // Optional field: websiteUrl
-  if (data.websiteUrl && typeof data.websiteUrl === "string") {
-    const urlError = validateUrl(data.websiteUrl.trim());
-    if (urlError) {
-      errors.push({ field: "websiteUrl", message: urlError });
-    } else {
-      sanitizedData.websiteUrl = data.websiteUrl.trim();
-    }
-  }
-
-  // Optional field: phoneNumber
-  if (data.phoneNumber && typeof data.phoneNumber === "string") {
-    const phoneError = validatePhoneNumber(data.phoneNumber.trim());
-    if (phoneError) {
-      errors.push({ field: "phoneNumber", message: phoneError });
-    } else {
-      sanitizedData.phoneNumber = data.phoneNumber.trim();
-    }
-  }
-
-  // Optional field: email
-  if (data.email && typeof data.email === "string") {
-    const emailError = validateEmail(data.email.trim());
-    if (emailError) {
-      errors.push({ field: "email", message: emailError });
-    } else {
-      sanitizedData.email = data.email.trim();
-    }
-  }
-
-  // Optional field: address
-  if (data.address && typeof data.address === "string") {
-    const address = sanitizeString(data.address);
-    if (address.length > 500) {
-      errors.push({
-        field: "address",
-        message: "Address must not exceed 500 characters",
-      });
-    } else if (address) {
-      sanitizedData.address = address;
-    }
-  }
-
-  // Optional field: addressOverrideUrl
-  if (data.addressOverrideUrl && typeof data.addressOverrideUrl === "string") {
-    const urlError = validateUrl(data.addressOverrideUrl.trim());
-    if (urlError) {
-      errors.push({ field: "addressOverrideUrl", message: urlError });
-    } else {
-      sanitizedData.addressOverrideUrl = data.addressOverrideUrl.trim();
-    }
-  }
-
-  // Optional field: contactName
-  if (data.contactName && typeof data.contactName === "string") {
-    const contactName = sanitizeString(data.contactName);
-    if (contactName.length > 100) {
-      errors.push({
-        field: "contactName",
-        message: "Contact name must not exceed 100 characters",
-      });
-    } else if (contactName) {
-      sanitizedData.contactName = contactName;
-    }
-  }
-
-  // Optional field: imageUrl
-  if (data.imageUrl && typeof data.imageUrl === "string") {
-    const urlError = validateUrl(data.imageUrl.trim());
-    if (urlError) {
-      errors.push({ field: "imageUrl", message: urlError });
-    } else {
-      sanitizedData.imageUrl = data.imageUrl.trim();
-    }
-  }
-
-  // Optional field: tagsText
-  if (data.tagsText && typeof data.tagsText === "string") {
-    const tagsText = sanitizeString(data.tagsText);
-    const tagsError = validateTagsText(tagsText);
-    if (tagsError) {
-      errors.push({ field: "tagsText", message: tagsError });
-    } else if (tagsText) {
-      sanitizedData.tagsText = tagsText;
-    }
-  }
+  const { errors, sanitizedData } = validateCardFields(data);
 
   return {
     isValid: errors.length === 0,
@@ -0,0 +1,166 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+import { NextRequest } from "next/server";
+
+// Bypass authentication and CSRF; both are covered by their own tests
+vi.mock("@/lib/auth/middleware", () => ({
+  withAuth: (handler: (request: NextRequest, ...args: unknown[]) => unknown) =>
+    async (request: NextRequest, ...args: unknown[]) =>
+      handler(request, { user: { id: 1, role: "admin" } }, ...args),
+}));
+
+vi.mock("@/lib/auth/csrf", () => ({
+  withCsrfProtection: (
+    handler: (request: NextRequest, ...args: unknown[]) => unknown
+  ) => handler,
+}));
+
+vi.mock("@/lib/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    warn: vi.fn(),
+  },
+}));
+
+vi.mock("@/lib/db/client", () => ({
+  prisma: {
+    tag: { findMany: vi.fn() },
+    quickAccessItem: { findMany: vi.fn() },
+  },
+}));
+
+import { POST } from "@/app/api/admin/data/export/route";
+import { prisma } from "@/lib/db/client";
+
+function createExportRequest(body: unknown): NextRequest {
+  return new NextRequest("http://localhost/api/admin/data/export", {
+    method: "POST",
+    body: JSON.stringify(body),
+    headers: { "Content-Type": "application/json" },
+  });
+}
+
+describe("/api/admin/data/export", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it("should stream the same document as a buffered export", async () => {
+    const tags = [
+      { id: 1, name: "Technology", card_tags: [{ card_id: 3, tag_id: 1 }] },
+      { id: 2, name: "Business", card_tags: [] },
+    ];
+    vi.mocked(prisma.tag.findMany).mockResolvedValue(tags as never);
+    vi.mocked(prisma.quickAccessItem.findMany).mockResolvedValue([]);
+
+    const response = await POST(
+      createExportRequest({ include: ["Tag", "QuickAccessItem"] })
+    );
+
+    expect(response.status).toBe(200);
+    expect(response.headers.get("Content-Disposition")).toMatch(
+      /^attachment; filename="cityforge_export_.+\.json"$/
+    );
+    expect(await response.text()).toBe(
+      JSON.stringify({ Tag: tags, QuickAccessItem: [] })
+    );
+  });
+
+  it("should indent the document when pretty is requested", async () => {
+    const tags = [
+      { id: 1, name: "Technology", card_tags: [{ card_id: 3, tag_id: 1 }] },
+      { id: 2, name: "Business", card_tags: [] },
+    ];
+    vi.mocked(prisma.tag.findMany).mockResolvedValue(tags as never);
+    vi.mocked(prisma.quickAccessItem.findMany).mockResolvedValue([]);
+
+    const response = await POST(
+      createExportRequest({
+        include: ["Tag", "QuickAccessItem"],
+        pretty: true,
+      })
+    );
+
+    expect(await response.text()).toBe(
+      JSON.stringify({ Tag: tags, QuickAccessItem: [] }, null, 2)
+    );
+  });
+
+  it("should read tables in keyset batches", async () => {
+    const firstBatch = Array.from({ length: 1000 }, (_, i) => ({
+      id: i + 1,
+      name: `Tag ${i + 1}`,
+      card_tags: [],
+    }));
+    const secondBatch = [{ id: 1001, name: "Tag 1001", card_tags: [] }];
+    vi.mocked(prisma.tag.findMany)
+      .mockResolvedValueOnce(firstBatch as never)
+      .mockResolvedValueOnce(secondBatch as never);
+
+    const response = await POST(createExportRequest({ include: ["Tag"] }));
+    const data = JSON.parse(await response.text());
+
+    expect(data.Tag).toHaveLength(1001);
+    expect(prisma.tag.findMany).toHaveBeenCalledTimes(2);
+    expect(vi.mocked(prisma.tag.findMany).mock.calls[1][0]).toMatchObject({
+      where: { id: { gt: 1000 } },
+      orderBy: { id: "asc" },
+      take: 1000,
+    });
+  });
+
+  it("should stream JSON Lines when requested", async () => {
+    vi.mocked(prisma.tag.findMany).mockResolvedValue([
+      { id: 1, name: "Technology", card_tags: [] },
+    ] as never);
+
+    const response = await POST(
+      createExportRequest({ include: ["Tag"], format: "jsonl" })
+    );
+    const lines = (await response.text()).trim().split("\n");
+    const [metadata, row] = lines.map((line) => JSON.parse(line));
+
+    expect(response.headers.get("Content-Type")).toBe("application/x-ndjson");
+    expect(response.headers.get("Content-Disposition")).toMatch(/\.jsonl"$/);
+    expect(metadata).toMatchObject({
+      type: "metadata",
+      models: ["Tag"],
+    });
+    expect(row).toEqual({
+      type: "row",
+      model: "Tag",
+      data: { id: 1, name: "Technology", card_tags: [] },
+    });
+    expect(lines).toHaveLength(2);
+  });
+
+  it("should export a model listed twice only once", async () => {
+    vi.mocked(prisma.tag.findMany).mockResolvedValue([]);
+
+    const response = await POST(
+      createExportRequest({ include: ["Tag", "Tag"] })
+    );
+
+    expect(JSON.parse(await response.text())).toEqual({ Tag: [] });
+    expect(prisma.tag.findMany).toHaveBeenCalledTimes(1);
+  });
+
+  it("should reject unknown models before streaming", async () => {
+    const response = await POST(createExportRequest({ include: ["Nope"] }));
+    const data = await response.json();
+
+    expect(response.status).toBe(400);
+    expect(data.error.message).toBe("Invalid models: Nope");
+  });
+
+  it("should not treat object prototype keys as models", async () => {
+    const response = await POST(
+      createExportRequest({ include: ["constructor"] })
+    );
+    const data = await response.json();
+
+    expect(response.status).toBe(400);
+    expect(data.error.message).toBe("Invalid models: constructor");
+  });
+});
@@ -0,0 +1,66 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+import { NextRequest } from "next/server";
+
+// Bypass authentication; it is covered by its own tests
+vi.mock("@/lib/auth/middleware", () => ({
+  withAuth: (handler: (request: NextRequest, ...args: unknown[]) => unknown) =>
+    async (request: NextRequest, ...args: unknown[]) =>
+      handler(request, { user: { id: 1, role: "admin" } }, ...args),
+}));
+
+vi.mock("@/lib/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    warn: vi.fn(),
+  },
+}));
+
+vi.mock("@/lib/db/client", () => ({
+  prisma: {
+    $queryRaw: vi.fn(),
+  },
+}));
+
+import { GET } from "@/app/api/admin/data/models/route";
+import { prisma } from "@/lib/db/client";
+
+function createModelsRequest(): NextRequest {
+  return new NextRequest("http://localhost/api/admin/data/models");
+}
+
+describe("/api/admin/data/models", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it("should count every model in a single query", async () => {
+    vi.mocked(prisma.$queryRaw).mockResolvedValue([
+      { name: "Tag", count: 12 },
+      { name: "User", count: 3 },
+    ] as never);
+
+    const response = await GET(createModelsRequest());
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(prisma.$queryRaw).toHaveBeenCalledTimes(1);
+    expect(data.models).toHaveLength(22);
+    expect(data.models.slice(0, 3)).toEqual([
+      { name: "User", count: 3 },
+      { name: "Tag", count: 12 },
+      { name: "Card", count: 0 },
+    ]);
+  });
+
+  it("should return 500 when the count query fails", async () => {
+    vi.mocked(prisma.$queryRaw).mockRejectedValue(new Error("boom"));
+
+    const response = await GET(createModelsRequest());
+    const data = await response.json();
+
+    expect(response.status).toBe(500);
+    expect(data.error.message).toBe("Failed to fetch model information");
+  });
+});
@@ -0,0 +1,136 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+import { NextRequest } from "next/server";
+
+// Bypass authentication and CSRF; both are covered by their own tests
+vi.mock("@/lib/auth/middleware", () => ({
+  withAuth: (handler: (request: NextRequest, ...args: unknown[]) => unknown) =>
+    async (request: NextRequest, ...args: unknown[]) =>
+      handler(request, { user: { id: 1, role: "admin" } }, ...args),
+}));
+
+vi.mock("@/lib/auth/csrf", () => ({
+  withCsrfProtection: (
+    handler: (request: NextRequest, ...args: unknown[]) => unknown
+  ) => handler,
+}));
+
+vi.mock("@/lib/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    warn: vi.fn(),
+  },
+}));
+
+vi.mock("@/lib/db/client", () => ({
+  prisma: {
+    review: { update: vi.fn() },
+  },
+}));
+
+import { POST as dismissReport } from "@/app/api/admin/reviews/[id]/dismiss-report/route";
+import { POST as unhide } from "@/app/api/admin/reviews/[id]/unhide/route";
+import { prisma } from "@/lib/db/client";
+
+const routes = [
+  {
+    name: "dismiss-report",
+    handler: dismissReport,
+    message: "Review report dismissed",
+  },
+  {
+    name: "unhide",
+    handler: unhide,
+    message: "Review unhidden successfully",
+  },
+];
+
+function postTo(
+  route: (typeof routes)[number],
+  id: string
+): Promise<Response> {
+  const request = new NextRequest(
+    `http://localhost/api/admin/reviews/${id}/${route.name}`,
+    { method: "POST" }
+  );
+  return route.handler(request, { params: Promise.resolve({ id }) });
+}
+
+const clearedReview = {
+  id: 5,
+  cardId: 3,
+  userId: 2,
+  rating: 4,
+  title: "Solid",
+  comment: "Would come again",
+  reported: false,
+  reportedBy: null,
+  reportedDate: null,
+  reportedReason: null,
+  hidden: false,
+  createdDate: new Date("2024-03-01T12:00:00.000Z"),
+  updatedDate: new Date("2024-03-02T12:00:00.000Z"),
+};
+
+describe("POST /api/admin/reviews/[id]", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  for (const route of routes) {
+    describe(route.name, () => {
+      it("should clear the report and return the review", async () => {
+        vi.mocked(prisma.review.update).mockResolvedValue(
+          clearedReview as never
+        );
+
+        const response = await postTo(route, "5");
+        const data = await response.json();
+
+        expect(response.status).toBe(200);
+        expect(data).toEqual({
+          message: route.message,
+          review: {
+            id: 5,
+            card_id: 3,
+            user_id: 2,
+            rating: 4,
+            title: "Solid",
+            comment: "Would come again",
+            reported: false,
+            reported_by: null,
+            reported_reason: null,
+            created_date: "2024-03-01T12:00:00.000Z",
+            hidden: false,
+          },
+        });
+        expect(prisma.review.update).toHaveBeenCalledWith({
+          where: { id: 5 },
+          data: {
+            hidden: false,
+            reported: false,
+            reportedBy: null,
+            reportedDate: null,
+            reportedReason: null,
+          },
+        });
+      });
+
+      it("should return 404 for a missing review", async () => {
+        vi.mocked(prisma.review.update).mockRejectedValue({ code: "P2025" });
+
+        const response = await postTo(route, "404");
+
+        expect(response.status).toBe(404);
+      });
+
+      it("should reject an invalid review ID", async () => {
+        const response = await postTo(route, "abc");
+
+        expect(response.status).toBe(400);
+        expect(prisma.review.update).not.toHaveBeenCalled();
+      });
+    });
+  }
+});
@@ -0,0 +1,113 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+import { NextRequest } from "next/server";
+
+// Bypass authentication and CSRF; both are covered by their own tests
+vi.mock("@/lib/auth/middleware", () => ({
+  withAuth: (handler: (request: NextRequest, ...args: unknown[]) => unknown) =>
+    async (request: NextRequest, ...args: unknown[]) =>
+      handler(request, { user: { id: 2 } }, ...args),
+}));
+
+vi.mock("@/lib/auth/csrf", () => ({
+  withCsrfProtection: (
+    handler: (request: NextRequest, ...args: unknown[]) => unknown
+  ) => handler,
+}));
+
+vi.mock("@/lib/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    warn: vi.fn(),
+  },
+}));
+
+vi.mock("@/lib/db/queries", () => ({
+  cardQueries: { getCardSummary: vi.fn() },
+  reviewQueries: {
+    getCardReviews: vi.fn(),
+    getCardRatingStats: vi.fn(),
+    hasUserReviewedCard: vi.fn(),
+    createReview: vi.fn(),
+  },
+}));
+
+import { GET, POST } from "@/app/api/cards/[id]/reviews/route";
+import { cardQueries, reviewQueries } from "@/lib/db/queries";
+
+function createReviewsRequest(headers: Record<string, string> = {}) {
+  return new NextRequest("http://localhost/api/cards/3/reviews", { headers });
+}
+
+const context = { params: Promise.resolve({ id: "3" }) };
+
+describe("GET /api/cards/[id]/reviews", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.mocked(cardQueries.getCardSummary).mockResolvedValue({
+      id: 3,
+      name: "Test Business",
+    } as never);
+    vi.mocked(reviewQueries.getCardReviews).mockResolvedValue({
+      reviews: [],
+      hasMore: false,
+      nextCursor: null,
+    } as never);
+    vi.mocked(reviewQueries.getCardRatingStats).mockResolvedValue({
+      averageRating: null,
+      totalReviews: 0,
+      distribution: [0, 0, 0, 0, 0],
+    });
+  });
+
+  it("should return reviews with an ETag", async () => {
+    const response = await GET(createReviewsRequest(), context);
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(response.headers.get("ETag")).toBeTruthy();
+    expect(response.headers.get("Cache-Control")).toBe("public, max-age=60");
+    expect(data.summary.total_reviews).toBe(0);
+  });
+
+  it("should return 304 when the client holds the current reviews", async () => {
+    const first = await GET(createReviewsRequest(), context);
+    const etag = first.headers.get("ETag") as string;
+
+    const response = await GET(
+      createReviewsRequest({ "If-None-Match": etag }),
+      context
+    );
+
+    expect(response.status).toBe(304);
+    expect(await response.text()).toBe("");
+  });
+});
+
+describe("POST /api/cards/[id]/reviews", () => {
+  function createReviewRequest(body: unknown): NextRequest {
+    return new NextRequest("http://localhost/api/cards/3/reviews", {
+      method: "POST",
+      body: JSON.stringify(body),
+      headers: { "Content-Type": "application/json" },
+    });
+  }
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.mocked(cardQueries.getCardSummary).mockResolvedValue({
+      id: 3,
+      name: "Test Business",
+    } as never);
+  });
+
+  it("should reject a second review from the same user", async () => {
+    vi.mocked(reviewQueries.hasUserReviewedCard).mockResolvedValue(true);
+
+    const response = await POST(createReviewRequest({ rating: 5 }), context);
+
+    expect(response.status).toBe(409);
+    expect(reviewQueries.createReview).not.toHaveBeenCalled();
+  });
+});
@@ -9,6 +9,7 @@ import {
 } from "vitest";
 import { GET as cardsListRoute } from "@/app/api/cards/route";
 import { GET as cardDetailsRoute } from "@/app/api/cards/[id]/route";
+import { GET as cardReviewsRoute } from "@/app/api/cards/[id]/reviews/route";
 import { POST as suggestEditRoute } from "@/app/api/cards/[id]/suggest-edit/route";
 import { PAGINATION_LIMITS } from "@/lib/constants/pagination";
 import {
@@ -131,6 +132,56 @@ describe("Cards API Routes", () => {
       });
     });
 
+    it("should normalize tag filters before matching", async () => {
+      const testUser = await createUniqueTestUser();
+
+      await createTestCardInDb({
+        name: "Restaurant",
+        tags: ["restaurant"],
+        userId: testUser.id,
+      });
+
+      await createTestCardInDb({
+        name: "Store",
+        tags: ["retail"],
+        userId: testUser.id,
+      });
+
+      // Padded, differently cased and duplicated tags collapse to one filter
+      const request = createTestRequest(
+        "http://localhost:3000/api/cards?tags=%20Restaurant%20&tags=restaurant&tags=%20"
+      );
+      const response = await cardsListRoute(request);
+
+      await assertApiResponse(response, 200, (data) => {
+        expect(data.cards).toHaveLength(1);
+        expect(data.cards[0].name).toBe("Restaurant");
+      });
+    });
+
+    it("should reject more tag filters than the cap", async () => {
+      const max = PAGINATION_LIMITS.CARDS_MAX_TAG_FILTERS;
+      const tagsQuery = (count: number) =>
+        Array.from({ length: count }, (_, i) => `tags=tag${i}`).join("&");
+
+      // Repeats of the same tag count once towards the cap
+      const atCapResponse = await cardsListRoute(
+        createTestRequest(
+          `http://localhost:3000/api/cards?${tagsQuery(max)}&tags=TAG0`
+        )
+      );
+      await assertApiResponse(atCapResponse, 200);
+
+      const overCapResponse = await cardsListRoute(
+        createTestRequest(
+          `http://localhost:3000/api/cards?${tagsQuery(max + 1)}`
+        )
+      );
+      await assertApiResponse(overCapResponse, 400, (data) => {
+        expect(data.error).toBe(`Too many tag filters (max ${max})`);
+      });
+    });
+
     it("should support pagination", async () => {
       // Create test user and multiple cards
       const testUser = await createUniqueTestUser();
@@ -155,6 +206,55 @@ describe("Cards API Routes", () => {
       });
     });
 
+    it("should page through cards with a cursor", async () => {
+      const user = await createUniqueTestUser();
+
+      for (const [name, featured] of [
+        ["Alpha", false],
+        ["Bravo", true],
+        ["Charlie", false],
+        ["Delta", true],
+        ["Echo", false],
+      ] as const) {
+        await prisma.card.create({
+          data: { name, featured, approved: true, createdBy: user.id },
+        });
+      }
+
+      const names: string[] = [];
+      let url = "http://localhost:3000/api/cards?limit=2";
+      for (let page = 0; page < 3; page++) {
+        const response = await cardsListRoute(createTestRequest(url));
+        expect(response.status).toBe(200);
+        const data = await response.json();
+        names.push(...data.cards.map((card: Card) => card.name));
+
+        const link = response.headers.get("Link");
+        if (page < 2) {
+          expect(data.next_cursor).toBeTruthy();
+          expect(link).toContain(`after=${data.next_cursor}`);
+          url = `http://localhost:3000/api/cards?limit=2&after=${data.next_cursor}`;
+        } else {
+          expect(data.next_cursor).toBeNull();
+          expect(link).toBeNull();
+        }
+        if (page > 0) {
+          expect(data.total).toBeUndefined();
+        }
+      }
+
+      expect(names).toEqual(["Bravo", "Delta", "Alpha", "Charlie", "Echo"]);
+    });
+
+    it("should reject a malformed cursor", async () => {
+      const request = createTestRequest(
+        "http://localhost:3000/api/cards?after=not-a-cursor"
+      );
+      const response = await cardsListRoute(request);
+
+      expect(response.status).toBe(400);
+    });
+
     it("should return empty array when no cards exist", async () => {
       const request = createTestRequest("http://localhost:3000/api/cards");
       const response = await cardsListRoute(request);
@@ -812,6 +912,32 @@ describe("Cards API Routes", () => {
       });
     });
 
+    it("should return 304 when the card is unchanged", async () => {
+      const testUser = await createUniqueTestUser();
+      const card = await createTestCardInDb({
+        name: "Conditional Card",
+        userId: testUser.id,
+      });
+      const context = { params: Promise.resolve({ id: card.id.toString() }) };
+
+      const first = await cardDetailsRoute(
+        createTestRequest(`http://localhost:3000/api/cards/${card.id}`),
+        context
+      );
+      const etag = first.headers.get("ETag");
+      expect(first.status).toBe(200);
+      expect(etag).toBeTruthy();
+
+      const second = await cardDetailsRoute(
+        createTestRequest(`http://localhost:3000/api/cards/${card.id}`, {
+          headers: { "If-None-Match": etag! },
+        }),
+        { params: Promise.resolve({ id: card.id.toString() }) }
+      );
+      expect(second.status).toBe(304);
+      expect(second.headers.get("ETag")).toBe(etag);
+    });
+
     it("should return 404 for non-existent card", async () => {
       const request = createTestRequest(
         "http://localhost:3000/api/cards/99999"
@@ -840,6 +966,51 @@ describe("Cards API Routes", () => {
     });
   });
 
+  describe("GET /api/cards/[id]/reviews", () => {
+    it("should page through reviews created in the same millisecond", async () => {
+      const user = await createUniqueTestUser();
+      const card = await createTestCardInDb({
+        name: "Busy Business",
+        userId: user.id,
+      });
+      const context = { params: Promise.resolve({ id: card.id.toString() }) };
+
+      // Both land in the same millisecond, as concurrent inserts stamped by
+      // CURRENT_TIMESTAMP would
+      await prisma.$executeRaw`
+        INSERT INTO "reviews"
+          ("card_id", "user_id", "rating", "comment", "created_date")
+        VALUES
+          (${card.id}, ${user.id}, 5, 'First', '2024-03-01 12:00:00.123123'),
+          (${card.id}, ${user.id}, 4, 'Second', '2024-03-01 12:00:00.123321')
+      `;
+
+      const firstPage = await cardReviewsRoute(
+        createTestRequest(
+          `http://localhost:3000/api/cards/${card.id}/reviews?limit=1`
+        ),
+        context
+      );
+      let nextCursor = "";
+      await assertApiResponse(firstPage, 200, (data) => {
+        expect(data.reviews).toHaveLength(1);
+        expect(data.reviews[0].comment).toBe("Second");
+        nextCursor = data.pagination.next_cursor;
+      });
+
+      const secondPage = await cardReviewsRoute(
+        createTestRequest(
+          `http://localhost:3000/api/cards/${card.id}/reviews?limit=1&after=${nextCursor}`
+        ),
+        context
+      );
+      await assertApiResponse(secondPage, 200, (data) => {
+        expect(data.reviews).toHaveLength(1);
+        expect(data.reviews[0].comment).toBe("First");
+      });
+    });
+  });
+
   describe("POST /api/cards/[id]/suggest-edit", () => {
     it("should create edit suggestion from authenticated user", async () => {
       const testUser = await createUniqueTestUser();
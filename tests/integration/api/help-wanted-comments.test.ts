@@ -0,0 +1,119 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+import { NextRequest } from "next/server";
+
+// Bypass authentication and CSRF; both are covered by their own tests
+vi.mock("@/lib/auth/middleware", () => ({
+  withAuth: (handler: (request: NextRequest, ...args: unknown[]) => unknown) =>
+    async (request: NextRequest, ...args: unknown[]) =>
+      handler(
+        request,
+        { user: { id: 2, firstName: "Regular", lastName: "User" } },
+        ...args
+      ),
+}));
+
+vi.mock("@/lib/auth/csrf", () => ({
+  withCsrfProtection: (
+    handler: (request: NextRequest, ...args: unknown[]) => unknown
+  ) => handler,
+}));
+
+vi.mock("@/lib/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    warn: vi.fn(),
+  },
+}));
+
+vi.mock("@/lib/db/client", () => ({
+  prisma: {
+    helpWantedPost: { findUnique: vi.fn() },
+    helpWantedComment: { findUnique: vi.fn(), create: vi.fn() },
+  },
+}));
+
+import { POST } from "@/app/api/help-wanted/[id]/comments/route";
+import { prisma } from "@/lib/db/client";
+
+function createCommentRequest(body: unknown): NextRequest {
+  return new NextRequest("http://localhost/api/help-wanted/5/comments", {
+    method: "POST",
+    body: JSON.stringify(body),
+    headers: { "Content-Type": "application/json" },
+  });
+}
+
+const context = { params: Promise.resolve({ id: "5" }) };
+
+describe("POST /api/help-wanted/[id]/comments", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it("should create a reply using the session user as creator", async () => {
+    vi.mocked(prisma.helpWantedPost.findUnique).mockResolvedValue({
+      id: 5,
+    } as never);
+    vi.mocked(prisma.helpWantedComment.findUnique).mockResolvedValue({
+      postId: 5,
+    } as never);
+    vi.mocked(prisma.helpWantedComment.create).mockResolvedValue({
+      id: 9,
+      postId: 5,
+      content: "Happy to help",
+      parentId: 3,
+      createdBy: 2,
+      createdDate: new Date("2024-01-01T00:00:00.000Z"),
+      updatedDate: new Date("2024-01-01T00:00:00.000Z"),
+    } as never);
+
+    const response = await POST(
+      createCommentRequest({ content: "Happy to help", parent_id: 3 }),
+      context
+    );
+    const data = await response.json();
+
+    expect(response.status).toBe(201);
+    expect(data.creator).toEqual({
+      id: 2,
+      first_name: "Regular",
+      last_name: "User",
+    });
+    expect(prisma.helpWantedComment.create).toHaveBeenCalledWith({
+      data: { postId: 5, content: "Happy to help", parentId: 3, createdBy: 2 },
+    });
+  });
+
+  it("should reject a parent comment from another post", async () => {
+    vi.mocked(prisma.helpWantedPost.findUnique).mockResolvedValue({
+      id: 5,
+    } as never);
+    vi.mocked(prisma.helpWantedComment.findUnique).mockResolvedValue({
+      postId: 6,
+    } as never);
+
+    const response = await POST(
+      createCommentRequest({ content: "Reply", parent_id: 3 }),
+      context
+    );
+    const data = await response.json();
+
+    expect(response.status).toBe(400);
+    expect(data.error.message).toBe("Invalid parent comment");
+    expect(prisma.helpWantedComment.create).not.toHaveBeenCalled();
+  });
+
+  it("should return 404 when the post does not exist", async () => {
+    vi.mocked(prisma.helpWantedPost.findUnique).mockResolvedValue(null);
+
+    const response = await POST(
+      createCommentRequest({ content: "Hello" }),
+      context
+    );
+
+    expect(response.status).toBe(404);
+    expect(prisma.helpWantedComment.findUnique).not.toHaveBeenCalled();
+  });
+});
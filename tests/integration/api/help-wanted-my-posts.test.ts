@@ -0,0 +1,129 @@
+import { describe, it, expect, beforeEach, vi } from "vitest";
+import { NextRequest } from "next/server";
+
+// Bypass authentication; it is covered by its own tests
+vi.mock("@/lib/auth/middleware", () => ({
+  withAuth: (handler: (request: NextRequest, ...args: unknown[]) => unknown) =>
+    async (request: NextRequest, ...args: unknown[]) =>
+      handler(request, { user: { id: 2 } }, ...args),
+}));
+
+vi.mock("@/lib/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    warn: vi.fn(),
+  },
+}));
+
+vi.mock("@/lib/db/client", () => ({
+  prisma: {
+    helpWantedPost: { findMany: vi.fn() },
+  },
+}));
+
+import { GET } from "@/app/api/help-wanted/my-posts/route";
+import { prisma } from "@/lib/db/client";
+import {
+  decodeHelpWantedPostCursor,
+  encodeHelpWantedPostCursor,
+} from "@/lib/utils/cursor";
+
+function createMyPostsRequest(query = ""): NextRequest {
+  return new NextRequest(`http://localhost/api/help-wanted/my-posts${query}`);
+}
+
+function mockPost(id: number) {
+  return {
+    id,
+    title: `Post ${id}`,
+    description: "Need a hand",
+    category: "general",
+    status: "open",
+    location: null,
+    budget: null,
+    contactPreference: null,
+    createdDate: new Date("2024-01-01T00:00:00.000Z"),
+    updatedDate: new Date("2024-01-01T00:00:00.000Z"),
+    creator: { id: 2, firstName: "Regular", lastName: "User", email: "u@x" },
+    _count: { comments: 0, reports: 0 },
+  };
+}
+
+describe("GET /api/help-wanted/my-posts", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it("should return every post as an array without a limit", async () => {
+    vi.mocked(prisma.helpWantedPost.findMany).mockResolvedValue([
+      mockPost(2),
+      mockPost(1),
+    ] as never);
+
+    const response = await GET(createMyPostsRequest());
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(data.map((post: { id: number }) => post.id)).toEqual([2, 1]);
+    const [args] = vi.mocked(prisma.helpWantedPost.findMany).mock.calls[0];
+    expect(args).not.toHaveProperty("take");
+    expect(args).not.toHaveProperty("cursor");
+  });
+
+  it("should return a page with a cursor for the next one", async () => {
+    vi.mocked(prisma.helpWantedPost.findMany).mockResolvedValue([
+      mockPost(9),
+      mockPost(8),
+    ] as never);
+    const createdDate = new Date("2024-01-02T00:00:00.000Z");
+    const after = encodeHelpWantedPostCursor({ createdDate, id: 10 });
+
+    const response = await GET(createMyPostsRequest(`?limit=2&after=${after}`));
+    const data = await response.json();
+
+    expect(response.status).toBe(200);
+    expect(data.posts).toHaveLength(2);
+    expect(decodeHelpWantedPostCursor(data.next_cursor)).toEqual({
+      createdDate: new Date("2024-01-01T00:00:00.000Z"),
+      id: 8,
+    });
+    const [args] = vi.mocked(prisma.helpWantedPost.findMany).mock.calls[0];
+    expect(args).toMatchObject({
+      where: {
+        createdBy: 2,
+        OR: [
+          { createdDate: { lt: createdDate } },
+          { createdDate, id: { lt: 10 } },
+        ],
+      },
+      orderBy: [{ createdDate: "desc" }, { id: "desc" }],
+      take: 2,
+    });
+    expect(args).not.toHaveProperty("cursor");
+    expect(args).not.toHaveProperty("skip");
+  });
+
+  it("should not hand out a cursor after the last page", async () => {
+    vi.mocked(prisma.helpWantedPost.findMany).mockResolvedValue([
+      mockPost(1),
+    ] as never);
+
+    const response = await GET(createMyPostsRequest("?limit=2"));
+    const data = await response.json();
+
+    expect(data.next_cursor).toBeNull();
+  });
+
+  it("should reject malformed cursors", async () => {
+    for (const after of ["abc", "10", "10abc", "1e9"]) {
+      const response = await GET(
+        createMyPostsRequest(`?limit=2&after=${after}`)
+      );
+
+      expect(response.status).toBe(400);
+    }
+    expect(prisma.helpWantedPost.findMany).not.toHaveBeenCalled();
+  });
+});
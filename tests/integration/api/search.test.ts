@@ -58,6 +58,9 @@ describe("Search API Routes", () => {
     // Mock the Client constructor to return our mock client
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     (Client as any).mockImplementation(() => mockClient);
+
+    // The route caches its client; drop it so each test builds a fresh one
+    globalThis.__opensearchClient = undefined;
   });
 
   afterAll(() => {
@@ -240,6 +243,7 @@ describe("Search API Routes", () => {
         expect(mockSearch).toHaveBeenCalledWith({
           index: "test-resources",
           body: {
+            _source: { excludes: ["content"] },
             query: {
               multi_match: {
                 query: "restaurant downtown",
@@ -255,8 +259,10 @@ describe("Search API Routes", () => {
                 content: { fragment_size: 300, number_of_fragments: 3 },
               },
             },
+            sort: [{ _score: "desc" }, { resource_id: "asc" }],
             from: 0,
             size: 20,
+            track_total_hits: 10000,
           },
         });
       });
@@ -311,11 +317,13 @@ describe("Search API Routes", () => {
         expect(data).toEqual({
           query: "nonexistent",
           total: 0,
+          total_relation: "eq",
           page: 1,
           size: 20,
           total_pages: 0,
           has_next: false,
           has_prev: false,
+          next_cursor: null,
           results: [],
         });
       });
@@ -332,7 +340,7 @@ describe("Search API Routes", () => {
                     title: "Test Restaurant",
                     description: "A great place to eat",
                     page_description: "Full page description",
-                    content: "Detailed content about the restaurant".repeat(50), // Long content
+                    content_preview: "Detailed content about the restaurant",
                     url: "https://example.com",
                     page_url: "https://example.com/about",
                     category: "Restaurant",
@@ -426,8 +434,9 @@ describe("Search API Routes", () => {
         });
       });
 
-      it("should truncate long content excerpts", async () => {
-        const longContent = "This is a very long content string. ".repeat(100); // > 800 chars
+      it("should use the stored content preview as is", async () => {
+        // Trimming is the indexer's job; the route must not cut it again
+        const preview = "This is a long content string. ".repeat(26) + "...";
 
         mockSearch.mockResolvedValue({
           body: {
@@ -438,7 +447,7 @@ describe("Search API Routes", () => {
                   _source: {
                     resource_id: 789,
                     title: "Long Content Business",
-                    content: longContent,
+                    content_preview: preview,
                   },
                   _score: 1.0,
                 },
@@ -454,8 +463,43 @@ describe("Search API Routes", () => {
         const data = await response.json();
 
         expect(response.status).toBe(200);
-        expect(data.results[0].content_excerpt).toHaveLength(803); // 800 + "..."
-        expect(data.results[0].content_excerpt).toMatch(/\.\.\.$/);
+        expect(data.results[0].content_excerpt).toBe(preview);
+      });
+
+      it("should fall back to content highlights without a stored preview", async () => {
+        mockSearch.mockResolvedValue({
+          body: {
+            hits: {
+              total: { value: 1 },
+              hits: [
+                {
+                  _source: {
+                    resource_id: 790,
+                    title: "Not Yet Reindexed",
+                  },
+                  _score: 1.0,
+                  highlight: {
+                    content: [
+                      "Fresh <em>bread</em> daily",
+                      "Whole grain <em>bread</em>",
+                    ],
+                  },
+                },
+              ],
+            },
+          },
+        });
+
+        const request = createTestRequest(
+          "http://localhost:3000/api/search?q=bread"
+        );
+        const response = await GET(request);
+        const data = await response.json();
+
+        expect(response.status).toBe(200);
+        expect(data.results[0].content_excerpt).toBe(
+          "Fresh bread daily ... Whole grain bread"
+        );
       });
 
       it("should fallback from page_description to description", async () => {
@@ -520,6 +564,93 @@ describe("Search API Routes", () => {
     });
 
     describe("Pagination Logic", () => {
+      it("should return a cursor when the page is full", async () => {
+        mockSearch.mockResolvedValue({
+          body: {
+            hits: {
+              total: { value: 5 },
+              hits: [
+                { _source: { resource_id: 1, title: "A" }, sort: [2.5, 1] },
+                { _source: { resource_id: 7, title: "B" }, sort: [1.5, 7] },
+              ],
+            },
+          },
+        });
+
+        const request = createTestRequest(
+          "http://localhost:3000/api/search?q=test&size=2"
+        );
+        const response = await GET(request);
+        const data = await response.json();
+
+        expect(response.status).toBe(200);
+        expect(data.next_cursor).toBe(
+          Buffer.from(JSON.stringify([1.5, 7])).toString("base64url")
+        );
+      });
+
+      it("should keep paging past a capped total", async () => {
+        mockSearch.mockResolvedValue({
+          body: {
+            hits: {
+              total: { value: 10000, relation: "gte" },
+              hits: [
+                { _source: { resource_id: 1, title: "A" }, sort: [2.5, 1] },
+                { _source: { resource_id: 7, title: "B" }, sort: [1.5, 7] },
+              ],
+            },
+          },
+        });
+
+        const request = createTestRequest(
+          "http://localhost:3000/api/search?q=test&page=5000&size=2"
+        );
+        const response = await GET(request);
+        const data = await response.json();
+
+        expect(response.status).toBe(200);
+        expect(data.total_relation).toBe("gte");
+        expect(data.total_pages).toBe(5000);
+        expect(data.has_next).toBe(true);
+      });
+
+      it("should continue from a cursor with search_after", async () => {
+        mockSearch.mockResolvedValue({
+          body: { hits: { total: { value: 5 }, hits: [] } },
+        });
+        const cursor = Buffer.from(JSON.stringify([1.5, 7])).toString(
+          "base64url"
+        );
+
+        const request = createTestRequest(
+          `http://localhost:3000/api/search?q=test&size=2&after=${cursor}`
+        );
+        const response = await GET(request);
+        const data = await response.json();
+
+        expect(response.status).toBe(200);
+        expect(data.next_cursor).toBeNull();
+        expect(data.has_next).toBe(false);
+        expect(mockSearch).toHaveBeenCalledWith({
+          index: "test-resources",
+          body: expect.objectContaining({ search_after: [1.5, 7], size: 2 }),
+        });
+        expect(mockSearch).toHaveBeenCalledWith({
+          index: "test-resources",
+          body: expect.not.objectContaining({ from: expect.anything() }),
+        });
+      });
+
+      it("should reject a malformed cursor", async () => {
+        const request = createTestRequest(
+          "http://localhost:3000/api/search?q=test&after=not-a-cursor"
+        );
+        const response = await GET(request);
+
+        expect(response.status).toBe(400);
+        expect(mockSearch).not.toHaveBeenCalled();
+      });
+
       it("should calculate pagination correctly for multiple pages", async () => {
         mockSearch.mockResolvedValue({
           body: {
@@ -620,6 +751,27 @@ describe("Search API Routes", () => {
     });
 
     describe("OpenSearch Client Configuration", () => {
+      const transportOptions = {
+        maxRetries: 2,
+        requestTimeout: 5000,
+        suggestCompression: true,
+        agent: { keepAlive: true, maxSockets: 25 },
+      };
+
+      it("should reuse the client across requests", async () => {
+        mockSearch.mockResolvedValue({
+          body: {
+            hits: { total: { value: 0 }, hits: [] },
+          },
+        });
+
+        await GET(createTestRequest("http://localhost:3000/api/search?q=a"));
+        await GET(createTestRequest("http://localhost:3000/api/search?q=b"));
+
+        expect(Client).toHaveBeenCalledTimes(1);
+        expect(mockSearch).toHaveBeenCalledTimes(2);
+      });
+
       it("should create HTTP client by default", async () => {
         vi.stubEnv("OPENSEARCH_USE_HTTPS", "");
 
@@ -636,6 +788,7 @@ describe("Search API Routes", () => {
 
         expect(Client).toHaveBeenCalledWith({
           node: "http://localhost:9200",
+          ...transportOptions,
         });
       });
 
@@ -656,6 +809,7 @@ describe("Search API Routes", () => {
 
         expect(Client).toHaveBeenCalledWith({
           node: "https://localhost:9200",
+          ...transportOptions,
           ssl: {
             rejectUnauthorized: true,
           },
@@ -682,6 +836,7 @@ describe("Search API Routes", () => {
 
         expect(Client).toHaveBeenCalledWith({
           node: "https://localhost:9200",
+          ...transportOptions,
           ssl: {
             // SECURITY NOTE: Intentionally disabled for development testing environment
             // This allows testing of HTTPS connections without certificate verification
@@ -711,6 +866,7 @@ describe("Search API Routes", () => {
 
         expect(Client).toHaveBeenCalledWith({
           node: "http://opensearch-service:9200", // Default values
+          ...transportOptions,
         });
 
         // Restore for other tests
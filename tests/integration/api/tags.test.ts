@@ -9,6 +9,7 @@ import {
 } from "vitest";
 import { GET as tagsRoute } from "@/app/api/tags/route";
 import { PAGINATION_LIMITS } from "@/lib/constants/pagination";
+import { apiCache } from "@/lib/cache";
 import {
   createTestRequest,
   assertApiResponse,
@@ -32,6 +33,8 @@ describe("Tags API Routes", () => {
   afterEach(async () => {
     // Clean database after each test to ensure isolation
     await cleanDatabase();
+    // Drop cached tag responses so the next test sees the clean database
+    apiCache.clear();
     // Clear any environment variable mocks
     vi.clearAllMocks();
   });
@@ -217,6 +220,27 @@ describe("Tags API Routes", () => {
       expect(response.headers.get("Cache-Control")).toBe("public, max-age=300");
     });
 
+    it("should serve repeat requests from the server-side cache", async () => {
+      await prisma.tag.create({ data: { name: "Cached" } });
+
+      const first = await tagsRoute(
+        createTestRequest("http://localhost:3000/api/tags")
+      );
+      expect(first.headers.get("X-Cache")).toBe("MISS");
+
+      // A tag added within the TTL is not visible until the entry expires
+      await prisma.tag.create({ data: { name: "Uncached" } });
+
+      const second = await tagsRoute(
+        createTestRequest("http://localhost:3000/api/tags")
+      );
+      expect(second.headers.get("X-Cache")).toBe("HIT");
+      expect(second.headers.get("Cache-Control")).toBe("public, max-age=300");
+      await assertApiResponse(second, 200, (data: Tag[]) => {
+        expect(data.map((tag) => tag.name)).toEqual(["Cached"]);
+      });
+    });
+
     it("should handle large datasets without performance issues", async () => {
       // Create tags in batches for better performance
       const batchSize = 25;
@@ -377,6 +377,7 @@ describe("POST /api/upload", () => {
         "test.js",
         "test.php",
         "test.svg", // SVG not in allowed list
+        "png", // No dot, so no extension at all
       ];
 
       for (const filename of disallowedTypes) {
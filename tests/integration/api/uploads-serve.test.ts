@@ -0,0 +1,101 @@
+import {
+  describe,
+  it,
+  expect,
+  beforeAll,
+  afterAll,
+  afterEach,
+  vi,
+} from "vitest";
+import { NextRequest } from "next/server";
+import { mkdtemp, rm, writeFile } from "fs/promises";
+import { tmpdir } from "os";
+import path from "path";
+
+vi.mock("@/lib/logger", () => ({
+  logger: {
+    info: vi.fn(),
+    error: vi.fn(),
+    debug: vi.fn(),
+    warn: vi.fn(),
+  },
+}));
+
+import { GET } from "@/app/api/uploads/[filename]/route";
+
+function serveUpload(filename: string, headers: Record<string, string> = {}) {
+  return GET(
+    new NextRequest(`http://localhost/api/uploads/${filename}`, { headers }),
+    { params: Promise.resolve({ filename }) }
+  );
+}
+
+describe("GET /api/uploads/[filename]", () => {
+  let uploadDir: string;
+
+  beforeAll(async () => {
+    uploadDir = await mkdtemp(path.join(tmpdir(), "cityforge-uploads-"));
+    await writeFile(path.join(uploadDir, "photo.png"), "png-bytes");
+    vi.stubEnv("UPLOAD_FOLDER", uploadDir);
+  });
+
+  afterEach(() => {
+    vi.stubEnv("UPLOAD_ACCEL_REDIRECT_PREFIX", "");
+  });
+
+  afterAll(async () => {
+    vi.unstubAllEnvs();
+    await rm(uploadDir, { recursive: true, force: true });
+  });
+
+  it("should stream the file with its length and type", async () => {
+    const response = await serveUpload("photo.png");
+
+    expect(response.status).toBe(200);
+    expect(response.headers.get("Content-Type")).toBe("image/png");
+    expect(response.headers.get("Content-Length")).toBe("9");
+    expect(response.headers.get("X-Accel-Redirect")).toBeNull();
+    expect(await response.text()).toBe("png-bytes");
+  });
+
+  it("should hand the transfer to nginx when accel-redirect is set", async () => {
+    vi.stubEnv("UPLOAD_ACCEL_REDIRECT_PREFIX", "/internal-uploads/");
+
+    const response = await serveUpload("photo.png");
+
+    expect(response.status).toBe(200);
+    expect(response.headers.get("X-Accel-Redirect")).toBe(
+      "/internal-uploads/photo.png"
+    );
+    expect(response.headers.get("Content-Type")).toBe("image/png");
+    expect(await response.text()).toBe("");
+  });
+
+  it("should serve uploads as immutable with a filename ETag", async () => {
+    const response = await serveUpload("photo.png");
+
+    expect(response.headers.get("Cache-Control")).toBe(
+      "public, max-age=31536000, immutable"
+    );
+    expect(response.headers.get("ETag")).toBe('"photo.png"');
+  });
+
+  it("should return 304 when the client already holds the file", async () => {
+    const response = await serveUpload("photo.png", {
+      "If-None-Match": '"photo.png"',
+    });
+
+    expect(response.status).toBe(304);
+    expect(response.headers.get("ETag")).toBe('"photo.png"');
+    expect(await response.text()).toBe("");
+  });
+
+  it("should return 404 for a missing file", async () => {
+    vi.stubEnv("UPLOAD_ACCEL_REDIRECT_PREFIX", "/internal-uploads");
+
+    const response = await serveUpload("missing.png");
+
+    expect(response.status).toBe(404);
+    expect(response.headers.get("X-Accel-Redirect")).toBeNull();
+  });
+});